@@ -0,0 +1,107 @@
+"""
+This module provides an Aho-Corasick automaton for matching many patterns at once.
+A trie of the patterns with failure links reports every pattern occurring in a text
+in a single pass over its characters.
+"""
+
+from collections import deque
+from typing import Dict, Iterable, Iterator, List
+
+
+class AhoCorasick:
+    """
+    An Aho-Corasick automaton over a list of string patterns.
+    
+    The patterns are stored in a trie of dicts from character to node. Each node's
+    failure link points to the node of its longest proper suffix that is also in the
+    trie, and each node lists the patterns ending there or at any node on its chain of
+    failure links, so a scan reports every match without backtracking. Patterns are
+    reported by their position in the input list; a pattern given twice is reported
+    under both positions, and the empty pattern matches every text.
+    
+    Space complexity is O(total length of the patterns) for the trie, plus the output
+    lists.
+    """
+    
+    def __init__(self, patterns: Iterable[str]) -> None:
+        """
+        Build the trie and its failure links.
+        
+        Args:
+            patterns: Strings to match
+            
+        Time Complexity: O(total length of the patterns) plus the output lists
+        """
+        self._goto: List[Dict[str, int]] = [{}]
+        self._ends: List[List[int]] = [[]]
+        for position, pattern in enumerate(patterns):
+            node = 0
+            for char in pattern:
+                child = self._goto[node].get(char)
+                if child is None:
+                    child = len(self._goto)
+                    self._goto[node][char] = child
+                    self._goto.append({})
+                    self._ends.append([])
+                node = child
+            self._ends[node].append(position)
+        
+        # breadth-first, so every failure link points to a node already finished
+        self._fail = [0] * len(self._goto)
+        self._outputs: List[List[int]] = [[] for _ in self._goto]
+        queue = deque(self._goto[0].values())
+        for node in queue:
+            self._outputs[node] = self._ends[node]
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                fail = self._fail[node]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                fail = self._goto[fail].get(char, 0)
+                self._fail[child] = fail
+                self._outputs[child] = self._ends[child] + self._outputs[fail]
+                queue.append(child)
+    
+    def occurrences(self, text: str) -> Iterator[int]:
+        """
+        Report the patterns occurring anywhere in a text.
+        
+        Args:
+            text: String to scan
+            
+        Yields:
+            int: Position of a pattern once for each place it ends in the text, with
+            empty patterns reported once up front
+            
+        Time Complexity: O(len(text) + number of matches)
+        """
+        goto, fail, outputs = self._goto, self._fail, self._outputs
+        yield from self._ends[0]
+        node = 0
+        for char in text:
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            yield from outputs[node]
+    
+    def prefixes(self, text: str) -> Iterator[int]:
+        """
+        Report the patterns that are prefixes of a text.
+        
+        Args:
+            text: String to scan
+            
+        Yields:
+            int: Position of each pattern the text starts with, shortest first
+            
+        Time Complexity: O(length of the longest matching prefix + number of matches)
+        """
+        goto, ends = self._goto, self._ends
+        yield from ends[0]
+        node = 0
+        for char in text:
+            node = goto[node].get(char)
+            if node is None:
+                return
+            yield from ends[node]
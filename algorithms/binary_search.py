@@ -2,7 +2,9 @@
 This module provides a binary search algorithm with O(log n) time complexity.
 """
 
-from typing import List
+from typing import Iterable, List, Optional
+
+import numpy as np
 
 
 class BinarySearch:
@@ -24,6 +26,8 @@ class BinarySearch:
         Space Complexity: O(1) for storing array reference
         """
         self.arr = arr
+        self._keys: Optional[np.ndarray] = None
+        self._keys_source: Optional[List[str]] = None  # list self._keys was built from
     
     def search(self, target: str) -> int:
         """
@@ -48,3 +52,60 @@ class BinarySearch:
             else:
                 right = mid - 1
         return -1
+    
+    def probe_count(self, target: str) -> int:
+        """
+        Count the array entries search compares against a target.
+        
+        Args:
+            target: String to search for
+            
+        Returns:
+            int: Number of probes search(target) makes, at most floor(log2 n) + 1
+        """
+        left, right = 0, len(self.arr) - 1
+        probes = 0
+        
+        while left <= right:
+            mid = left + (right - left) // 2
+            probes += 1
+            if self.arr[mid] == target:
+                break
+            elif self.arr[mid] < target:
+                left = mid + 1
+            else:
+                right = mid - 1
+        return probes
+    
+    def search_many(self, targets: Iterable[str]) -> np.ndarray:
+        """
+        Search for many target strings at once with np.searchsorted.
+        
+        The sorted array is wrapped in a NumPy object array that references the existing
+        strings, and all targets are bisected in a single vectorized call. The wrapper is
+        kept between calls and rebuilt when arr is replaced or its length changes, so
+        lists grown in place are picked up; replacing elements without changing the
+        length is not detected.
+        
+        Args:
+            targets: Strings to search for
+            
+        Returns:
+            np.ndarray: int64 array holding, for each target, the index of its leftmost
+            occurrence in the array, or -1 if not found
+            
+        Time Complexity: O(t log n) where t is the number of targets and n is the array length,
+        plus O(n) when the wrapper is rebuilt
+        """
+        if self._keys_source is not self.arr or len(self._keys) != len(self.arr):
+            self._keys = np.array(self.arr, dtype=object).reshape(-1)
+            self._keys_source = self.arr
+        keys = self._keys
+        wanted = np.array(list(targets), dtype=object).reshape(-1)
+        if len(keys) == 0:
+            return np.full(len(wanted), -1, dtype=np.int64)
+        
+        indexes = np.searchsorted(keys, wanted)
+        candidates = np.minimum(indexes, len(keys) - 1)
+        found = (indexes < len(keys)) & (keys[candidates] == wanted)
+        return np.where(found, indexes, -1).astype(np.int64)
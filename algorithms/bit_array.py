@@ -0,0 +1,118 @@
+"""
+This module provides bit array storage engines used by the Bloom filter implementations.
+A list-backed engine is kept as a readable reference, while the packed engine stores
+eight bits per byte for a much smaller, cache-friendly footprint.
+"""
+
+from typing import Dict, Optional, Type, Union
+
+
+class ListBitArray:
+    """
+    A reference bit array backed by a Python list holding one int per bit.
+    
+    Every bit costs a full list slot (a pointer), so this engine is simple to inspect
+    but uses roughly 64 times more memory than the packed engine.
+    """
+    
+    def __init__(self, size: int) -> None:
+        """
+        Initialize an all-zero bit array.
+        
+        Args:
+            size: Number of bits in the array
+            
+        Time Complexity: O(m) where m is size
+        Space Complexity: O(m) list slots
+        """
+        self.size = size
+        self.bits = [0] * size
+    
+    def set(self, index: int) -> None:
+        """Set the bit at index to 1."""
+        self.bits[index] = 1
+    
+    def get(self, index: int) -> int:
+        """Return the bit at index (0 or 1)."""
+        return self.bits[index]
+    
+    @property
+    def nbytes(self) -> int:
+        """Approximate number of bytes used by the list's slots."""
+        return self.size * 8
+    
+    def to_bytes(self) -> bytes:
+        """Return the bits packed in the same layout as PackedBitArray."""
+        packed = bytearray((self.size + 7) >> 3)
+        for index, bit in enumerate(self.bits):
+            if bit:
+                packed[index >> 3] |= 1 << (index & 7)
+        return bytes(packed)
+
+
+class PackedBitArray:
+    """
+    A packed bit array storing eight bits per byte in a bytearray.
+    
+    Bit i lives in byte i >> 3 under mask 1 << (i & 7), which is the little-endian
+    bit order used by numpy.packbits(..., bitorder='little').
+    """
+    
+    def __init__(self, size: int, buffer: Optional[memoryview] = None) -> None:
+        """
+        Initialize a packed bit array.
+        
+        Args:
+            size: Number of bits in the array
+            buffer: Existing packed bytes to use in place, e.g. a memory-mapped file;
+                a new all-zero bytearray is allocated if omitted
+                
+        Time Complexity: O(m / 8) where m is size, O(1) with a buffer
+        Space Complexity: O(m / 8) bytes, O(1) with a buffer
+        """
+        self.size = size
+        self.bits = bytearray((size + 7) >> 3) if buffer is None else buffer
+    
+    def set(self, index: int) -> None:
+        """Set the bit at index to 1."""
+        self.bits[index >> 3] |= 1 << (index & 7)
+    
+    def get(self, index: int) -> int:
+        """Return the bit at index (0 or 1)."""
+        return (self.bits[index >> 3] >> (index & 7)) & 1
+    
+    @property
+    def nbytes(self) -> int:
+        """Number of bytes used by the packed buffer."""
+        return len(self.bits)
+    
+    def to_bytes(self) -> bytes:
+        """Return the packed bits."""
+        return bytes(self.bits)
+
+
+BitArray = Union[ListBitArray, PackedBitArray]
+
+BIT_ARRAY_STORAGES: Dict[str, Type[BitArray]] = {
+    'list': ListBitArray,
+    'packed': PackedBitArray,
+}
+
+
+def make_bit_array(storage: str, size: int) -> BitArray:
+    """
+    Create a bit array using the named storage engine.
+    
+    Args:
+        storage: Storage engine name ('list' or 'packed')
+        size: Number of bits in the array
+        
+    Returns:
+        BitArray: A new all-zero bit array
+        
+    Raises:
+        ValueError: If storage is not a known engine name
+    """
+    if storage not in BIT_ARRAY_STORAGES:
+        raise ValueError(f"Unknown bit array storage '{storage}', expected one of {sorted(BIT_ARRAY_STORAGES)}")
+    return BIT_ARRAY_STORAGES[storage](size)
@@ -3,45 +3,241 @@ This module provides a Bloom filter implementation for probabilistic set members
 The Bloom filter offers constant-time lookups with a possibility of false positives but no false negatives.
 """
 
-from typing import List
+import math
+import struct
+from itertools import islice
+from typing import Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from .bit_array import PackedBitArray, make_bit_array
+from .hashing import hash64_many, hash_str
+from .serialization import map_file, write_file
+
+_MASK32 = 0xFFFFFFFF
+
+BUILD_CHUNK_SIZE = 65536
+
+BLOCK_BITS = 512  # one 64-byte cache line
+
+# size, hash_count, seed, count, capacity, false_positive_rate (NaN when unset)
+_HEADER = struct.Struct('<QIQQQd')
+
+
+def optimal_size(capacity: int, false_positive_rate: float) -> int:
+    """
+    Compute the optimal bit array size for a capacity and target false-positive rate.
+    
+    Args:
+        capacity: Number of items the filter is expected to hold
+        false_positive_rate: Target false-positive probability, strictly between 0 and 1
+        
+    Returns:
+        int: Number of bits m = ceil(-n * ln(p) / ln(2)^2)
+        
+    Raises:
+        ValueError: If false_positive_rate is not strictly between 0 and 1
+    """
+    if not 0 < false_positive_rate < 1:
+        raise ValueError("false_positive_rate must be strictly between 0 and 1")
+    return max(1, math.ceil(-max(1, capacity) * math.log(false_positive_rate) / (math.log(2) ** 2)))
+
+
+def optimal_hash_count(size: int, capacity: int) -> int:
+    """
+    Compute the optimal number of hash functions for a bit array size and capacity.
+    
+    Args:
+        size: Number of bits in the filter
+        capacity: Number of items the filter is expected to hold
+        
+    Returns:
+        int: Number of probes k = round(m / n * ln(2)), at least 1
+    """
+    return max(1, round(size / max(1, capacity) * math.log(2)))
+
+
+def filter_parameters(capacity: int, false_positive_rate: Optional[float]) -> Tuple[int, int]:
+    """
+    Choose the bit array size and number of probes for a filter.
+    
+    Args:
+        capacity: Number of items the filter is expected to hold
+        false_positive_rate: Target false-positive rate, or None for m = 10n and 3 probes
+        
+    Returns:
+        Tuple[int, int]: (size, hash_count)
+    """
+    if false_positive_rate is None:
+        return max(1, capacity * 10), 3  # Size of bit array (m = 10n)
+    size = optimal_size(capacity, false_positive_rate)
+    return size, optimal_hash_count(size, capacity)
+
+
+def probe_positions(item: str, size: int, hash_count: int, seed: int) -> List[int]:
+    """
+    Compute the k double-hashing probe positions for an item.
+    
+    The two base hashes are the low and high 32 bits of one 64-bit hash; h2 is forced
+    odd so successive probes never collapse onto one position.
+    
+    Args:
+        item: String to locate
+        size: Number of positions in the filter
+        hash_count: Number of probes
+        seed: Seed for the 64-bit item hash
+        
+    Returns:
+        List[int]: The positions h1 + i * h2 mod size for i in 0..hash_count-1
+    """
+    h = hash_str(item, seed)
+    h1, h2 = h & _MASK32, ((h >> 32) & _MASK32) | 1
+    return [(h1 + i * h2) % size for i in range(hash_count)]
+
+
+def probe_positions_many(hashes: np.ndarray, size: int, hash_count: int) -> np.ndarray:
+    """
+    Compute the double-hashing probe positions for many 64-bit hashes at once.
+    
+    Args:
+        hashes: uint64 array of item hashes
+        size: Number of bits in the filter
+        hash_count: Number of probes per item
+        
+    Returns:
+        np.ndarray: uint64 array of shape (len(hashes), hash_count) with the same
+        positions probe_positions gives for each item
+    """
+    h1 = hashes & np.uint64(_MASK32)
+    h2 = (hashes >> np.uint64(32)) | np.uint64(1)
+    steps = np.arange(hash_count, dtype=np.uint64)
+    return (h1[:, None] + steps[None, :] * h2[:, None]) % np.uint64(size)
 
 
 class BloomFilter:
     """
-    A Bloom filter implementation using three hash functions.
+    A Bloom filter implementation using Kirsch-Mitzenmacher double hashing.
     
     This class provides probabilistic set membership testing with O(1) lookups.
     False positives are possible, but false negatives are not.
     Space complexity is O(m) where m is size of the bit array (typically m = 10n where n is input size).
+    
+    The bit array is held by a pluggable storage engine: 'packed' (the default) keeps
+    eight bits per byte, while 'list' keeps the original one-int-per-bit list as a reference.
+    
+    When a target false-positive rate is given, m and the number of probes k are chosen
+    optimally for the expected capacity. The k probe positions are derived from two base
+    hashes as g_i(x) = h1(x) + i * h2(x) mod m, so any k costs a single hash of the item.
+    Hashing is deterministic for a given seed, so two filters built with the same
+    parameters and seed have identical bit arrays in any process. A filter can be
+    written with save() and memory-mapped back with load().
     """
     
-    def __init__(self, arr: List[str]) -> None:
+    _MAGIC = b'BLMF'
+    
+    def __init__(self, arr: List[str], storage: str = 'packed', capacity: Optional[int] = None,
+                 false_positive_rate: Optional[float] = None, seed: int = 0) -> None:
         """
         Initialize the Bloom filter with a list of strings.
         
         Args:
             arr: List of strings to add to the filter
+            storage: Bit array storage engine, 'packed' or 'list' (default: 'packed')
+            capacity: Number of items the filter is expected to hold (default: len(arr))
+            false_positive_rate: Target false-positive rate; if omitted the filter uses
+                m = 10n bits and 3 probes
+            seed: Seed for the 64-bit item hash (default: 0)
             
-        Time Complexity: O(n) where n is len(arr)
-        Space Complexity: O(m) where m is self.size
+        Time Complexity: O(n * k) where n is len(arr) and k is the number of probes
+        Space Complexity: O(m) where m is self.size (m / 8 bytes when packed)
         """
-        self.size = len(arr) * 10  # Size of bit array (m = 10n)
-        self.bit_array = [0] * self.size
+        self.capacity = len(arr) if capacity is None else capacity
+        self.false_positive_rate = false_positive_rate
+        self.size, self.hash_count = self._parameters(self.capacity, false_positive_rate)
+        self.seed = seed
+        self.storage = storage
+        self.bit_array = make_bit_array(storage, self.size)
+        self.count = 0
         
-        for item in arr:
-            self._add(item)
+        self._add_many(arr)
     
-    def _hash1(self, item: str) -> int:
-        """First hash function."""
-        return hash(item) % self.size
+    @classmethod
+    def from_iterable(cls, items: Iterable[str], capacity: Optional[int] = None,
+                      false_positive_rate: Optional[float] = None, storage: str = 'packed',
+                      seed: int = 0, chunk_size: int = BUILD_CHUNK_SIZE) -> 'BloomFilter':
+        """
+        Build a filter from any iterable of strings using the bulk insertion path.
+        
+        Items are consumed in chunks, so a generator (e.g. lines streamed from the
+        dataset file) is never materialized when capacity is given.
+        
+        Args:
+            items: Strings to add to the filter
+            capacity: Number of items the filter is expected to hold; if omitted the
+                items are collected into a list and counted
+            false_positive_rate: Target false-positive rate (default: m = 10n, 3 probes)
+            storage: Bit array storage engine, 'packed' or 'list' (default: 'packed')
+            seed: Seed for the 64-bit item hash (default: 0)
+            chunk_size: Number of items hashed per batch
+            
+        Returns:
+            BloomFilter: A filter holding every item
+            
+        Time Complexity: O(n * k), vectorized per chunk
+        """
+        if capacity is None:
+            items = list(items)
+            capacity = len(items)
+        bloom_filter = cls([], storage=storage, capacity=capacity,
+                           false_positive_rate=false_positive_rate, seed=seed)
+        iterator = iter(items)
+        while True:
+            chunk = list(islice(iterator, chunk_size))
+            if not chunk:
+                return bloom_filter
+            bloom_filter._add_many(chunk, chunk_size)
     
-    def _hash2(self, item: str) -> int:
-        """Second hash function."""
-        return hash(item * 2) % self.size
+    def _parameters(self, capacity: int, false_positive_rate: Optional[float]) -> Tuple[int, int]:
+        """Choose (size, hash_count) for the filter; see filter_parameters."""
+        return filter_parameters(capacity, false_positive_rate)
     
-    def _hash3(self, item: str) -> int:
-        """Third hash function."""
-        return hash(item * 3) % self.size
+    def _base_hashes(self, item: str) -> Tuple[int, int]:
+        """
+        Compute the two base hashes used for double hashing.
+        
+        Args:
+            item: String to hash
+            
+        Returns:
+            Tuple[int, int]: (h1, h2), the low and high 32 bits of one 64-bit hash;
+            h2 is forced odd so successive probes never collapse onto one position
+        """
+        h = hash_str(item, self.seed)
+        return h & _MASK32, ((h >> 32) & _MASK32) | 1
+    
+    def _positions(self, item: str) -> List[int]:
+        """
+        Compute the k probe positions for an item.
+        
+        Args:
+            item: String to locate in the bit array
+            
+        Returns:
+            List[int]: The k bit positions h1 + i * h2 mod m for i in 0..k-1
+        """
+        return probe_positions(item, self.size, self.hash_count, self.seed)
+    
+    def _positions_many(self, hashes: np.ndarray) -> np.ndarray:
+        """
+        Compute the probe positions for many item hashes at once.
+        
+        Args:
+            hashes: uint64 array of item hashes
+            
+        Returns:
+            np.ndarray: uint64 array of shape (len(hashes), hash_count)
+        """
+        return probe_positions_many(hashes, self.size, self.hash_count)
     
     def _add(self, item: str) -> None:
         """
@@ -50,11 +246,194 @@ class BloomFilter:
         Args:
             item: String to add to the filter
             
-        Time Complexity: O(k) where k is number of hash functions (3 in this case)
+        Time Complexity: O(k) where k is the number of probes
+        """
+        bit_array = self.bit_array
+        for position in self._positions(item):
+            bit_array.set(position)
+        self.count += 1
+    
+    def _add_many(self, items: List[str], chunk_size: int = BUILD_CHUNK_SIZE) -> None:
+        """
+        Add many items at once.
+        
+        With packed storage each chunk is hashed with NumPy and all of its probe bits
+        are set with one np.bitwise_or.at call on a zero-copy view of the bit array.
+        Other storage engines fall back to _add per item.
+        
+        Args:
+            items: Strings to add to the filter
+            chunk_size: Number of items hashed per batch
+            
+        Time Complexity: O(n * k), vectorized per chunk
+        """
+        if self.storage != 'packed':
+            for item in items:
+                self._add(item)
+            return
+        
+        bits = np.frombuffer(self.bit_array.bits, dtype=np.uint8)
+        for start in range(0, len(items), chunk_size):
+            chunk = items[start:start + chunk_size]
+            positions = self._positions_many(hash64_many(chunk, self.seed)).ravel()
+            masks = np.left_shift(1, positions & np.uint64(7)).astype(np.uint8)
+            np.bitwise_or.at(bits, positions >> np.uint64(3), masks)
+            self.count += len(chunk)
+    
+    def search(self, target: str) -> int:
+        """
+        Check if a target string might be in the set.
+        
+        Args:
+            target: String to search for
+            
+        Returns:
+            int: 1 if the target might be in the set, -1 if definitely not in the set
+            
+        Time Complexity: O(k) where k is the number of probes
+        """
+        h1, h2 = self._base_hashes(target)
+        size = self.size
+        bit_array = self.bit_array
+        for i in range(self.hash_count):
+            if not bit_array.get((h1 + i * h2) % size):
+                return -1
+        return 1
+    
+    def search_many(self, targets: Iterable[str]) -> np.ndarray:
+        """
+        Check many target strings at once.
+        
+        With packed storage the targets are hashed with NumPy and every probe is read
+        from a zero-copy uint8 view of the bit array with fancy indexing.
+        
+        Args:
+            targets: Strings to search for
+            
+        Returns:
+            np.ndarray: int64 array holding search(target) for each target
+            
+        Time Complexity: O(t * k) where t is the number of targets, vectorized
+        """
+        targets = list(targets)
+        if self.storage != 'packed':
+            return np.fromiter(map(self.search, targets), dtype=np.int64, count=len(targets))
+        
+        positions = self._positions_many(hash64_many(targets, self.seed))
+        bits = np.frombuffer(self.bit_array.bits, dtype=np.uint8)
+        probed = (bits[positions >> np.uint64(3)] >> (positions & np.uint64(7)).astype(np.uint8)) & 1
+        return np.where(probed.all(axis=1), 1, -1).astype(np.int64)
+    
+    @property
+    def expected_false_positive_rate(self) -> float:
+        """
+        Estimate the current false-positive rate from the number of added items.
+        
+        Returns:
+            float: (1 - e^(-k * n / m))^k for the n items added so far
+        """
+        return (1 - math.exp(-self.hash_count * self.count / self.size)) ** self.hash_count
+    
+    def save(self, path: str) -> None:
+        """
+        Write the filter to disk as a header followed by the packed bit array.
+        
+        Args:
+            path: Destination file path
+            
+        Time Complexity: O(m / 8) where m is self.size
+        """
+        fpr = math.nan if self.false_positive_rate is None else self.false_positive_rate
+        fields = (self.size, self.hash_count, self.seed, self.count, self.capacity, fpr)
+        write_file(path, self._MAGIC, _HEADER, fields, [self.bit_array.to_bytes()])
+    
+    @classmethod
+    def load(cls, path: str, verify: bool = True) -> 'BloomFilter':
+        """
+        Memory-map a filter written by save().
+        
+        Lookups read the mapped file directly, so worker processes loading the same
+        file share one copy in the page cache. The loaded filter is read-only.
+        
+        Args:
+            path: Source file path
+            verify: Whether to check the stored checksum (default: True)
+            
+        Returns:
+            BloomFilter: A read-only filter backed by the mapped file
+            
+        Time Complexity: O(1) without verification, O(m / 8) with it
+        """
+        fields, payload = map_file(path, cls._MAGIC, _HEADER, verify)
+        size, hash_count, seed, count, capacity, fpr = fields
+        bloom_filter = cls.__new__(cls)
+        bloom_filter.capacity = capacity
+        bloom_filter.false_positive_rate = None if math.isnan(fpr) else fpr
+        bloom_filter.size = size
+        bloom_filter.hash_count = hash_count
+        bloom_filter.seed = seed
+        bloom_filter.storage = 'packed'
+        bloom_filter.bit_array = PackedBitArray(size, payload)
+        bloom_filter.count = count
+        return bloom_filter
+
+
+class BlockedBloomFilter(BloomFilter):
+    """
+    A blocked Bloom filter that keeps all k probes of an item inside one cache line.
+    
+    The bit array is split into 512-bit (64-byte) blocks. The low 32 bits of the item
+    hash choose the block and the high 32 bits drive double hashing inside it, so a
+    lookup touches a single cache line instead of up to k random ones. Crowding all
+    probes into one block raises the false-positive rate slightly compared with a
+    standard BloomFilter of the same size.
+    
+    The interface (search, _add, bulk building, save and load) is the same as BloomFilter.
+    """
+    
+    _MAGIC = b'BBLF'
+    
+    def _parameters(self, capacity: int, false_positive_rate: Optional[float]) -> Tuple[int, int]:
+        """Choose (size, hash_count) with size rounded up to a whole number of blocks."""
+        size, hash_count = filter_parameters(capacity, false_positive_rate)
+        return -(-size // BLOCK_BITS) * BLOCK_BITS, hash_count
+    
+    @property
+    def num_blocks(self) -> int:
+        """Number of 512-bit blocks in the bit array."""
+        return self.size // BLOCK_BITS
+    
+    def _positions(self, item: str) -> List[int]:
+        """
+        Compute the k probe positions for an item, all within one block.
+        
+        Args:
+            item: String to locate in the bit array
+            
+        Returns:
+            List[int]: block * 512 + (g1 + i * g2) mod 512 for i in 0..k-1
+        """
+        h = hash_str(item, self.seed)
+        base = ((h & _MASK32) % self.num_blocks) * BLOCK_BITS
+        g1, g2 = (h >> 32) & 0xFFFF, (h >> 48) | 1
+        return [base + ((g1 + i * g2) & (BLOCK_BITS - 1)) for i in range(self.hash_count)]
+    
+    def _positions_many(self, hashes: np.ndarray) -> np.ndarray:
+        """
+        Compute the in-block probe positions for many item hashes at once.
+        
+        Args:
+            hashes: uint64 array of item hashes
+            
+        Returns:
+            np.ndarray: uint64 array of shape (len(hashes), hash_count)
         """
-        self.bit_array[self._hash1(item)] = 1
-        self.bit_array[self._hash2(item)] = 1
-        self.bit_array[self._hash3(item)] = 1
+        base = ((hashes & np.uint64(_MASK32)) % np.uint64(self.num_blocks)) * np.uint64(BLOCK_BITS)
+        g1 = (hashes >> np.uint64(32)) & np.uint64(0xFFFF)
+        g2 = (hashes >> np.uint64(48)) | np.uint64(1)
+        steps = np.arange(self.hash_count, dtype=np.uint64)
+        offsets = (g1[:, None] + steps[None, :] * g2[:, None]) & np.uint64(BLOCK_BITS - 1)
+        return base[:, None] + offsets
     
     def search(self, target: str) -> int:
         """
@@ -66,10 +445,10 @@ class BloomFilter:
         Returns:
             int: 1 if the target might be in the set, -1 if definitely not in the set
             
-        Time Complexity: O(k) where k is number of hash functions (3 in this case)
+        Time Complexity: O(k) where k is the number of probes, within one cache line
         """
-        if (self.bit_array[self._hash1(target)] and 
-            self.bit_array[self._hash2(target)] and 
-            self.bit_array[self._hash3(target)]):
-            return 1
-        return -1
+        bit_array = self.bit_array
+        for position in self._positions(target):
+            if not bit_array.get(position):
+                return -1
+        return 1
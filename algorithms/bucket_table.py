@@ -0,0 +1,338 @@
+"""
+This module provides bucket table storage engines used by the Cuckoo filter.
+A list-of-lists engine is kept as a readable reference, while the flat engine stores all
+fingerprints in one contiguous array that can be serialized or memory-mapped directly.
+The semi-sorted table is a compressed variant of the flat layout for four-slot buckets.
+"""
+
+import sys
+from array import array
+from itertools import combinations_with_replacement
+from typing import Dict, List, Optional, Type, Union
+
+import numpy as np
+
+# Every multiset of four 4-bit prefixes, as ascending tuples; 3876 entries fit in 12 bits
+_PREFIX_CODEBOOK = list(combinations_with_replacement(range(16), 4))
+_PREFIX_INDEX = {prefixes: index for index, prefixes in enumerate(_PREFIX_CODEBOOK)}
+_PREFIX_CODEBOOK_ARRAY = np.array(_PREFIX_CODEBOOK, dtype=np.uint64)
+_PREFIX_INDEX_BITS = 12
+
+
+class ListBucketTable:
+    """
+    A reference bucket table holding one Python list per bucket.
+    
+    Empty slots hold None. Every bucket is a separate list object, so this engine is
+    simple to inspect but costs tens of bytes per slot.
+    """
+    
+    def __init__(self, num_buckets: int, bucket_size: int, fingerprint_size: int) -> None:
+        """
+        Initialize an empty bucket table.
+        
+        Args:
+            num_buckets: Number of buckets
+            bucket_size: Number of slots per bucket
+            fingerprint_size: Fingerprint width in bits
+            
+        Time Complexity: O(b * s) where b is num_buckets and s is bucket_size
+        Space Complexity: O(b * s) list slots plus one list object per bucket
+        """
+        self.num_buckets = num_buckets
+        self.bucket_size = bucket_size
+        self.fingerprint_size = fingerprint_size
+        self.buckets: List[List[Optional[int]]] = [[None] * bucket_size for _ in range(num_buckets)]
+    
+    def contains(self, pos: int, fp: int) -> bool:
+        """Return whether bucket pos holds fingerprint fp."""
+        return fp in self.buckets[pos]
+    
+    def insert(self, pos: int, fp: int) -> bool:
+        """Store fp in the first empty slot of bucket pos, returning False if it is full."""
+        bucket = self.buckets[pos]
+        for i in range(self.bucket_size):
+            if bucket[i] is None:
+                bucket[i] = fp
+                return True
+        return False
+    
+    def swap(self, pos: int, slot: int, fp: int) -> int:
+        """Replace the fingerprint in slot of bucket pos with fp and return the old one."""
+        bucket = self.buckets[pos]
+        old, bucket[slot] = bucket[slot], fp
+        return old
+    
+    def remove(self, pos: int, fp: int) -> bool:
+        """Clear one slot of bucket pos holding fp, returning False if there is none."""
+        bucket = self.buckets[pos]
+        for i in range(self.bucket_size):
+            if bucket[i] == fp:
+                bucket[i] = None
+                return True
+        return False
+    
+    def to_bytes(self) -> bytes:
+        """Return the table in the flat little-endian layout used by FlatBucketTable."""
+        flat = FlatBucketTable(self.num_buckets, self.bucket_size, self.fingerprint_size)
+        flat.slots = array(flat.slots.typecode, [fp or 0 for bucket in self.buckets for fp in bucket])
+        return flat.to_bytes()
+    
+    @property
+    def nbytes(self) -> int:
+        """Approximate number of bytes used by the bucket lists."""
+        return self.num_buckets * (sys.getsizeof([None] * self.bucket_size))
+
+
+class FlatBucketTable:
+    """
+    A flat bucket table storing all fingerprints in one contiguous array.
+    
+    Slot j of bucket i lives at index i * bucket_size + j. Fingerprints of up to 8 bits
+    use one byte per slot and wider ones two bytes; 0 marks an empty slot.
+    """
+    
+    def __init__(self, num_buckets: int, bucket_size: int, fingerprint_size: int,
+                 buffer: Optional[memoryview] = None) -> None:
+        """
+        Initialize a flat bucket table.
+        
+        Args:
+            num_buckets: Number of buckets
+            bucket_size: Number of slots per bucket
+            fingerprint_size: Fingerprint width in bits, at most 16
+            buffer: Existing little-endian table bytes to use in place, e.g. a
+                memory-mapped file; a new all-empty array is allocated if omitted
+                
+        Time Complexity: O(b * s) where b is num_buckets and s is bucket_size, O(1) with a buffer
+        Space Complexity: O(b * s) bytes (two per slot above 8-bit fingerprints), O(1) with a buffer
+        """
+        self.num_buckets = num_buckets
+        self.bucket_size = bucket_size
+        self.fingerprint_size = fingerprint_size
+        typecode = 'B' if fingerprint_size <= 8 else 'H'
+        if buffer is None:
+            self.slots: Union[array, memoryview] = array(typecode, [0]) * (num_buckets * bucket_size)
+        elif typecode == 'H' and sys.byteorder == 'big':
+            self.slots = array(typecode, buffer)
+            self.slots.byteswap()
+        else:
+            self.slots = buffer.cast(typecode)
+    
+    def contains(self, pos: int, fp: int) -> bool:
+        """Return whether bucket pos holds fingerprint fp."""
+        start = pos * self.bucket_size
+        return fp in self.slots[start:start + self.bucket_size]
+    
+    def insert(self, pos: int, fp: int) -> bool:
+        """Store fp in the first empty slot of bucket pos, returning False if it is full."""
+        slots = self.slots
+        start = pos * self.bucket_size
+        for i in range(start, start + self.bucket_size):
+            if not slots[i]:
+                slots[i] = fp
+                return True
+        return False
+    
+    def swap(self, pos: int, slot: int, fp: int) -> int:
+        """Replace the fingerprint in slot of bucket pos with fp and return the old one."""
+        index = pos * self.bucket_size + slot
+        old = self.slots[index]
+        self.slots[index] = fp
+        return old
+    
+    def remove(self, pos: int, fp: int) -> bool:
+        """Clear one slot of bucket pos holding fp, returning False if there is none."""
+        slots = self.slots
+        start = pos * self.bucket_size
+        for i in range(start, start + self.bucket_size):
+            if slots[i] == fp:
+                slots[i] = 0
+                return True
+        return False
+    
+    def to_bytes(self) -> bytes:
+        """Return the slots as little-endian bytes."""
+        if self.slots.itemsize > 1 and sys.byteorder == 'big':
+            swapped = array(self.slots.typecode, self.slots)
+            swapped.byteswap()
+            return swapped.tobytes()
+        return self.slots.tobytes()
+    
+    @property
+    def nbytes(self) -> int:
+        """Number of bytes used by the slot array."""
+        return len(self.slots) * self.slots.itemsize
+
+
+class SemiSortedBucketTable:
+    """
+    A flat bucket table that compresses four-slot buckets by semi-sorting.
+    
+    The fingerprints of a bucket are kept in ascending order, so their 4-bit prefixes
+    form a sorted sequence. There are only 3876 such sequences, so the four prefixes
+    (16 bits) are stored as a 12-bit index into a fixed codebook, followed by the four
+    remaining (f - 4)-bit suffixes. Each bucket takes 12 + 4 * (f - 4) bits instead of
+    4 * f, saving one bit per fingerprint; with 8-bit fingerprints a bucket is 28 bits.
+    
+    Buckets are packed back to back into one byte array, bucket i starting at bit
+    i * bucket_bits, so the table can be serialized or memory-mapped like the flat one.
+    Every access decodes and re-encodes a whole bucket, trading CPU for memory.
+    """
+    
+    def __init__(self, num_buckets: int, bucket_size: int, fingerprint_size: int,
+                 buffer: Optional[memoryview] = None) -> None:
+        """
+        Initialize a semi-sorted bucket table.
+        
+        Args:
+            num_buckets: Number of buckets
+            bucket_size: Number of slots per bucket, which must be 4
+            fingerprint_size: Fingerprint width in bits, between 4 and 16
+            buffer: Existing table bytes to use in place, e.g. a memory-mapped file;
+                a new all-empty array is allocated if omitted
+                
+        Raises:
+            ValueError: If bucket_size is not 4 or fingerprint_size is out of range
+            
+        Time Complexity: O(b) where b is num_buckets, O(1) with a buffer
+        Space Complexity: O(b * (12 + 4 * (f - 4)) / 8) bytes, O(1) with a buffer
+        """
+        if bucket_size != 4:
+            raise ValueError("Semi-sorted buckets require bucket_size=4")
+        if not 4 <= fingerprint_size <= 16:
+            raise ValueError("Semi-sorted buckets require fingerprint_size between 4 and 16 bits")
+        self.num_buckets = num_buckets
+        self.bucket_size = bucket_size
+        self.fingerprint_size = fingerprint_size
+        self._suffix_bits = fingerprint_size - 4
+        self._suffix_mask = (1 << self._suffix_bits) - 1
+        self.bucket_bits = _PREFIX_INDEX_BITS + bucket_size * self._suffix_bits
+        self._bucket_mask = (1 << self.bucket_bits) - 1
+        # 8 spare bytes let search_many read any bucket as a full 64-bit word
+        size = -(-num_buckets * self.bucket_bits // 8) + 8
+        self.bits: Union[bytearray, memoryview] = bytearray(size) if buffer is None else buffer
+    
+    def _read(self, pos: int) -> List[int]:
+        """Decode bucket pos into its four fingerprints in ascending order (0 = empty)."""
+        offset = pos * self.bucket_bits
+        start, shift = offset >> 3, offset & 7
+        end = (offset + self.bucket_bits + 7) >> 3
+        code = (int.from_bytes(self.bits[start:end], 'little') >> shift) & self._bucket_mask
+        
+        prefixes = _PREFIX_CODEBOOK[code & 0xFFF]
+        code >>= _PREFIX_INDEX_BITS
+        suffix_bits, suffix_mask = self._suffix_bits, self._suffix_mask
+        fps = []
+        for prefix in prefixes:
+            fps.append((prefix << suffix_bits) | (code & suffix_mask))
+            code >>= suffix_bits
+        return fps
+    
+    def _write(self, pos: int, fps: List[int]) -> None:
+        """Sort and encode four fingerprints into bucket pos."""
+        fps = sorted(fps)
+        suffix_bits = self._suffix_bits
+        code = 0
+        for fp in reversed(fps):
+            code = (code << suffix_bits) | (fp & self._suffix_mask)
+        code = (code << _PREFIX_INDEX_BITS) | _PREFIX_INDEX[tuple(fp >> suffix_bits for fp in fps)]
+        
+        offset = pos * self.bucket_bits
+        start, shift = offset >> 3, offset & 7
+        end = (offset + self.bucket_bits + 7) >> 3
+        word = int.from_bytes(self.bits[start:end], 'little')
+        word = (word & ~(self._bucket_mask << shift)) | (code << shift)
+        self.bits[start:end] = word.to_bytes(end - start, 'little')
+    
+    def contains(self, pos: int, fp: int) -> bool:
+        """Return whether bucket pos holds fingerprint fp."""
+        return fp in self._read(pos)
+    
+    def insert(self, pos: int, fp: int) -> bool:
+        """Store fp in an empty slot of bucket pos, returning False if it is full."""
+        fps = self._read(pos)
+        if fps[0]:
+            return False  # sorted, so an empty (0) slot would come first
+        fps[0] = fp
+        self._write(pos, fps)
+        return True
+    
+    def swap(self, pos: int, slot: int, fp: int) -> int:
+        """Replace the fingerprint in slot of bucket pos (in sorted order) with fp and return the old one."""
+        fps = self._read(pos)
+        old, fps[slot] = fps[slot], fp
+        self._write(pos, fps)
+        return old
+    
+    def remove(self, pos: int, fp: int) -> bool:
+        """Clear one slot of bucket pos holding fp, returning False if there is none."""
+        fps = self._read(pos)
+        if fp not in fps:
+            return False
+        fps[fps.index(fp)] = 0
+        self._write(pos, fps)
+        return True
+    
+    def read_many(self, positions: np.ndarray) -> np.ndarray:
+        """
+        Decode many buckets at once with NumPy.
+        
+        Args:
+            positions: uint64 array of bucket indexes
+            
+        Returns:
+            np.ndarray: uint64 array of shape (len(positions), 4) holding each bucket's
+            fingerprints in ascending order, 0 for empty slots
+        """
+        data = np.frombuffer(self.bits, dtype=np.uint8)
+        offsets = positions.astype(np.uint64) * np.uint64(self.bucket_bits)
+        starts = (offsets >> np.uint64(3)).astype(np.intp)
+        shifts = offsets & np.uint64(7)
+        low = np.ascontiguousarray(data[starts[:, None] + np.arange(8)]).view('<u8').ravel()
+        high = data[starts + 8].astype(np.uint64)
+        carry = np.where(shifts > 0, high << ((np.uint64(64) - shifts) & np.uint64(63)), np.uint64(0))
+        codes = ((low >> shifts) | carry) & np.uint64(self._bucket_mask)
+        
+        prefixes = _PREFIX_CODEBOOK_ARRAY[(codes & np.uint64(0xFFF)).astype(np.intp)]
+        suffix_shifts = np.uint64(_PREFIX_INDEX_BITS) + np.arange(4, dtype=np.uint64) * np.uint64(self._suffix_bits)
+        suffixes = (codes[:, None] >> suffix_shifts) & np.uint64(self._suffix_mask)
+        return (prefixes << np.uint64(self._suffix_bits)) | suffixes
+    
+    def to_bytes(self) -> bytes:
+        """Return the packed bucket bytes."""
+        return bytes(self.bits)
+    
+    @property
+    def nbytes(self) -> int:
+        """Number of bytes used by the packed buckets."""
+        return len(self.bits)
+
+
+BucketTable = Union[ListBucketTable, FlatBucketTable, SemiSortedBucketTable]
+
+BUCKET_TABLE_STORAGES: Dict[str, Type[BucketTable]] = {
+    'list': ListBucketTable,
+    'flat': FlatBucketTable,
+}
+
+
+def make_bucket_table(storage: str, num_buckets: int, bucket_size: int, fingerprint_size: int) -> BucketTable:
+    """
+    Create an empty bucket table using the named storage engine.
+    
+    Args:
+        storage: Storage engine name ('list' or 'flat')
+        num_buckets: Number of buckets
+        bucket_size: Number of slots per bucket
+        fingerprint_size: Fingerprint width in bits
+        
+    Returns:
+        BucketTable: A new empty bucket table
+        
+    Raises:
+        ValueError: If storage is not a known engine name
+    """
+    if storage not in BUCKET_TABLE_STORAGES:
+        raise ValueError(f"Unknown bucket table storage '{storage}', expected one of {sorted(BUCKET_TABLE_STORAGES)}")
+    return BUCKET_TABLE_STORAGES[storage](num_buckets, bucket_size, fingerprint_size)
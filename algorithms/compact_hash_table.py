@@ -0,0 +1,246 @@
+"""
+This module provides a memory-compact hash index from strings to their positions.
+An open-addressing table of 64-bit hashes and int32 key indexes lives in two NumPy arrays,
+and the keys themselves sit in one contiguous UTF-8 blob that every hit is verified against.
+"""
+
+import struct
+from typing import Iterable, List
+
+import numpy as np
+
+from .hashing import hash64, hash64_many
+from .serialization import map_file, write_file
+from .string_store import StringStore
+
+# capacity, number of stored strings, number of distinct keys, seed
+_HEADER = struct.Struct('<QQQQ')
+
+EMPTY = -1
+
+
+class CompactHashTable:
+    """
+    A read-only hash index mapping each string of an array to its index.
+    
+    Keys are hashed with hash64 and placed by linear probing into a power-of-two table
+    that is at most MAX_LOAD_FACTOR full. Each slot holds the key's 64-bit hash and its
+    int32 index into a StringStore, so a lookup compares hashes first and reads the
+    UTF-8 bytes from the blob only to confirm a hash match. Like a dict built from
+    enumerate(arr), a key that occurs more than once maps to its last index.
+    
+    Memory is 12 bytes per slot plus the UTF-8 bytes and an 8-byte offset per string:
+    about 75 bytes per login name, against about 150 bytes for a dict of str to int
+    with its string and int objects. A table written with save() can be memory-mapped
+    by load() so worker processes share one copy in the page cache.
+    """
+    
+    _MAGIC = b'CHTB'
+    MAX_LOAD_FACTOR = 0.7
+    
+    def __init__(self, arr: List[str], seed: int = 0) -> None:
+        """
+        Build the table from an array of strings.
+        
+        Args:
+            arr: Strings to index; string i maps to index i
+            seed: Seed of the hash function (default: 0)
+            
+        Raises:
+            ValueError: If arr holds 2^31 or more strings
+            
+        Time Complexity: O(n + total length of strings), vectorized
+        Space Complexity: O(n) for the table, plus the UTF-8 bytes of the strings
+        """
+        if len(arr) >= 2 ** 31:
+            raise ValueError("CompactHashTable holds at most 2^31 - 1 strings")
+        self.seed = seed
+        self.store = StringStore(arr)
+        self.capacity = 8
+        while self.capacity * self.MAX_LOAD_FACTOR < len(arr):
+            self.capacity *= 2
+        self.hashes = np.zeros(self.capacity, dtype=np.uint64)
+        self.indexes = np.full(self.capacity, EMPTY, dtype=np.int32)
+        self.count = self._build(arr, hash64_many(arr, seed))
+        self._init_views()
+    
+    def _build(self, arr: List[str], hashes: np.ndarray) -> int:
+        """
+        Insert every key with vectorized rounds of linear probing.
+        
+        Each round, every pending key looks at its current slot. Keys whose slot is
+        empty compete for it and the highest index wins; keys whose slot holds the same
+        string keep the higher of the two indexes and are done; all others move on to
+        the next slot. Hash matches are confirmed against the string store in bulk.
+        
+        Args:
+            arr: Strings being indexed
+            hashes: hash64 value of each string
+            
+        Returns:
+            int: Number of distinct keys placed
+        """
+        mask = self.capacity - 1
+        slots = (hashes & np.uint64(mask)).astype(np.int64)
+        pending = np.arange(len(arr), dtype=np.int64)
+        count = 0
+        while len(pending):
+            current = slots[pending]
+            occupants = self.indexes[current]
+            empty = occupants == EMPTY
+            
+            # claim empty slots: sort by slot, then by descending index, and keep the first
+            claimants = pending[empty]
+            order = np.lexsort((-claimants, current[empty]))
+            claimants = claimants[order]
+            claimed_slots = slots[claimants]
+            first = np.ones(len(claimants), dtype=bool)
+            first[1:] = claimed_slots[1:] != claimed_slots[:-1]
+            winners = claimants[first]
+            self.hashes[slots[winners]] = hashes[winners]
+            self.indexes[slots[winners]] = winners
+            count += len(winners)
+            
+            # keys meeting an occupant with the same hash may be duplicates of it
+            waiting = pending[~empty]
+            waiting_occupants = occupants[~empty].astype(np.int64)
+            done = hashes[waiting] == hashes[waiting_occupants]
+            candidates = np.flatnonzero(done)
+            encoded = [arr[index].encode() for index in waiting[candidates]]
+            done[candidates] = self.store.equal_many(waiting_occupants[candidates], encoded)
+            duplicates = waiting[done]
+            self.indexes[slots[duplicates]] = np.maximum(duplicates, waiting_occupants[done])
+            
+            advancing = waiting[~done]
+            slots[advancing] = (slots[advancing] + 1) & mask
+            pending = np.concatenate([advancing, claimants[~first]])
+        return count
+    
+    def _init_views(self) -> None:
+        """Create memoryviews of the table for fast scalar access from Python."""
+        self._hash_view = memoryview(self.hashes).cast('B').cast('Q')
+        self._index_view = memoryview(self.indexes).cast('B').cast('i')
+    
+    def __len__(self) -> int:
+        """Number of distinct keys in the table."""
+        return self.count
+    
+    def get(self, key: str, default: int = EMPTY) -> int:
+        """
+        Look up the index of a key.
+        
+        Args:
+            key: String to look up
+            default: Value returned when the key is absent (default: -1)
+            
+        Returns:
+            int: Index of the key in the original array, or default if not found
+            
+        Time Complexity: O(1) average case
+        """
+        encoded = key.encode()
+        h = hash64(encoded, self.seed)
+        mask = self.capacity - 1
+        slot = h & mask
+        hashes, indexes, get_bytes = self._hash_view, self._index_view, self.store.get_bytes
+        while True:
+            index = indexes[slot]
+            if index == EMPTY:
+                return default
+            if hashes[slot] == h and get_bytes(index) == encoded:
+                return index
+            slot = (slot + 1) & mask
+    
+    def __contains__(self, key: str) -> bool:
+        """Check whether a key is in the table."""
+        return self.get(key) != EMPTY
+    
+    def get_many(self, keys: Iterable[str]) -> np.ndarray:
+        """
+        Look up many keys at once.
+        
+        All keys are hashed with hash64_many and probed in vectorized rounds; keys whose
+        slot holds a matching hash are compared against the blob in bulk.
+        
+        Args:
+            keys: Strings to look up
+            
+        Returns:
+            np.ndarray: int64 array holding get(key) for each key
+            
+        Time Complexity: O(t) average case where t is the number of keys
+        """
+        keys = list(keys)
+        hashes = hash64_many(keys, self.seed)
+        results = np.full(len(keys), EMPTY, dtype=np.int64)
+        mask = self.capacity - 1
+        slots = (hashes & np.uint64(mask)).astype(np.int64)
+        active = np.arange(len(keys), dtype=np.int64)
+        while len(active):
+            active = active[self.indexes[slots[active]] != EMPTY]
+            current = slots[active]
+            found = self.hashes[current] == hashes[active]
+            candidates = np.flatnonzero(found)
+            encoded = [keys[key].encode() for key in active[candidates]]
+            indexes = self.indexes[current[candidates]]
+            found[candidates] = self.store.equal_many(indexes, encoded)
+            results[active[found]] = self.indexes[current[found]]
+            active = active[~found]
+            slots[active] = (slots[active] + 1) & mask
+        return results
+    
+    @property
+    def load_factor(self) -> float:
+        """Fraction of table slots in use."""
+        return self.count / self.capacity
+    
+    @property
+    def nbytes(self) -> int:
+        """Number of bytes used by the table and the string store."""
+        return self.hashes.nbytes + self.indexes.nbytes + self.store.nbytes
+    
+    def save(self, path: str) -> None:
+        """
+        Write the table to disk as a header followed by the slots and the string store.
+        
+        Args:
+            path: Destination file path
+            
+        Time Complexity: O(c + s) where c is the capacity and s is the store size
+        """
+        fields = (self.capacity, len(self.store), self.count, self.seed)
+        payload = [self.hashes, self.store.offsets, self.indexes, self.store.blob]
+        write_file(path, self._MAGIC, _HEADER, fields, payload)
+    
+    @classmethod
+    def load(cls, path: str, verify: bool = True) -> 'CompactHashTable':
+        """
+        Memory-map a table written by save().
+        
+        Lookups read the mapped file directly, so worker processes loading the same
+        file share one copy in the page cache. The loaded table is read-only.
+        
+        Args:
+            path: Source file path
+            verify: Whether to check the stored checksum (default: True)
+            
+        Returns:
+            CompactHashTable: A table backed by the mapped file
+            
+        Time Complexity: O(1) without verification, O(c + s) with it
+        """
+        fields, payload = map_file(path, cls._MAGIC, _HEADER, verify)
+        capacity, num_strings, count, seed = fields
+        offsets_start = capacity * 8
+        indexes_start = offsets_start + (num_strings + 1) * 8
+        blob_start = indexes_start + capacity * 4
+        
+        table = cls.__new__(cls)
+        table.seed = seed
+        table.capacity = capacity
+        table.count = count
+        table.hashes = np.frombuffer(payload[:offsets_start], dtype=np.uint64)
+        table.indexes = np.frombuffer(payload[indexes_start:blob_start], dtype=np.int32)
+        table.store = StringStore(offsets=payload[offsets_start:indexes_start], blob=payload[blob_start:])
+        table._init_views()
+        return table
@@ -0,0 +1,147 @@
+"""
+This module provides a counting Bloom filter that supports deleting items.
+Each position holds a small counter instead of a bit, so items can be removed again,
+which lets account churn be applied incrementally instead of rebuilding the filter.
+"""
+
+from typing import Iterable, List, Optional
+
+import numpy as np
+
+from .bloom_filter import filter_parameters, probe_positions, probe_positions_many
+from .hashing import hash64_many
+
+COUNTER_MAX = 15  # 4-bit counters saturate here
+
+
+class CountingBloomFilter:
+    """
+    A counting Bloom filter with 4-bit counters packed two per byte.
+    
+    This class provides probabilistic set membership testing with O(1) lookups,
+    insertions and deletions. False positives are possible, but false negatives are not
+    as long as only items that were added are removed.
+    
+    Sizing and hashing are shared with BloomFilter: the same capacity and
+    false_positive_rate arguments choose m and k, and the same seeded double hashing
+    picks the counters. Counter i lives in byte i >> 1, in the low nibble for even i and
+    the high nibble for odd i. A counter that reaches 15 saturates and is never
+    decremented again, since its true count is no longer known.
+    
+    Space complexity is O(m) where m is size, stored in m / 2 bytes.
+    """
+    
+    def __init__(self, arr: List[str], capacity: Optional[int] = None,
+                 false_positive_rate: Optional[float] = None, seed: int = 0) -> None:
+        """
+        Initialize the counting Bloom filter with a list of strings.
+        
+        Args:
+            arr: List of strings to add to the filter
+            capacity: Number of items the filter is expected to hold (default: len(arr))
+            false_positive_rate: Target false-positive rate; if omitted the filter uses
+                m = 10n counters and 3 probes
+            seed: Seed for the 64-bit item hash (default: 0)
+            
+        Time Complexity: O(n * k) where n is len(arr) and k is the number of probes
+        Space Complexity: O(m) counters in m / 2 bytes
+        """
+        self.capacity = len(arr) if capacity is None else capacity
+        self.false_positive_rate = false_positive_rate
+        self.size, self.hash_count = filter_parameters(self.capacity, false_positive_rate)
+        self.seed = seed
+        self.counters = bytearray((self.size + 1) >> 1)
+        self.count = 0
+        
+        for item in arr:
+            self.add(item)
+    
+    def _get(self, index: int) -> int:
+        """Return the value of counter index."""
+        return (self.counters[index >> 1] >> ((index & 1) << 2)) & 0xF
+    
+    def add(self, item: str) -> None:
+        """
+        Add an item, incrementing each of its counters unless saturated.
+        
+        Args:
+            item: String to add to the filter
+            
+        Time Complexity: O(k) where k is the number of probes
+        """
+        counters = self.counters
+        for position in probe_positions(item, self.size, self.hash_count, self.seed):
+            shift = (position & 1) << 2
+            byte = counters[position >> 1]
+            if (byte >> shift) & 0xF < COUNTER_MAX:
+                counters[position >> 1] = byte + (1 << shift)
+        self.count += 1
+    
+    def remove(self, item: str) -> bool:
+        """
+        Remove an item, decrementing each of its counters unless saturated.
+        
+        Only remove items that were added; removing anything else can clear counters
+        shared with other items and cause false negatives.
+        
+        Args:
+            item: String to remove from the filter
+            
+        Returns:
+            bool: True if the item might have been present and was removed, False if it
+            was definitely not in the filter
+            
+        Time Complexity: O(k) where k is the number of probes
+        """
+        positions = probe_positions(item, self.size, self.hash_count, self.seed)
+        if not all(self._get(position) for position in positions):
+            return False
+        
+        counters = self.counters
+        for position in positions:
+            shift = (position & 1) << 2
+            byte = counters[position >> 1]
+            if 0 < (byte >> shift) & 0xF < COUNTER_MAX:
+                counters[position >> 1] = byte - (1 << shift)
+        self.count -= 1
+        return True
+    
+    def search(self, target: str) -> int:
+        """
+        Check if a target string might be in the set.
+        
+        Args:
+            target: String to search for
+            
+        Returns:
+            int: 1 if the target might be in the set, -1 if definitely not in the set
+            
+        Time Complexity: O(k) where k is the number of probes
+        """
+        for position in probe_positions(target, self.size, self.hash_count, self.seed):
+            if not self._get(position):
+                return -1
+        return 1
+    
+    def search_many(self, targets: Iterable[str]) -> np.ndarray:
+        """
+        Check many target strings at once.
+        
+        Args:
+            targets: Strings to search for
+            
+        Returns:
+            np.ndarray: int64 array holding search(target) for each target
+            
+        Time Complexity: O(t * k) where t is the number of targets, vectorized
+        """
+        positions = probe_positions_many(hash64_many(list(targets), self.seed), self.size, self.hash_count)
+        counters = np.frombuffer(self.counters, dtype=np.uint8)
+        shifts = ((positions & np.uint64(1)) << np.uint64(2)).astype(np.uint8)
+        probed = (counters[positions >> np.uint64(1)] >> shifts) & 0xF
+        return np.where(probed.all(axis=1), 1, -1).astype(np.int64)
+    
+    @property
+    def nbytes(self) -> int:
+        """Number of bytes used by the packed counters."""
+        return len(self.counters)
@@ -4,22 +4,72 @@ The Cuckoo filter offers constant-time insertions, deletions, and lookups with b
 than Bloom filters and support for deletion operations.
 """
 
-import hashlib
-from typing import List, Optional, Any
+import random
+import struct
+from itertools import islice
+from typing import Optional, Any, Iterable, List, Tuple
+
+import numpy as np
+
+from .bucket_table import FlatBucketTable, SemiSortedBucketTable, make_bucket_table
+from .hashing import hash64_many, hash_str
+from .serialization import map_file, write_file
+
+_FINGERPRINT_MULTIPLIER = 0x5BD1E995  # MurmurHash2 multiplier used to scatter fingerprints
+_MAX_LOAD_FACTOR = 0.96
+BUILD_CHUNK_SIZE = 65536
+
+# capacity, bucket_size, fingerprint_size, max_kicks, seed, count, number of buckets,
+# victim fingerprint (0 when empty), victim bucket, semi-sorted flag
+_HEADER = struct.Struct('<QIIIQQQQQI')
+
+
+def _bucket_count(capacity: int, bucket_size: int) -> int:
+    """
+    Choose a power-of-two number of buckets able to hold capacity items.
+    
+    Args:
+        capacity: Number of items the filter is expected to hold
+        bucket_size: Number of entries per bucket
+        
+    Returns:
+        int: Smallest power of two whose load at capacity stays under _MAX_LOAD_FACTOR
+    """
+    num_buckets = 1 << max(0, (max(1, -(-capacity // bucket_size)) - 1).bit_length())
+    if capacity / (num_buckets * bucket_size) > _MAX_LOAD_FACTOR:
+        num_buckets <<= 1
+    return num_buckets
 
 
 class CuckooFilter:
     """
-    A Cuckoo filter implementation using two hash tables and buckets.
+    A Cuckoo filter implementation using partial-key cuckoo hashing.
     
     This class provides approximate set membership testing with O(1) operations.
     Like Bloom filters, false positives are possible but false negatives are not.
     Unlike Bloom filters, Cuckoo filters support deletion and have better space efficiency.
     
+    Each item has a primary bucket i1 taken from its hash and an alternate bucket
+    i2 = i1 XOR hash(fingerprint). Because i2 depends only on the fingerprint, a stored
+    fingerprint can be moved to its other bucket without knowing the original item, and
+    the number of buckets is a power of two so the XOR stays in range. This keeps every
+    displaced entry findable up to load factors around 95%.
+    
     Space complexity is O(n) where n is the capacity.
+    
+    Buckets are held by a pluggable storage engine: 'flat' (the default) keeps all
+    fingerprints in one contiguous array with 0 as the empty sentinel, while 'list'
+    keeps the original list-per-bucket table as a reference. With semi_sorted=True the
+    flat engine additionally compresses each four-slot bucket by sorting its fingerprints,
+    saving one bit per fingerprint at the cost of slower single-item operations.
+    
+    A filter can be written with save() and memory-mapped back with load().
     """
     
-    def __init__(self, capacity: int, bucket_size: int = 4, max_kicks: int = 500) -> None:
+    _MAGIC = b'CKOF'
+    
+    def __init__(self, capacity: int, bucket_size: int = 4, max_kicks: int = 500, seed: int = 0,
+                 fingerprint_size: int = 8, storage: str = 'flat', semi_sorted: bool = False) -> None:
         """
         Initialize the Cuckoo filter.
         
@@ -27,47 +77,84 @@ class CuckooFilter:
             capacity: Number of items the filter is expected to hold
             bucket_size: Number of entries per bucket (default: 4)
             max_kicks: Maximum number of displacement attempts (default: 500)
-            
+            seed: Seed for the 64-bit item hash and the victim selection (default: 0)
+            fingerprint_size: Fingerprint width in bits, typically 8, 12 or 16 (default: 8)
+            storage: Bucket table storage engine, 'flat' or 'list' (default: 'flat')
+            semi_sorted: Whether to use semi-sorted bucket compression, which requires
+                flat storage, bucket_size=4 and fingerprints of at least 4 bits (default: False)
+                
+        Raises:
+            ValueError: If fingerprint_size is not between 2 and 16 bits, or semi_sorted
+                is requested for an unsupported configuration
+                
         Time Complexity: O(capacity) for initialization
-        Space Complexity: O(capacity * bucket_size)
+        Space Complexity: O(capacity)
         """
+        if not 2 <= fingerprint_size <= 16:
+            raise ValueError("fingerprint_size must be between 2 and 16 bits")
         self.capacity = capacity
         self.bucket_size = bucket_size
         self.max_kicks = max_kicks
-        self.tables: List[List[Optional[int]]] = [[None] * self.bucket_size for _ in range(2 * capacity)]
-        self.fingerprint_size = 8  # bits
+        self.seed = seed
+        self.num_buckets = _bucket_count(capacity, bucket_size)
+        self.fingerprint_size = fingerprint_size  # bits
+        self.storage = storage
+        self.semi_sorted = semi_sorted
+        if semi_sorted:
+            if storage != 'flat':
+                raise ValueError("semi_sorted buckets are only available with storage='flat'")
+            self.tables = SemiSortedBucketTable(self.num_buckets, bucket_size, fingerprint_size)
+        else:
+            self.tables = make_bucket_table(storage, self.num_buckets, bucket_size, fingerprint_size)
+        self.count = 0
+        self.victim: Optional[Tuple[int, int]] = None
+        self._init_masks()
+        self._random = random.Random(seed)
+    
+    def _init_masks(self) -> None:
+        """Precompute the bit masks derived from the filter parameters."""
+        self._fingerprint_mask = (1 << self.fingerprint_size) - 1
+        self._bucket_mask = self.num_buckets - 1
     
-    def _my_hash(self, item: Any, i: int) -> int:
+    def _hash(self, item: Any) -> Tuple[int, int]:
         """
-        Generate hash for an item.
+        Derive the fingerprint and primary bucket from one 64-bit hash.
+        
+        The low fingerprint_size bits form the fingerprint and the high 32 bits pick
+        the primary bucket.
         
         Args:
             item: Item to hash
-            i: Index of hash function (0 or 1)
             
         Returns:
-            int: Hash value
+            Tuple[int, int]: (fingerprint, primary bucket); the fingerprint is never 0
+            so that 0 can mark an empty slot on disk
         """
-        s = str(item) + str(i)
-        return int(hashlib.sha256(s.encode()).hexdigest(), 16) % (2 * self.capacity)
+        h = hash_str(str(item), self.seed)
+        return (h & self._fingerprint_mask) or 1, (h >> 32) & self._bucket_mask
     
-    def _fingerprint(self, item: Any) -> int:
+    def _alt_index(self, pos: int, fp: int) -> int:
         """
-        Generate fingerprint for an item.
+        Compute the other candidate bucket of a fingerprint stored in bucket pos.
         
         Args:
-            item: Item to generate fingerprint for
+            pos: Bucket currently holding (or considered for) the fingerprint
+            fp: Fingerprint
             
         Returns:
-            int: Fingerprint value
+            int: pos XOR hash(fp), masked to the table size; applying it twice gives pos
         """
-        s = str(item)
-        return int(hashlib.sha256(s.encode()).hexdigest(), 16) % (2 ** self.fingerprint_size)
+        return (pos ^ (fp * _FINGERPRINT_MULTIPLIER)) & self._bucket_mask
     
     def insert(self, item: Any) -> bool:
         """
         Insert an item into the filter.
         
+        If both candidate buckets are full, a random entry of one of them is evicted
+        to its own alternate bucket, repeating up to max_kicks times. If the last
+        evicted fingerprint still has no place it is kept as the filter's victim, so
+        no stored entry is lost, and the filter reports itself full.
+        
         Args:
             item: Item to insert
             
@@ -76,53 +163,132 @@ class CuckooFilter:
             
         Time Complexity: O(1) amortized
         """
-        fp = self._fingerprint(item)
-        pos1 = self._my_hash(item, 0)
-        pos2 = self._my_hash(item, 1)
+        if self.victim is not None:
+            return False
+        fp, pos = self._hash(item)
+        return self._insert_fingerprint(fp, pos)
+    
+    @classmethod
+    def from_iterable(cls, items: Iterable[Any], capacity: Optional[int] = None,
+                      chunk_size: int = BUILD_CHUNK_SIZE, **kwargs: Any) -> 'CuckooFilter':
+        """
+        Build a filter from any iterable of items using the bulk insertion path.
         
-        if self._insert_into_bucket(fp, pos1):
-            return True
-        if self._insert_into_bucket(fp, pos2):
-            return True
+        Args:
+            items: Items to insert
+            capacity: Number of items the filter is expected to hold; if omitted the
+                items are collected into a list and counted
+            chunk_size: Number of items hashed and placed per batch
+            **kwargs: Further CuckooFilter constructor arguments
+            
+        Returns:
+            CuckooFilter: A filter holding the items (check count if it may be full)
+            
+        Time Complexity: O(n) amortized, vectorized per chunk
+        """
+        if capacity is None:
+            items = list(items)
+            capacity = len(items)
+        cuckoo_filter = cls(capacity, **kwargs)
+        iterator = iter(items)
+        while True:
+            chunk = list(islice(iterator, chunk_size))
+            if not chunk:
+                return cuckoo_filter
+            cuckoo_filter.insert_many(chunk, chunk_size)
+    
+    def insert_many(self, items: Iterable[Any], chunk_size: int = BUILD_CHUNK_SIZE) -> int:
+        """
+        Insert many items at once.
         
-        current_fp = fp
-        current_pos = pos1
-        for _ in range(self.max_kicks):
-            bucket = self.tables[current_pos]
-            for i in range(self.bucket_size):
-                if bucket[i] is not None:
-                    next_fp = bucket[i]
-                    bucket[i] = current_fp
-                    current_fp = next_fp
-                    break
-            
-            if current_pos == pos1:
-                current_pos = pos2
-            else:
-                current_pos = pos1
-            
-            if self._insert_into_bucket(current_fp, current_pos):
-                return True
+        With flat storage each chunk is hashed with NumPy and placed in rounds: for
+        each candidate bucket (primary, then alternate) and each slot, the first
+        pending item of every bucket whose slot is empty is written in one vectorized
+        assignment. Only the items left over after all rounds, whose buckets were
+        already full, go through the scalar kick loop. Semi-sorted buckets are always
+        filled through the scalar path, since every write re-encodes the whole bucket.
         
-        return False
+        The rounds place items out of order, so once the filter fills up the items
+        left out are not a suffix of the input; the returned indices name them.
+        
+        Args:
+            items: Items to insert
+            chunk_size: Number of items hashed and placed per batch
+            
+        Returns:
+            np.ndarray: Ascending int64 indices into items of the items that were not
+            stored because the filter was full; empty when every item was stored
+            
+        Time Complexity: O(n log n) per chunk for the placement rounds, vectorized
+        """
+        items = list(items)
+        unstored = [self._insert_chunk(items[start:start + chunk_size]) + start
+                     for start in range(0, len(items), chunk_size)]
+        return np.concatenate(unstored) if unstored else np.zeros(0, dtype=np.int64)
     
-    def _insert_into_bucket(self, fp: int, pos: int) -> bool:
+    def _insert_chunk(self, items: List[Any]) -> np.ndarray:
+        """Insert one chunk for insert_many and return the indices of the items not stored."""
+        fps, pos1, pos2 = self._hash_many(items)
+        pending = np.arange(len(items), dtype=np.int64)
+        placed = 0
+        
+        if self.storage == 'flat' and not self.semi_sorted and self.victim is None:
+            slots = np.frombuffer(self.tables.slots, dtype=np.uint8 if self.fingerprint_size <= 8 else np.uint16)
+            slots = slots.reshape(self.num_buckets, self.bucket_size)
+            for positions in (pos1, pos2):
+                for slot in range(self.bucket_size):
+                    if len(pending) == 0:
+                        break
+                    buckets, first = np.unique(positions[pending], return_index=True)
+                    free = slots[buckets, slot] == 0
+                    chosen = pending[first[free]]
+                    slots[buckets[free], slot] = fps[chosen]
+                    keep = np.ones(len(pending), dtype=bool)
+                    keep[first[free]] = False
+                    pending = pending[keep]
+                    placed += len(chosen)
+            self.count += placed
+        
+        # _insert_fingerprint always stores the entry, possibly by stashing a victim;
+        # after that the filter is full and the remaining items are not stored
+        pending.sort()
+        for position, index in enumerate(pending):
+            if self.victim is not None:
+                return pending[position:]
+            self._insert_fingerprint(int(fps[index]), int(pos1[index]))
+        return pending[:0]
+    
+    def _insert_fingerprint(self, fp: int, pos: int) -> bool:
         """
-        Try to insert a fingerprint into a bucket.
+        Insert an already hashed entry given its fingerprint and one candidate bucket.
         
         Args:
             fp: Fingerprint to insert
-            pos: Position of bucket
+            pos: Either candidate bucket of the fingerprint
             
         Returns:
-            bool: True if insertion successful, False if bucket is full
+            bool: True if the entry (or a displaced one, as the victim) was stored
         """
-        bucket = self.tables[pos]
-        for i in range(self.bucket_size):
-            if bucket[i] is None:
-                bucket[i] = fp
+        tables = self.tables
+        alt = self._alt_index(pos, fp)
+        if tables.insert(pos, fp) or tables.insert(alt, fp):
+            self.count += 1
+            return True
+        
+        current_fp = fp
+        current_pos = self._random.choice((pos, alt))
+        for _ in range(self.max_kicks):
+            slot = self._random.randrange(self.bucket_size)
+            current_fp = tables.swap(current_pos, slot, current_fp)
+            
+            current_pos = self._alt_index(current_pos, current_fp)
+            if tables.insert(current_pos, current_fp):
+                self.count += 1
                 return True
-        return False
+        
+        self.victim = (current_fp, current_pos)
+        self.count += 1
+        return True
     
     def search(self, target: Any) -> int:
         """
@@ -150,23 +316,67 @@ class CuckooFilter:
             
         Time Complexity: O(1)
         """
-        fp = self._fingerprint(item)
-        pos1 = self._my_hash(item, 0)
-        pos2 = self._my_hash(item, 1)
+        fp, pos1 = self._hash(item)
+        pos2 = self._alt_index(pos1, fp)
         
-        bucket1 = self.tables[pos1]
-        bucket2 = self.tables[pos2]
+        if self.tables.contains(pos1, fp) or self.tables.contains(pos2, fp):
+            return True
         
-        if bucket1 is not None:
-            for i in range(self.bucket_size):
-                if bucket1[i] == fp:
-                    return True
-        if bucket2 is not None:
-            for i in range(self.bucket_size):
-                if bucket2[i] == fp:
-                    return True
+        victim = self.victim
+        return victim is not None and victim[0] == fp and victim[1] in (pos1, pos2)
+    
+    def _hash_many(self, items: Iterable[Any]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Vectorized _hash and _alt_index for many items.
         
-        return False
+        Args:
+            items: Items to hash
+            
+        Returns:
+            Tuple[np.ndarray, np.ndarray, np.ndarray]: uint64 arrays of fingerprints,
+            primary buckets and alternate buckets
+        """
+        hashes = hash64_many([str(item) for item in items], self.seed)
+        fps = hashes & np.uint64(self._fingerprint_mask)
+        fps[fps == 0] = 1
+        bucket_mask = np.uint64(self._bucket_mask)
+        pos1 = (hashes >> np.uint64(32)) & bucket_mask
+        pos2 = (pos1 ^ (fps * np.uint64(_FINGERPRINT_MULTIPLIER))) & bucket_mask
+        return fps, pos1, pos2
+    
+    def search_many(self, targets: Iterable[Any]) -> np.ndarray:
+        """
+        Search for many target items at once.
+        
+        With flat storage the targets are hashed with NumPy and both candidate buckets
+        are gathered from a zero-copy view of the slot array with fancy indexing (or
+        decoded in bulk when the buckets are semi-sorted).
+        
+        Args:
+            targets: Items to search for
+            
+        Returns:
+            np.ndarray: int64 array holding search(target) for each target
+            
+        Time Complexity: O(t * s) where t is the number of targets and s is bucket_size, vectorized
+        """
+        targets = list(targets)
+        if self.storage != 'flat':
+            return np.fromiter(map(self.search, targets), dtype=np.int64, count=len(targets))
+        
+        fps, pos1, pos2 = self._hash_many(targets)
+        if self.semi_sorted:
+            buckets1, buckets2 = self.tables.read_many(pos1), self.tables.read_many(pos2)
+        else:
+            slots = np.frombuffer(self.tables.slots, dtype=np.uint8 if self.fingerprint_size <= 8 else np.uint16)
+            slots = slots.reshape(self.num_buckets, self.bucket_size)
+            buckets1, buckets2 = slots[pos1], slots[pos2]
+        wanted = fps[:, None]
+        found = (buckets1 == wanted).any(axis=1) | (buckets2 == wanted).any(axis=1)
+        if self.victim is not None:
+            victim_fp, victim_pos = self.victim
+            found |= (fps == victim_fp) & ((pos1 == victim_pos) | (pos2 == victim_pos))
+        return np.where(found, 1, -1).astype(np.int64)
     
     def delete(self, item: Any) -> bool:
         """
@@ -180,22 +390,84 @@ class CuckooFilter:
             
         Time Complexity: O(1)
         """
-        fp = self._fingerprint(item)
-        pos1 = self._my_hash(item, 0)
-        pos2 = self._my_hash(item, 1)
+        fp, pos1 = self._hash(item)
+        pos2 = self._alt_index(pos1, fp)
         
-        bucket1 = self.tables[pos1]
-        bucket2 = self.tables[pos2]
+        if self.tables.remove(pos1, fp) or self.tables.remove(pos2, fp):
+            self.count -= 1
+            self._reinsert_victim()
+            return True
         
-        if bucket1 is not None:
-            for i in range(self.bucket_size):
-                if bucket1[i] == fp:
-                    bucket1[i] = None
-                    return True
-        if bucket2 is not None:
-            for i in range(self.bucket_size):
-                if bucket2[i] == fp:
-                    bucket2[i] = None
-                    return True
+        victim = self.victim
+        if victim is not None and victim[0] == fp and victim[1] in (pos1, pos2):
+            self.victim = None
+            self.count -= 1
+            return True
         
         return False
+    
+    def _reinsert_victim(self) -> None:
+        """Move the stashed victim back into the table once a slot has been freed."""
+        if self.victim is None:
+            return
+        fp, pos = self.victim
+        self.victim = None
+        self.count -= 1
+        self._insert_fingerprint(fp, pos)
+    
+    @property
+    def load_factor(self) -> float:
+        """Fraction of table slots in use."""
+        return self.count / (self.num_buckets * self.bucket_size)
+    
+    def save(self, path: str) -> None:
+        """
+        Write the filter to disk as a header followed by the flat or semi-sorted bucket table.
+        
+        Args:
+            path: Destination file path
+            
+        Time Complexity: O(b * s) where b is the number of buckets and s is bucket_size
+        """
+        table = self.tables.to_bytes()
+        victim_fp, victim_pos = self.victim or (0, 0)
+        fields = (self.capacity, self.bucket_size, self.fingerprint_size, self.max_kicks,
+                  self.seed, self.count, self.num_buckets, victim_fp, victim_pos, int(self.semi_sorted))
+        write_file(path, self._MAGIC, _HEADER, fields, [table])
+    
+    @classmethod
+    def load(cls, path: str, verify: bool = True) -> 'CuckooFilter':
+        """
+        Memory-map a filter written by save().
+        
+        Lookups read the mapped file directly, so worker processes loading the same
+        file share one copy in the page cache. The loaded filter is read-only.
+        
+        Args:
+            path: Source file path
+            verify: Whether to check the stored checksum (default: True)
+            
+        Returns:
+            CuckooFilter: A read-only filter backed by the mapped file
+            
+        Time Complexity: O(1) without verification, O(b * s) with it
+        """
+        fields, payload = map_file(path, cls._MAGIC, _HEADER, verify)
+        (capacity, bucket_size, fingerprint_size, max_kicks, seed, count, num_buckets,
+         victim_fp, victim_pos, semi_sorted) = fields
+        cuckoo_filter = cls.__new__(cls)
+        cuckoo_filter.capacity = capacity
+        cuckoo_filter.bucket_size = bucket_size
+        cuckoo_filter.max_kicks = max_kicks
+        cuckoo_filter.seed = seed
+        cuckoo_filter.num_buckets = num_buckets
+        cuckoo_filter.fingerprint_size = fingerprint_size
+        cuckoo_filter.storage = 'flat'
+        cuckoo_filter.semi_sorted = bool(semi_sorted)
+        table_class = SemiSortedBucketTable if semi_sorted else FlatBucketTable
+        cuckoo_filter.tables = table_class(num_buckets, bucket_size, fingerprint_size, payload)
+        cuckoo_filter.count = count
+        cuckoo_filter.victim = (victim_fp, victim_pos) if victim_fp else None
+        cuckoo_filter._init_masks()
+        cuckoo_filter._random = random.Random(seed)
+        return cuckoo_filter
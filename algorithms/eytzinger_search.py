@@ -0,0 +1,152 @@
+"""
+This module provides a sorted-index search over keys stored in Eytzinger (BFS) order.
+The implicit search tree keeps the first levels of every descent at the front of the
+array, and fixed-width integer key prefixes settle most comparisons without touching
+the full strings.
+"""
+
+from typing import Iterable, List
+
+import numpy as np
+
+PREFIX_BYTES = 8
+
+
+def eytzinger_ranks(n: int) -> np.ndarray:
+    """
+    Compute the sorted position of every node of an n-node Eytzinger tree.
+    
+    Node k (1-based) at depth d has children 2k and 2k + 1. Its in-order position is
+    found by sorting the nodes on (2k + 1) << (D - d), where D is the depth of the
+    deepest node: left descendants of k sort below that key and right descendants above.
+    
+    Args:
+        n: Number of keys
+        
+    Returns:
+        np.ndarray: int64 array of length n + 1 where entry k is the sorted index held by
+        node k; entry 0 is unused and set to -1
+    """
+    nodes = np.arange(1, n + 1, dtype=np.int64)
+    depth = np.floor(np.log2(nodes)).astype(np.int64)
+    order_keys = (2 * nodes + 1) << (int(depth[-1]) - depth) if n else nodes
+    ranks = np.full(n + 1, -1, dtype=np.int64)
+    ranks[1 + np.argsort(order_keys, kind='stable')] = np.arange(n, dtype=np.int64)
+    return ranks
+
+
+def key_prefixes(keys: Iterable[str]) -> np.ndarray:
+    """
+    Pack the first PREFIX_BYTES UTF-8 bytes of each key into a big-endian integer.
+    
+    Shorter keys are zero-padded, so comparing prefixes as unsigned integers orders keys
+    exactly like comparing the strings themselves, except that equal prefixes tie.
+    
+    Args:
+        keys: Strings to encode
+        
+    Returns:
+        np.ndarray: uint64 array of prefixes, one per key
+    """
+    encoded = np.array([key.encode() for key in keys], dtype=f'S{PREFIX_BYTES}')
+    return encoded.view('>u8').astype(np.uint64).reshape(-1)
+
+
+class EytzingerSearch:
+    """
+    A binary search over keys laid out in Eytzinger (breadth-first) order.
+    
+    Node k of the implicit tree is stored at index k and its children at 2k and 2k + 1,
+    so a descent reads positions 1, 2-3, 4-7, ... and the top levels shared by every
+    lookup sit together at the front of the array. The descent has no early exit and
+    moves with k = 2k + (key[k] < target), which makes every lookup the same sequence
+    of steps; the answer is recovered at the end by dropping the trailing right turns.
+    
+    Each node also keeps an 8-byte integer prefix of its key. search_many descends with
+    vectorized prefix comparisons and only compares full strings where prefixes tie;
+    the scalar search compares the strings directly, which in CPython is a single C
+    comparison and cheaper than building the target's prefix. A rank array maps every
+    node back to its index in the original sorted array, so search returns the same
+    indexes as BinarySearch.
+    
+    Space complexity is O(n): one prefix, one key reference and one rank per key.
+    """
+    
+    def __init__(self, arr: List[str]) -> None:
+        """
+        Initialize with the sorted input array.
+        
+        Args:
+            arr: Sorted list of strings to be searched through
+            
+        Time Complexity: O(n log n) to compute the layout
+        Space Complexity: O(n) for the prefixes, key references and ranks
+        """
+        self.arr = arr
+        self.size = len(arr)
+        self.ranks = eytzinger_ranks(self.size)
+        order = self.ranks[1:]
+        self.keys = np.empty(self.size + 1, dtype=object)
+        self.keys[0] = ''
+        self.keys[1:] = np.array(arr, dtype=object).reshape(-1)[order]
+        self.prefixes = np.zeros(self.size + 1, dtype=np.uint64)
+        self.prefixes[1:] = key_prefixes(arr)[order]
+        
+        # Plain lists make the scalar descent avoid NumPy scalar overhead
+        self._key_list: List[str] = self.keys.tolist()
+        self._rank_list: List[int] = self.ranks.tolist()
+    
+    def search(self, target: str) -> int:
+        """
+        Search for a target string by descending the Eytzinger tree.
+        
+        Args:
+            target: String to search for
+            
+        Returns:
+            int: Index of the target in the original sorted array (its leftmost
+            occurrence), or -1 if not found
+            
+        Time Complexity: O(log n) where n is the array length
+        """
+        keys, n = self._key_list, self.size
+        k = 1
+        while k <= n:
+            k = 2 * k + (keys[k] < target)
+        k >>= (k ^ (k + 1)).bit_length()
+        if k and keys[k] == target:
+            return self._rank_list[k]
+        return -1
+    
+    def search_many(self, targets: Iterable[str]) -> np.ndarray:
+        """
+        Search for many target strings at once.
+        
+        All targets descend together, one tree level per step, with the prefix
+        comparisons vectorized and full string comparisons only for tied prefixes.
+        
+        Args:
+            targets: Strings to search for
+            
+        Returns:
+            np.ndarray: int64 array holding search(target) for each target
+            
+        Time Complexity: O(t log n) where t is the number of targets, vectorized
+        """
+        wanted = np.array(list(targets), dtype=object).reshape(-1)
+        prefix = key_prefixes(wanted)
+        n = self.size
+        k = np.ones(len(wanted), dtype=np.int64)
+        for _ in range(n.bit_length()):
+            active = k <= n
+            node = np.where(active, k, 0)
+            node_prefix = self.prefixes[node]
+            less = node_prefix < prefix
+            tied = np.flatnonzero(active & (node_prefix == prefix))
+            less[tied] = self.keys[node[tied]] < wanted[tied]
+            k = np.where(active, 2 * k + less, k)
+        
+        trailing = ((k ^ (k + 1)) + 1).astype(np.float64)
+        k >>= np.log2(trailing).astype(np.int64)
+        found = (k > 0) & (self.keys[k] == wanted)
+        return np.where(found, self.ranks[k], -1).astype(np.int64)
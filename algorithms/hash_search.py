@@ -2,7 +2,14 @@
 This module provides a hash table-based search algorithm with O(1) average time complexity.
 """
 
-from typing import List, Dict
+from itertools import repeat
+from typing import Dict, Iterable, List, Union
+
+import numpy as np
+
+from .compact_hash_table import CompactHashTable
+
+HASH_TABLE_STORAGES = ('dict', 'compact')
 
 
 class HashSearch:
@@ -11,19 +18,35 @@ class HashSearch:
     
     This class creates a hash table from the input array for O(1) average case lookups.
     The space complexity is O(n) where n is the size of the input array.
+    
+    The table is a dict by default. storage='compact' uses a CompactHashTable instead,
+    which keeps the keys in one UTF-8 blob and needs about half the memory, at the
+    cost of slower single lookups; it can also be saved and memory-mapped by worker
+    processes. Both return the same results.
     """
     
-    def __init__(self, arr: List[str]) -> None:
+    def __init__(self, arr: List[str], storage: str = 'dict') -> None:
         """
         Initialize the hash table with the input array.
         
         Args:
             arr: List of strings to be searched through
+            storage: Hash table storage, 'dict' or 'compact' (default: 'dict')
+            
+        Raises:
+            ValueError: If storage is not a known storage name
             
         Time Complexity: O(n) for initialization
         Space Complexity: O(n) for hash table storage
         """
-        self.hash_table: Dict[str, int] = {item: index for index, item in enumerate(arr)}
+        if storage not in HASH_TABLE_STORAGES:
+            raise ValueError(f"Unknown hash table storage '{storage}', expected one of {sorted(HASH_TABLE_STORAGES)}")
+        self.storage = storage
+        self.hash_table: Union[Dict[str, int], CompactHashTable]
+        if storage == 'compact':
+            self.hash_table = CompactHashTable(arr)
+        else:
+            self.hash_table = {item: index for index, item in enumerate(arr)}
     
     def search(self, target: str) -> int:
         """
@@ -38,3 +61,55 @@ class HashSearch:
         Time Complexity: O(1) average case
         """
         return self.hash_table.get(target, -1)
+    
+    def search_many(self, targets: Iterable[str]) -> np.ndarray:
+        """
+        Search for many target strings at once.
+        
+        With dict storage the lookups run through map() over the table's get method,
+        so the loop stays in C instead of making one Python-level call per target.
+        Compact storage probes all targets in vectorized rounds.
+        
+        Args:
+            targets: Strings to search for
+            
+        Returns:
+            np.ndarray: int64 array holding search(target) for each target
+            
+        Time Complexity: O(t) average case where t is the number of targets
+        """
+        if isinstance(self.hash_table, CompactHashTable):
+            return self.hash_table.get_many(targets)
+        targets = list(targets)
+        return np.fromiter(map(self.hash_table.get, targets, repeat(-1)), dtype=np.int64, count=len(targets))
+    
+    def save(self, path: str) -> None:
+        """
+        Write a compact hash table to disk.
+        
+        Args:
+            path: Destination file path
+            
+        Raises:
+            ValueError: If the table does not use compact storage
+        """
+        if not isinstance(self.hash_table, CompactHashTable):
+            raise ValueError("Only compact storage can be saved")
+        self.hash_table.save(path)
+    
+    @classmethod
+    def load(cls, path: str, verify: bool = True) -> 'HashSearch':
+        """
+        Memory-map a compact hash table written by save().
+        
+        Args:
+            path: Source file path
+            verify: Whether to check the stored checksum (default: True)
+            
+        Returns:
+            HashSearch: A read-only search backed by the mapped file
+        """
+        hash_search = cls.__new__(cls)
+        hash_search.storage = 'compact'
+        hash_search.hash_table = CompactHashTable.load(path, verify)
+        return hash_search
@@ -0,0 +1,171 @@
+"""
+This module provides a deterministic, seedable 64-bit hash shared by the filter implementations.
+Unlike the built-in hash(), which is salted per process by PYTHONHASHSEED, these hashes are
+stable across processes and machines, so filters built in one process can be reused in another.
+"""
+
+from functools import lru_cache
+from typing import Sequence, Tuple
+
+import numpy as np
+
+_GOLDEN = 0x9E3779B97F4A7C15
+_PRIME_KEY = 0x6A09E667F3BCC908  # seed tweaks for the modulus and the output key
+_MULTIPLIER_KEY = 0xBB67AE8584CAA73B
+_OFFSET_KEY = 0x3C6EF372FE94F82B
+_MASK64 = 0xFFFFFFFFFFFFFFFF
+_MASK61 = (1 << 61) - 1
+_OFFSET_BITS = 20  # moduli are primes 2^61 - c with c < 2^20, of which there are about 25,000
+_WITNESSES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37)  # deterministic below 3.3 * 10^24
+
+
+def fmix64(h: int) -> int:
+    """
+    Apply the MurmurHash3 64-bit finalizer, a bijective avalanche mix.
+    
+    Args:
+        h: Unsigned 64-bit value
+        
+    Returns:
+        int: Mixed unsigned 64-bit value
+    """
+    h ^= h >> 33
+    h = (h * 0xFF51AFD7ED558CCD) & _MASK64
+    h ^= h >> 33
+    h = (h * 0xC4CEB9FE1A85EC53) & _MASK64
+    h ^= h >> 33
+    return h
+
+
+def _is_prime(n: int) -> bool:
+    """Test an odd n > 37 below 2^64 for primality with deterministic Miller-Rabin."""
+    d, s = n - 1, 0
+    while not d & 1:
+        d, s = d >> 1, s + 1
+    for witness in _WITNESSES:
+        x = pow(witness, d, n)
+        if x in (1, n - 1):
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+
+@lru_cache(maxsize=64)
+def _keys(seed: int) -> Tuple[int, int, int]:
+    """
+    Derive the modulus and output key of a seed.
+    
+    Args:
+        seed: 64-bit seed
+        
+    Returns:
+        Tuple[int, int, int]: Offset c of the prime modulus q = 2^61 - c, odd
+        multiplier and additive offset of the output key
+    """
+    seed &= _MASK64
+    offset = fmix64(seed ^ _PRIME_KEY) % (1 << _OFFSET_BITS) | 1
+    while not _is_prime((1 << 61) - offset):
+        offset += 2  # stays well below 2^21, which _reduce_many relies on
+    return offset, fmix64(seed ^ _MULTIPLIER_KEY) | 1, fmix64(seed ^ _OFFSET_KEY)
+
+
+def hash64(data: bytes, seed: int = 0) -> int:
+    """
+    Compute the seeded 64-bit hash of a byte string.
+    
+    The bytes are read as one little-endian integer and reduced modulo a prime
+    q = 2^61 - c chosen by the seed, which CPython does in a single C-level big-int
+    operation. Two distinct inputs of equal length collide only when q divides the
+    difference of their integers, which has at most 8 * len(data) / 60 prime factors
+    this large out of the roughly 25,000 candidate moduli, so seeds give independent
+    hash functions and no pair of inputs collides under every seed. The residue goes
+    through a seed-keyed affine map modulo 2^64, which also mixes in the length, and
+    is finished with fmix64.
+    
+    Args:
+        data: Bytes to hash
+        seed: 64-bit seed selecting an independent hash function (default: 0)
+        
+    Returns:
+        int: Unsigned 64-bit hash value
+        
+    Time Complexity: O(len(data))
+    """
+    offset, multiplier, key = _keys(seed)
+    residue = int.from_bytes(data, 'little') % ((1 << 61) - offset)
+    return fmix64((residue * multiplier + (key ^ (len(data) * _GOLDEN))) & _MASK64)
+
+
+def hash_str(item: str, seed: int = 0) -> int:
+    """
+    Compute the 64-bit hash of a string's UTF-8 encoding.
+    
+    Args:
+        item: String to hash
+        seed: 64-bit seed selecting an independent hash function (default: 0)
+        
+    Returns:
+        int: Unsigned 64-bit hash value
+    """
+    return hash64(item.encode(), seed)
+
+
+def fmix64_many(h: np.ndarray) -> np.ndarray:
+    """Apply fmix64 element-wise to a uint64 array (multiplication wraps modulo 2^64)."""
+    h = h ^ (h >> np.uint64(33))
+    h = h * np.uint64(0xFF51AFD7ED558CCD)
+    h = h ^ (h >> np.uint64(33))
+    h = h * np.uint64(0xC4CEB9FE1A85EC53)
+    return h ^ (h >> np.uint64(33))
+
+
+def _reduce_many(x: np.ndarray, offset: int) -> np.ndarray:
+    """
+    Reduce a uint64 array of values below 2^62 modulo q = 2^61 - c element-wise.
+    
+    Folding the bits above 2^61 with 2^61 = c mod q leaves values below q + 2c, so
+    one conditional subtraction finishes the reduction.
+    """
+    q = np.uint64((1 << 61) - offset)
+    x = (x & np.uint64(_MASK61)) + (x >> np.uint64(61)) * np.uint64(offset)
+    return x - np.where(x >= q, q, np.uint64(0))
+
+
+def hash64_many(items: Sequence[str], seed: int = 0) -> np.ndarray:
+    """
+    Compute hash_str for many strings at once with NumPy.
+    
+    The UTF-8 encodings are packed into a zero-padded fixed-width matrix viewed as
+    little-endian 32-bit limbs, and each item's integer is reduced modulo q with
+    Horner's rule from its most significant limb down. The zero padding only adds
+    leading zero limbs, so the results are identical to hash_str element for element.
+    
+    Args:
+        items: Strings to hash
+        seed: 64-bit seed selecting an independent hash function (default: 0)
+        
+    Returns:
+        np.ndarray: uint64 array of hash values, one per item
+        
+    Time Complexity: O(total length of items), vectorized over items
+    """
+    encoded = [item.encode() for item in items]
+    if not encoded:
+        return np.zeros(0, dtype=np.uint64)
+    lengths = np.fromiter(map(len, encoded), dtype=np.uint64, count=len(encoded))
+    width = max(4, -(-int(lengths.max()) // 4) * 4)
+    limbs = np.array(encoded, dtype=f'S{width}').view('<u4').reshape(len(encoded), width // 4)
+    
+    offset, multiplier, key = _keys(seed)
+    low29 = np.uint64((1 << 29) - 1)
+    residues = np.zeros(len(encoded), dtype=np.uint64)
+    for column in range(limbs.shape[1] - 1, -1, -1):
+        # h * 2^32 = (h >> 29) * 2^61 + (h & low29) * 2^32, and 2^61 = c mod q
+        shifted = (residues >> np.uint64(29)) * np.uint64(offset) + ((residues & low29) << np.uint64(32))
+        residues = _reduce_many(shifted + limbs[:, column].astype(np.uint64), offset)
+    return fmix64_many(residues * np.uint64(multiplier) + (np.uint64(key) ^ (lengths * np.uint64(_GOLDEN))))
@@ -0,0 +1,178 @@
+"""
+This module provides an interpolation search over a sorted array of strings.
+Key prefixes are mapped to integers to estimate where a target lies between two known
+keys, which takes O(log log n) probes on uniformly distributed keys.
+"""
+
+from math import isqrt
+from os.path import commonprefix
+from typing import List, Tuple
+
+import numpy as np
+
+from .binary_search import BinarySearch
+
+PREFIX_BYTES = 8
+
+
+class InterpolationSearch(BinarySearch):
+    """
+    An interpolation-sequential search over the same sorted array as BinarySearch.
+    
+    The search keeps two probed keys known to bracket the target. Every key between
+    them shares their common prefix, so the next guess interpolates on the integer
+    formed by the PREFIX_BYTES bytes following it: over the whole array that is the
+    first and last name, and once the range is inside one name it is the uuid4 suffix,
+    which is close to uniform. Each guess is checked with a guard probe sqrt(size)
+    past it; a guess the guard does not bracket counts as bad and is followed by a
+    bisection step, and after max_bad_guesses bad guesses the search bisects for the
+    rest of the lookup, so it never takes more than about twice the probes of a binary
+    search.
+    
+    On uniform keys a lookup takes O(log log n) probes (about 9 for 200,000 uuids,
+    against 17 for a binary search). The skewed name prefixes cost a few extra probes
+    instead, and in CPython the integer mapping makes each probe several times slower
+    than a plain comparison, so the probe counts rather than the wall time show the
+    difference. search_many is inherited from BinarySearch.
+    """
+    
+    def __init__(self, arr: List[str], max_bad_guesses: int = 2) -> None:
+        """
+        Initialize with the sorted input array.
+        
+        Args:
+            arr: Sorted list of strings to be searched through
+            max_bad_guesses: Bad interpolation guesses allowed before falling back to
+                bisection (default: 2)
+                
+        Time Complexity: O(total key length) to collect the key alphabet
+        Space Complexity: O(1) besides the array reference
+        """
+        super().__init__(arr)
+        self.max_bad_guesses = max_bad_guesses
+        
+        # Reading bytes in base 256 leaves gaps wherever the alphabet has them (uuid hex
+        # digits jump from '9' to 'a'), which skews every estimate; renumbering the k
+        # bytes that occur in the keys as 0..k-1 and reading in base k removes the gaps.
+        blob = np.frombuffer(b''.join(key.encode() for key in arr), dtype=np.uint8)
+        ranks = np.zeros(256, dtype=np.uint8)
+        alphabet = np.unique(blob)
+        ranks[alphabet] = np.arange(len(alphabet))
+        self._ranks = ranks.tobytes()
+        self._base = max(len(alphabet), 2)
+    
+    def _prefix_value(self, encoded: bytes, start: int) -> int:
+        """
+        Map the PREFIX_BYTES bytes of a key from start on to an integer.
+        
+        Args:
+            encoded: UTF-8 encoding of the key
+            start: Offset of the first byte to read
+            
+        Returns:
+            int: The bytes' ranks read as a zero-padded base-k integer; bytes that do not
+            occur in the keys, which only targets can hold, also map to rank 0
+        """
+        value = 0
+        digits = encoded[start:start + PREFIX_BYTES].translate(self._ranks)
+        for digit in digits.ljust(PREFIX_BYTES, b'\0'):
+            value = value * self._base + digit
+        return value
+    
+    def _search(self, target: str) -> Tuple[int, int]:
+        """
+        Search for a target string and count the probes taken.
+        
+        Args:
+            target: String to search for
+            
+        Returns:
+            Tuple[int, int]: Index of the target in the array, or -1 if not found, and
+            the number of array entries compared against the target
+        """
+        arr = self.arr
+        if not arr:
+            return -1, 0
+        if target <= arr[0]:
+            return (0 if arr[0] == target else -1), 1
+        if target >= arr[-1]:
+            return (len(arr) - 1 if arr[-1] == target else -1), 2
+        
+        # arr[low] < target < arr[high]; the target can only be strictly between them
+        low, high = 0, len(arr) - 1
+        low_key, high_key = arr[low].encode(), arr[high].encode()
+        encoded = target.encode()
+        probes = 2
+        bad_guesses = 0
+        bisect_next = False
+        
+        while high - low > 1:
+            interpolate = not bisect_next and bad_guesses < self.max_bad_guesses
+            guess = (low + high) // 2
+            if interpolate:
+                start = len(commonprefix((low_key, high_key)))
+                low_value = self._prefix_value(low_key, start)
+                span = self._prefix_value(high_key, start) - low_value
+                if span > 0:
+                    offset = (self._prefix_value(encoded, start) - low_value) * (high - low) // span
+                    guess = min(max(low + offset, low + 1), high - 1)
+            step = isqrt(high - low)
+            
+            key = arr[guess]
+            probes += 1
+            if key == target:
+                return guess, probes
+            below = key < target
+            if below:
+                low, low_key = guess, key.encode()
+            else:
+                high, high_key = guess, key.encode()
+            bisect_next = False
+            if not interpolate:
+                continue
+            
+            # A good guess lands within about sqrt(size) of the target, so a guard probe
+            # that far past it cuts the range to sqrt(size). If the target lies beyond the
+            # guard too, the guess was bad and the next step bisects instead.
+            guard = guess + step if below else guess - step
+            if not low < guard < high:
+                continue
+            key = arr[guard]
+            probes += 1
+            if key == target:
+                return guard, probes
+            if key < target:
+                low, low_key = guard, key.encode()
+            else:
+                high, high_key = guard, key.encode()
+            if (key < target) == below:
+                bad_guesses += 1
+                bisect_next = True
+        return -1, probes
+    
+    def search(self, target: str) -> int:
+        """
+        Search for a target string using interpolation search.
+        
+        Args:
+            target: String to search for
+            
+        Returns:
+            int: Index of the target in the array, or -1 if not found
+            
+        Time Complexity: O(log log n) expected for uniformly distributed keys,
+        O(log n) worst case
+        """
+        return self._search(target)[0]
+    
+    def probe_count(self, target: str) -> int:
+        """
+        Count the array entries search compares against a target.
+        
+        Args:
+            target: String to search for
+            
+        Returns:
+            int: Number of probes search(target) makes
+        """
+        return self._search(target)[1]
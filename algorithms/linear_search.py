@@ -2,7 +2,98 @@
 This module provides a linear search algorithm with O(n) time complexity.
 """
 
-from typing import List
+from typing import Callable, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from .aho_corasick import AhoCorasick
+
+LINEAR_SEARCH_ENGINES = ('loop', 'packed')
+SEARCH_MODES = ('exact', 'prefix', 'substring')
+
+_SELECTIVITY_SAMPLE = 4096  # keys examined when choosing the filter word
+_NO_MATCH_LENGTH = np.iinfo(np.uint32).max  # length given to targets too long to match
+
+
+def pack_targets(encoded: List[bytes], width: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Pack encoded targets into the word layout of a packed key matrix.
+    
+    Args:
+        encoded: UTF-8 encodings of the targets
+        width: Padded key width of the matrix in bytes, a multiple of 8
+        
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: uint64 matrix of shape (width // 8, t) holding the
+        targets' words, and their uint32 byte lengths; targets longer than width get a
+        length no key has, so they never match
+    """
+    fits = [len(item) <= width for item in encoded]
+    rows = np.array([item if fit else b'' for item, fit in zip(encoded, fits)], dtype=f'S{width}')
+    words = np.ascontiguousarray(rows.view('<u8').reshape(len(encoded), width // 8).T)
+    lengths = np.array([len(item) if fit else _NO_MATCH_LENGTH for item, fit in zip(encoded, fits)],
+                       dtype=np.uint32)
+    return words, lengths
+
+
+def first_matches(columns: np.ndarray, lengths: np.ndarray, filter_column: int, start: int, stop: int,
+                  target_words: np.ndarray, target_lengths: np.ndarray, chunk_rows: int = 1 << 16,
+                  cancelled: Optional[Callable[[], bool]] = None) -> Optional[np.ndarray]:
+    """
+    Find the first row holding each of a batch of targets in one pass over a packed matrix.
+    
+    The rows are scanned in chunks. In each chunk the filter column is tested against
+    the set of all target filter words at once, and the few candidate rows are paired
+    with the targets sharing their filter word and verified on every word and the length.
+    The scan stops once every target has a match.
+    
+    Args:
+        columns: Column-major uint64 key matrix, as built by LinearSearch
+        lengths: uint32 byte lengths of the keys
+        filter_column: Word column compared against the targets first
+        start: First row to scan
+        stop: One past the last row to scan
+        target_words: Target words, as returned by pack_targets
+        target_lengths: Target lengths, as returned by pack_targets
+        chunk_rows: Rows scanned per chunk (default: 65536)
+        cancelled: Called before each chunk; the scan is abandoned when it returns True
+        
+    Returns:
+        Optional[np.ndarray]: int64 array with the first row holding each target, or -1;
+        None if the scan was cancelled
+        
+    Time Complexity: O((stop - start) + t log t) plus the verification of candidate rows
+    """
+    results = np.full(target_words.shape[1], -1, dtype=np.int64)
+    if not len(results):
+        return results
+    order = np.argsort(target_words[filter_column], kind='stable')
+    filter_words = target_words[filter_column, order]
+    for chunk_start in range(start, stop, chunk_rows):
+        if cancelled is not None and cancelled():
+            return None
+        chunk = columns[filter_column, chunk_start:min(stop, chunk_start + chunk_rows)]
+        rows = np.flatnonzero(np.isin(chunk, filter_words))
+        if not len(rows):
+            continue
+        
+        # pair every candidate row with each target sharing its filter word
+        lows = np.searchsorted(filter_words, chunk[rows], side='left')
+        highs = np.searchsorted(filter_words, chunk[rows], side='right')
+        repeats = highs - lows
+        pair_rows = np.repeat(rows + chunk_start, repeats)
+        ranks = np.arange(repeats.sum()) - np.repeat(np.cumsum(repeats) - repeats, repeats)
+        pair_targets = order[np.repeat(lows, repeats) + ranks]
+        same = (columns[:, pair_rows] == target_words[:, pair_targets]).all(axis=0)
+        same &= lengths[pair_rows] == target_lengths[pair_targets]
+        
+        # rows ascend, so the first match of each target still unresolved wins
+        matched_targets, first = np.unique(pair_targets[same], return_index=True)
+        unresolved = results[matched_targets] < 0
+        results[matched_targets[unresolved]] = pair_rows[same][first[unresolved]]
+        if (results >= 0).all():
+            break
+    return results
 
 
 class LinearSearch:
@@ -10,20 +101,103 @@ class LinearSearch:
     A linear search implementation that provides sequential lookups.
     
     This class stores an array and performs linear search for O(n) lookups.
-    The space complexity is O(1) as it only stores references to the input array.
+    
+    The 'loop' engine compares the Python strings one by one and only stores a
+    reference to the input array. The default 'packed' engine also packs the UTF-8
+    keys, zero-padded to a common width, into a column-major matrix of 64-bit words
+    with a separate length array. A lookup compares one word column against the
+    target's word in a single vectorized pass, then checks the few candidates on all
+    words and the length. The column is the one that tells keys apart best, which for
+    login names of the form first + last + uuid is a uuid word, so the pass leaves
+    almost no candidates. Both engines return the first index holding the target.
+    
+    The array must only be extended through append() after construction, so the
+    packed matrix stays in step with it.
     """
     
-    def __init__(self, arr: List[str]) -> None:
+    def __init__(self, arr: List[str], engine: str = 'packed') -> None:
         """
         Initialize with the input array.
         
         Args:
             arr: List of strings to be searched through
+            engine: Scan engine, 'loop' or 'packed' (default: 'packed')
             
-        Time Complexity: O(1) for initialization
-        Space Complexity: O(1) for storing array reference
+        Raises:
+            ValueError: If engine is not a known engine name
+            
+        Time Complexity: O(1) for the loop engine, O(n * w) for the packed engine
+        where w is the longest key length
+        Space Complexity: O(1) for the loop engine, O(n * w) for the packed engine
         """
+        if engine not in LINEAR_SEARCH_ENGINES:
+            raise ValueError(f"Unknown linear search engine '{engine}', expected one of {sorted(LINEAR_SEARCH_ENGINES)}")
         self.arr = arr
+        self.engine = engine
+        if engine == 'packed':
+            encoded = [item.encode() for item in arr]
+            self._pack(encoded, max(8, len(encoded)))
+    
+    def _pack(self, encoded: List[bytes], capacity: int) -> None:
+        """
+        Pack encoded keys into a fresh word matrix with room for capacity keys.
+        
+        Args:
+            encoded: UTF-8 encodings of the keys, in order
+            capacity: Number of keys the matrix can hold before it has to grow
+        """
+        self.count = len(encoded)
+        self.width = max(8, -(-max(map(len, encoded), default=0) // 8) * 8)
+        rows = np.array(encoded, dtype=f'S{self.width}').view('<u8').reshape(len(encoded), self.width // 8)
+        self.columns = np.zeros((self.width // 8, capacity), dtype=np.uint64)
+        self.columns[:, :self.count] = rows.T
+        self.lengths = np.zeros(capacity, dtype=np.uint32)
+        self.lengths[:self.count] = np.fromiter(map(len, encoded), dtype=np.uint32, count=self.count)
+        self._choose_filter_column()
+    
+    def _choose_filter_column(self) -> None:
+        """Filter on the word column with the most distinct values in a sample of keys."""
+        sample = self.columns[:, :min(self.count, _SELECTIVITY_SAMPLE)]
+        distinct = [len(np.unique(column)) for column in sample]
+        self.filter_column = int(np.argmax(distinct))
+    
+    def _words(self, encoded: bytes) -> np.ndarray:
+        """Return the target's zero-padded 64-bit words."""
+        return np.frombuffer(encoded.ljust(self.width, b'\0'), dtype='<u8')
+    
+    def append(self, item: str) -> None:
+        """
+        Append a string to the array (and to the packed matrix).
+        
+        The matrix doubles its capacity when full and is repacked wider when the new
+        key is longer than the current width. The filter column is chosen again each
+        time the matrix doubles and once the keys fill the selectivity sample, so an
+        array grown from empty filters on the same column as one packed in one go.
+        
+        Args:
+            item: String to append
+            
+        Time Complexity: O(len(item)) amortized, O(n * w) when the matrix is repacked wider
+        """
+        if self.engine == 'packed':
+            encoded = item.encode()
+            capacity = self.columns.shape[1]
+            if len(encoded) > self.width:
+                self._pack([key.encode() for key in self.arr] + [encoded], 2 * capacity)
+            else:
+                grew = self.count == capacity
+                if grew:
+                    columns = np.zeros((self.columns.shape[0], 2 * capacity), dtype=np.uint64)
+                    columns[:, :capacity] = self.columns
+                    lengths = np.zeros(2 * capacity, dtype=np.uint32)
+                    lengths[:capacity] = self.lengths
+                    self.columns, self.lengths = columns, lengths
+                self.columns[:, self.count] = self._words(encoded)
+                self.lengths[self.count] = len(encoded)
+                self.count += 1
+                if grew or self.count == _SELECTIVITY_SAMPLE:
+                    self._choose_filter_column()
+        self.arr.append(item)
     
     def search(self, target: str) -> int:
         """
@@ -37,7 +211,77 @@ class LinearSearch:
             
         Time Complexity: O(n) where n is the array length
         """
+        if self.engine == 'packed':
+            encoded = target.encode()
+            if len(encoded) > self.width:
+                return -1
+            words = self._words(encoded)
+            n = self.count
+            candidates = np.flatnonzero(self.columns[self.filter_column, :n] == words[self.filter_column])
+            if len(candidates):
+                same = (self.columns[:, candidates] == words[:, None]).all(axis=0)
+                matches = candidates[same & (self.lengths[candidates] == len(encoded))]
+                if len(matches):
+                    return int(matches[0])
+            return -1
+        
         for i in range(len(self.arr)):
             if self.arr[i] == target:
                 return i
         return -1
+    
+    def search_many(self, targets: Iterable[str], mode: str = 'exact') -> np.ndarray:
+        """
+        Search for many target strings in a single pass over the array.
+        
+        In 'exact' mode the packed engine tests every key against all targets at once
+        with first_matches, and the loop engine streams the array once, looking each
+        string up in a dict of the pending targets. The 'prefix' and 'substring' modes
+        stream the array once through an Aho-Corasick automaton of the targets, matching
+        targets that start or occur anywhere in a string. Every mode stops as soon as
+        each target has a match.
+        
+        Args:
+            targets: Strings to search for
+            mode: 'exact', 'prefix' or 'substring' (default: 'exact')
+            
+        Returns:
+            np.ndarray: int64 array holding, for each target, the first index of a string
+            equal to it, starting with it or containing it, or -1 if there is none
+            
+        Raises:
+            ValueError: If mode is not a known search mode
+            
+        Time Complexity: O(n + t) for exact lookups and O(L + t) for prefix and substring
+        lookups, where L is the total length of the strings, plus the matches reported
+        """
+        if mode not in SEARCH_MODES:
+            raise ValueError(f"Unknown search mode '{mode}', expected one of {sorted(SEARCH_MODES)}")
+        targets = list(targets)
+        if mode == 'exact' and self.engine == 'packed':
+            target_words, target_lengths = pack_targets([target.encode() for target in targets], self.width)
+            return first_matches(self.columns, self.lengths, self.filter_column, 0, self.count,
+                                 target_words, target_lengths)
+        
+        results = [-1] * len(targets)
+        if mode == 'exact':
+            pending = {}
+            for position, target in enumerate(targets):
+                pending.setdefault(target, []).append(position)
+            for index, item in enumerate(self.arr):
+                if not pending:
+                    break
+                for position in pending.pop(item, ()):
+                    results[position] = index
+        else:
+            automaton = AhoCorasick(targets)
+            matches = automaton.prefixes if mode == 'prefix' else automaton.occurrences
+            remaining = len(targets)
+            for index, item in enumerate(self.arr):
+                if not remaining:
+                    break
+                for position in matches(item):
+                    if results[position] < 0:
+                        results[position] = index
+                        remaining -= 1
+        return np.array(results, dtype=np.int64)
@@ -0,0 +1,212 @@
+"""
+This module provides a multi-core linear search over keys held in shared memory.
+The packed key matrix of LinearSearch is placed in a multiprocessing.shared_memory block
+that a process pool scans partition by partition, testing each key against a whole batch
+of targets in one pass.
+"""
+
+import os
+import weakref
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from multiprocessing import shared_memory
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+
+from .linear_search import LinearSearch, first_matches, pack_targets
+
+# shared memory blocks attached by this worker process, by name
+_attached: Dict[str, shared_memory.SharedMemory] = {}
+
+
+def _scan_partition(name: str, num_words: int, count: int, filter_column: int, generation: int,
+                    start: int, stop: int, target_words: np.ndarray, target_lengths: np.ndarray,
+                    chunk_rows: int) -> Optional[np.ndarray]:
+    """
+    Scan rows start..stop-1 of a shared key matrix for a batch of targets.
+    
+    Runs in a worker process and scans with first_matches. Before each chunk the
+    shared control word is checked, and the scan is abandoned if the search that
+    submitted it has already been answered.
+    
+    Args:
+        name: Name of the shared memory block
+        num_words: Number of 64-bit words per key
+        count: Number of keys in the block
+        filter_column: Word column compared against the targets first
+        generation: Number of the search this scan belongs to
+        start: First row of the partition
+        stop: One past the last row of the partition
+        target_words: uint64 matrix of shape (num_words, t) holding the targets' words
+        target_lengths: uint32 byte lengths of the targets
+        chunk_rows: Rows scanned between two checks of the control word
+        
+    Returns:
+        Optional[np.ndarray]: int64 array with the first row in the partition holding
+        each target, or -1; None if the scan was cancelled
+    """
+    if name not in _attached:
+        _attached[name] = shared_memory.SharedMemory(name=name)
+    buffer = _attached[name].buf
+    control = np.ndarray(1, dtype=np.uint64, buffer=buffer)
+    columns = np.ndarray((num_words, count), dtype=np.uint64, buffer=buffer, offset=8)
+    lengths = np.ndarray(count, dtype=np.uint32, buffer=buffer, offset=8 + columns.nbytes)
+    
+    return first_matches(columns, lengths, filter_column, start, stop, target_words, target_lengths,
+                         chunk_rows, lambda: control[0] >= generation)
+
+
+def _release(executor: Optional[ProcessPoolExecutor], block: shared_memory.SharedMemory) -> None:
+    """Shut down the worker pool and free the shared memory block."""
+    if executor is not None:
+        executor.shutdown(wait=True, cancel_futures=True)
+    block.close()
+    block.unlink()
+
+
+class ParallelLinearSearch:
+    """
+    A linear search that scans partitions of a shared key matrix on several cores.
+    
+    The keys are packed as in LinearSearch's 'packed' engine and copied, with a control
+    word, into one multiprocessing.shared_memory block, so worker processes read them
+    without copying or pickling. The rows are split into one partition per worker.
+    search_many sends the whole batch of targets to every partition, and each worker
+    tests its rows against all targets at once with first_matches, so the keys are
+    scanned once per batch rather than once per target.
+    
+    A partition scan stops as soon as every target has a match in it, and once the
+    leading finished partitions hold a match for every target the search writes its
+    number to the control word, which makes the workers abandon the partitions after
+    them. Results are the same as LinearSearch: the first index holding each target.
+    
+    The worker pool starts on the first search. Call close(), or use the instance as a
+    context manager, to stop the workers and free the shared memory.
+    """
+    
+    def __init__(self, arr: List[str], workers: Optional[int] = None, chunk_rows: int = 1 << 16) -> None:
+        """
+        Pack the keys into shared memory.
+        
+        Args:
+            arr: List of strings to be searched through
+            workers: Number of worker processes and partitions (default: os.cpu_count())
+            chunk_rows: Rows a worker scans between checks for cancellation (default: 65536)
+            
+        Raises:
+            ValueError: If workers or chunk_rows is less than 1
+            
+        Time Complexity: O(n * w) to pack the keys, where w is the longest key length
+        Space Complexity: O(n * w) bytes of shared memory
+        """
+        self.workers = workers or os.cpu_count() or 1
+        if self.workers < 1 or chunk_rows < 1:
+            raise ValueError("workers and chunk_rows must be positive")
+        self.arr = arr
+        self.chunk_rows = chunk_rows
+        
+        packed = LinearSearch(arr)
+        self.count = packed.count
+        self.width = packed.width
+        self.filter_column = packed.filter_column
+        num_words = self.width // 8
+        size = 8 + self.count * num_words * 8 + self.count * 4
+        self._block = shared_memory.SharedMemory(create=True, size=size)
+        self._control = np.ndarray(1, dtype=np.uint64, buffer=self._block.buf)
+        self._control[0] = 0
+        columns = np.ndarray((num_words, self.count), dtype=np.uint64, buffer=self._block.buf, offset=8)
+        columns[:] = packed.columns[:, :self.count]
+        lengths = np.ndarray(self.count, dtype=np.uint32, buffer=self._block.buf, offset=8 + columns.nbytes)
+        lengths[:] = packed.lengths[:self.count]
+        del columns, lengths
+        
+        self.bounds = np.linspace(0, self.count, self.workers + 1).astype(np.int64)
+        self._generation = 0
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._finalizer = weakref.finalize(self, _release, None, self._block)
+    
+    def __enter__(self) -> 'ParallelLinearSearch':
+        return self
+    
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+    
+    def close(self) -> None:
+        """Stop the worker processes and free the shared memory; safe to call twice."""
+        if self._finalizer.alive:
+            self._control = None
+            self._finalizer.detach()
+            _release(self._executor, self._block)
+            self._executor = None
+    
+    def _pool(self) -> ProcessPoolExecutor:
+        """Return the worker pool, starting it on first use."""
+        if not self._finalizer.alive:
+            raise ValueError("ParallelLinearSearch is closed")
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+            self._finalizer.detach()
+            self._finalizer = weakref.finalize(self, _release, self._executor, self._block)
+        return self._executor
+    
+    def search(self, target: str) -> int:
+        """
+        Search for a target string on all cores.
+        
+        Args:
+            target: String to search for
+            
+        Returns:
+            int: Index of the target in the array, or -1 if not found
+            
+        Time Complexity: O(n / p) per worker for p workers
+        """
+        return int(self.search_many([target])[0])
+    
+    def search_many(self, targets: Iterable[str]) -> np.ndarray:
+        """
+        Search for many target strings in one parallel pass over the keys.
+        
+        Args:
+            targets: Strings to search for
+            
+        Returns:
+            np.ndarray: int64 array holding, for each target, the first index holding
+            it in the array, or -1 if not found
+            
+        Time Complexity: O((n + t) / p) per worker for t targets and p workers, plus
+        the verification of candidate rows
+        """
+        encoded = [target.encode() for target in targets]
+        results = np.full(len(encoded), -1, dtype=np.int64)
+        if not encoded or not self.count:
+            return results
+        
+        target_words, target_lengths = pack_targets(encoded, self.width)
+        
+        pool = self._pool()
+        self._generation += 1
+        futures: List[Future] = [
+            pool.submit(_scan_partition, self._block.name, self.width // 8, self.count, self.filter_column,
+                        self._generation, int(start), int(stop), target_words, target_lengths, self.chunk_rows)
+            for start, stop in zip(self.bounds[:-1], self.bounds[1:])]
+        
+        partials: List[Optional[np.ndarray]] = [None] * len(futures)
+        finished = 0  # leading partitions whose results are merged
+        pending = set(futures)
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                partials[futures.index(future)] = future.result()
+            while finished < len(futures) and partials[finished] is not None:
+                partial = partials[finished]
+                unresolved = results < 0
+                results[unresolved] = partial[unresolved]
+                finished += 1
+            if (results >= 0).all() and pending:
+                # later partitions can only hold later occurrences
+                self._control[0] = self._generation
+                for future in pending:
+                    future.cancel()
+                break
+        return results
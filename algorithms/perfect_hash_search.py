@@ -0,0 +1,317 @@
+"""
+This module provides an exact-match search built on a minimal perfect hash function.
+A BBHash-style cascade of bit arrays maps each of the n distinct keys to its own slot in
+0..n-1 using about 3.5 bits per key, and the keys are stored in slot order for verification.
+"""
+
+import math
+import struct
+from typing import Dict, Iterable, List
+
+import numpy as np
+
+from .hashing import fmix64, fmix64_many, hash64, hash64_many
+from .serialization import map_file, write_file
+from .string_store import StringStore
+
+# number of keys, number of placed keys, number of levels, seed, gamma
+_HEADER = struct.Struct('<QQQQd')
+
+_GOLDEN = 0x9E3779B97F4A7C15
+_MASK64 = 0xFFFFFFFFFFFFFFFF
+_BLOCK_WORDS = 8  # words per rank block, one 64-byte cache line
+
+MAX_LEVELS = 32
+
+
+def _level_seed(seed: int, level: int) -> int:
+    """Return the 64-bit value mixed into the key hashes at a level."""
+    return (seed ^ ((level + 1) * _GOLDEN)) & _MASK64
+
+
+class PerfectHashSearch:
+    """
+    A static hash index with one slot per key and no empty slots.
+    
+    The minimal perfect hash function follows BBHash. Level 0 is a bit array of
+    gamma * n bits; every key hashes to one bit, and the bits hit by exactly one key
+    are set and claim those keys. The keys that collided move on to the next level,
+    a bit array gamma times their number, and so on. The rank of a key's set bit, the
+    number of set bits before it across all levels, is its slot. Keys still colliding
+    after MAX_LEVELS levels, which only happens for 64-bit hash collisions, go into a
+    small fallback dict.
+    
+    With gamma=2 the bit arrays take about 3.3 bits per key and the rank directory,
+    one uint64 count per 512 bits, another 0.4. The keys are stored in slot order in a
+    StringStore next to an int32 array of their original indexes, so a lookup is one
+    hash, a bit test per level, a rank and a comparison with the stored key, and
+    search() returns the same index as HashSearch: the last occurrence of the key.
+    """
+    
+    _MAGIC = b'PHSH'
+    
+    def __init__(self, arr: List[str], gamma: float = 2.0, seed: int = 0) -> None:
+        """
+        Build the perfect hash index over the input array.
+        
+        Args:
+            arr: List of strings to be searched through
+            gamma: Bits per remaining key at each level; larger values build faster
+                and look up in fewer levels at the cost of memory (default: 2.0)
+            seed: Seed of the hash functions (default: 0)
+            
+        Raises:
+            ValueError: If gamma is less than 1 or arr holds 2^31 or more strings
+            
+        Time Complexity: O(n + total length of strings), vectorized
+        Space Complexity: O(n) bits for the hash function, plus the stored keys
+        """
+        if gamma < 1:
+            raise ValueError("gamma must be at least 1")
+        if len(arr) >= 2 ** 31:
+            raise ValueError("PerfectHashSearch holds at most 2^31 - 1 strings")
+        self.gamma = gamma
+        self.seed = seed
+        
+        hashes = hash64_many(arr, seed)
+        indexes = self._last_occurrences(arr, hashes)
+        hashes = hashes[indexes]
+        level_words = []
+        slot_keys = []
+        remaining = np.arange(len(indexes), dtype=np.int64)
+        for level in range(MAX_LEVELS):
+            if not len(remaining):
+                break
+            size = -(-math.ceil(gamma * len(remaining)) // 64) * 64
+            positions = fmix64_many(hashes[remaining] ^ np.uint64(_level_seed(seed, level))) % np.uint64(size)
+            positions = positions.astype(np.int64)
+            unique = np.bincount(positions, minlength=size)[positions] == 1
+            bits = np.zeros(size, dtype=bool)
+            bits[positions[unique]] = True
+            level_words.append(np.packbits(bits, bitorder='little').view('<u8'))
+            # set bits are ranked in position order, so claimed keys take slots in that order
+            claimed = remaining[unique]
+            slot_keys.append(claimed[np.argsort(positions[unique])])
+            remaining = remaining[~unique]
+        
+        self.num_levels = len(level_words)
+        self._init_levels([len(words) for words in level_words])
+        self.words = np.concatenate(level_words) if level_words else np.zeros(0, dtype=np.uint64)
+        self.block_ranks = self._block_ranks(self.words)
+        self.placed = sum(map(len, slot_keys))
+        order = np.concatenate(slot_keys + [remaining])
+        self.indexes = indexes[order].astype(np.int32)
+        self.store = StringStore(arr[index] for index in self.indexes)
+        self._init_fallback()
+    
+    @staticmethod
+    def _last_occurrences(arr: List[str], hashes: np.ndarray) -> np.ndarray:
+        """
+        Find the index of the last occurrence of every distinct key.
+        
+        Args:
+            arr: Input strings
+            hashes: hash64 value of each string
+            
+        Returns:
+            np.ndarray: int64 array of indexes, one per distinct key
+        """
+        order = np.argsort(hashes, kind='stable')
+        sorted_hashes = hashes[order]
+        run_starts = np.flatnonzero(np.r_[True, sorted_hashes[1:] != sorted_hashes[:-1]])
+        run_lengths = np.diff(np.r_[run_starts, len(order)])
+        singles = order[run_starts[run_lengths == 1]]
+        # keys sharing a hash are almost always duplicates; compare those few exactly
+        shared: Dict[str, int] = {}
+        for start, length in zip(run_starts[run_lengths > 1], run_lengths[run_lengths > 1]):
+            for index in sorted(order[start:start + length]):
+                shared[arr[index]] = index
+        return np.sort(np.concatenate([singles, np.fromiter(shared.values(), dtype=np.int64, count=len(shared))]))
+    
+    @staticmethod
+    def _block_ranks(words: np.ndarray) -> np.ndarray:
+        """Return the number of set bits before each block of _BLOCK_WORDS words."""
+        counts = np.bitwise_count(words).astype(np.uint64)
+        padded = np.zeros(-(-len(words) // _BLOCK_WORDS) * _BLOCK_WORDS, dtype=np.uint64)
+        padded[:len(words)] = counts
+        per_block = padded.reshape(-1, _BLOCK_WORDS).sum(axis=1)
+        return np.concatenate([[0], np.cumsum(per_block)])[:len(per_block)].astype(np.uint64)
+    
+    def _init_levels(self, level_lengths: List[int]) -> None:
+        """Record each level's first word and bit count, and its hash seed."""
+        self._level_offsets = np.concatenate([[0], np.cumsum(level_lengths)[:-1]]).astype(np.int64)
+        self._levels = [(int(offset), length * 64, _level_seed(self.seed, level))
+                        for level, (offset, length) in enumerate(zip(self._level_offsets, level_lengths))]
+    
+    def _init_fallback(self) -> None:
+        """Create the fallback dict of unplaced keys and views for fast scalar access."""
+        self._fallback = {self.store[slot]: slot for slot in range(self.placed, len(self.store))}
+        self._word_bytes = memoryview(self.words).cast('B')
+        self._word_view = self._word_bytes.cast('Q')
+        self._rank_view = memoryview(self.block_ranks).cast('B').cast('Q')
+        self._index_view = memoryview(self.indexes).cast('B').cast('i')
+    
+    def __len__(self) -> int:
+        """Number of distinct keys in the index."""
+        return len(self.store)
+    
+    def _slot(self, encoded: bytes) -> int:
+        """
+        Evaluate the perfect hash function.
+        
+        Args:
+            encoded: UTF-8 encoding of a key
+            
+        Returns:
+            int: The key's slot if it is in the index, otherwise some slot or -1
+        """
+        h = hash64(encoded, self.seed)
+        words = self._word_view
+        for offset, size, level_seed in self._levels:
+            position = fmix64(h ^ level_seed) % size
+            word = offset + (position >> 6)
+            bit = position & 63
+            if words[word] >> bit & 1:
+                # set bits before the block, then before the word, then below the bit
+                block = word // _BLOCK_WORDS
+                preceding = self._word_bytes[block * _BLOCK_WORDS * 8:word * 8]
+                return (self._rank_view[block] + int.from_bytes(preceding, 'little').bit_count()
+                        + (words[word] & ((1 << bit) - 1)).bit_count())
+        return self._fallback.get(encoded.decode(), -1)
+    
+    def search(self, target: str) -> int:
+        """
+        Search for a target string.
+        
+        Args:
+            target: String to search for
+            
+        Returns:
+            int: Index of the target in the original array (its last occurrence), or -1
+            if not found
+            
+        Time Complexity: O(1) expected; a key is found at level l with probability
+        about (1 - e^(-1 / gamma))^l
+        """
+        encoded = target.encode()
+        slot = self._slot(encoded)
+        if slot < 0 or self.store.get_bytes(slot) != encoded:
+            return -1
+        return self._index_view[slot]
+    
+    def search_many(self, targets: Iterable[str]) -> np.ndarray:
+        """
+        Search for many target strings at once.
+        
+        All targets are hashed with hash64_many and pass through the levels together;
+        ranks are computed from the block directory and vectorized popcounts, and the
+        candidates are confirmed against the stored keys in bulk.
+        
+        Args:
+            targets: Strings to search for
+            
+        Returns:
+            np.ndarray: int64 array holding search(target) for each target
+            
+        Time Complexity: O(t) expected where t is the number of targets
+        """
+        targets = list(targets)
+        hashes = hash64_many(targets, self.seed)
+        slots = np.full(len(targets), -1, dtype=np.int64)
+        active = np.arange(len(targets), dtype=np.int64)
+        for offset, size, level_seed in self._levels:
+            if not len(active):
+                break
+            positions = fmix64_many(hashes[active] ^ np.uint64(level_seed)) % np.uint64(size)
+            positions = positions.astype(np.int64)
+            word_indexes = offset + (positions >> 6)
+            bits = (positions & 63).astype(np.uint64)
+            words = self.words[word_indexes]
+            hit = ((words >> bits) & np.uint64(1)).astype(bool)
+            
+            word_indexes, bits, words = word_indexes[hit], bits[hit], words[hit]
+            blocks = word_indexes // _BLOCK_WORDS
+            ranks = self.block_ranks[blocks].copy()
+            for step in range(_BLOCK_WORDS - 1):
+                previous = blocks * _BLOCK_WORDS + step
+                before = previous < word_indexes
+                ranks[before] += np.bitwise_count(self.words[previous[before]]).astype(np.uint64)
+            below = words & ((np.uint64(1) << bits) - np.uint64(1))
+            slots[active[hit]] = (ranks + np.bitwise_count(below)).astype(np.int64)
+            active = active[~hit]
+        for target in active:
+            slots[target] = self._fallback.get(targets[target], -1)
+        
+        results = np.full(len(targets), -1, dtype=np.int64)
+        candidates = np.flatnonzero(slots >= 0)
+        encoded = [targets[target].encode() for target in candidates]
+        matched = candidates[self.store.equal_many(slots[candidates], encoded)]
+        results[matched] = self.indexes[slots[matched]]
+        return results
+    
+    @property
+    def bits_per_key(self) -> float:
+        """Bits per key used by the hash function: the level bit arrays and rank directory."""
+        return (self.words.nbytes + self.block_ranks.nbytes) * 8 / max(1, len(self))
+    
+    @property
+    def nbytes(self) -> int:
+        """Number of bytes used by the hash function, the index array and the stored keys."""
+        return self.words.nbytes + self.block_ranks.nbytes + self.indexes.nbytes + self.store.nbytes
+    
+    def save(self, path: str) -> None:
+        """
+        Write the index to disk as a header followed by the levels, ranks, indexes and keys.
+        
+        Args:
+            path: Destination file path
+            
+        Time Complexity: O(n + total length of strings)
+        """
+        fields = (len(self.store), self.placed, self.num_levels, self.seed, self.gamma)
+        level_lengths = np.array([size // 64 for _, size, _ in self._levels], dtype=np.uint64)
+        indexes = self.indexes.tobytes() + bytes(-self.indexes.nbytes % 8)
+        payload = [level_lengths, self.words, self.block_ranks, indexes, self.store.offsets, self.store.blob]
+        write_file(path, self._MAGIC, _HEADER, fields, payload)
+    
+    @classmethod
+    def load(cls, path: str, verify: bool = True) -> 'PerfectHashSearch':
+        """
+        Memory-map an index written by save().
+        
+        Lookups read the mapped file directly, so worker processes loading the same
+        file share one copy in the page cache. The loaded index is read-only.
+        
+        Args:
+            path: Source file path
+            verify: Whether to check the stored checksum (default: True)
+            
+        Returns:
+            PerfectHashSearch: An index backed by the mapped file
+            
+        Time Complexity: O(1) plus the fallback keys without verification, O(size) with it
+        """
+        fields, payload = map_file(path, cls._MAGIC, _HEADER, verify)
+        num_keys, placed, num_levels, seed, gamma = fields
+        level_lengths = np.frombuffer(payload[:num_levels * 8], dtype=np.uint64).astype(np.int64)
+        num_words = int(level_lengths.sum())
+        num_blocks = -(-num_words // _BLOCK_WORDS)
+        
+        words_start = num_levels * 8
+        ranks_start = words_start + num_words * 8
+        indexes_start = ranks_start + num_blocks * 8
+        offsets_start = indexes_start + -(-num_keys * 4 // 8) * 8
+        blob_start = offsets_start + (num_keys + 1) * 8
+        
+        index = cls.__new__(cls)
+        index.gamma = gamma
+        index.seed = seed
+        index.num_levels = num_levels
+        index.placed = placed
+        index._init_levels(level_lengths.tolist())
+        index.words = np.frombuffer(payload[words_start:ranks_start], dtype=np.uint64)
+        index.block_ranks = np.frombuffer(payload[ranks_start:indexes_start], dtype=np.uint64)
+        index.indexes = np.frombuffer(payload[indexes_start:indexes_start + num_keys * 4], dtype=np.int32)
+        index.store = StringStore(offsets=payload[offsets_start:blob_start], blob=payload[blob_start:])
+        index._init_fallback()
+        return index
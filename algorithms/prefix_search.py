@@ -0,0 +1,152 @@
+"""
+This module provides a sorted-index search over fixed-width key prefixes.
+The first 16 bytes of every key are packed into a NumPy array that np.searchsorted bisects
+in C, and candidates are confirmed against the full keys held in a compact string store.
+"""
+
+from typing import Iterable, List
+
+import numpy as np
+
+from .string_store import StringStore
+
+PREFIX_BYTES = 16
+
+
+class PrefixSearch:
+    """
+    A binary search over a packed array of fixed-width key prefixes.
+    
+    Each key contributes its first 16 UTF-8 bytes, zero-padded, to a NumPy 'S16' array.
+    NumPy compares these byte strings lexicographically, which orders them exactly like
+    the keys themselves except that keys sharing their first 16 bytes tie. A lookup
+    bisects the prefix array for the run of equal prefixes, which for login names of the
+    form first + last + uuid is almost always a single entry, and confirms it against
+    the full key in a StringStore.
+    
+    Unlike BinarySearch, no Python string objects are kept: memory is 16 bytes of prefix
+    plus the UTF-8 bytes and an 8-byte offset per key. Batch lookups bisect all targets in
+    one np.searchsorted call.
+    """
+    
+    def __init__(self, arr: List[str]) -> None:
+        """
+        Initialize with the sorted input array.
+        
+        Args:
+            arr: Sorted list of strings to be searched through
+            
+        Time Complexity: O(n) to pack the prefixes and the string store
+        Space Complexity: O(n) for the prefixes, plus the UTF-8 bytes of the keys
+        """
+        self.store = StringStore(arr)
+        self.prefixes = self._pack(arr)
+    
+    @staticmethod
+    def _pack(keys: Iterable[str]) -> np.ndarray:
+        """Return the 'S16' prefix array of keys (NumPy truncates longer encodings)."""
+        return np.array([key.encode() for key in keys], dtype=f'S{PREFIX_BYTES}').reshape(-1)
+    
+    def __len__(self) -> int:
+        """Number of keys in the index."""
+        return len(self.store)
+    
+    def _resolve(self, encoded: bytes, left: int, right: int) -> int:
+        """
+        Find a key among the entries left..right-1 that share its prefix.
+        
+        Args:
+            encoded: UTF-8 encoding of the target
+            left: First index of the run of equal prefixes
+            right: One past the last index of the run
+            
+        Returns:
+            int: Leftmost index in the run holding the target, or -1 if not found
+        """
+        get_bytes = self.store.get_bytes
+        while left < right:
+            mid = (left + right) // 2
+            if get_bytes(mid) < encoded:
+                left = mid + 1
+            else:
+                right = mid
+        if left < len(self.store) and get_bytes(left) == encoded:
+            return left
+        return -1
+    
+    def search(self, target: str) -> int:
+        """
+        Search for a target string.
+        
+        Args:
+            target: String to search for
+            
+        Returns:
+            int: Index of the target in the array (its leftmost occurrence), or -1 if not found
+            
+        Time Complexity: O(log n) where n is the array length
+        """
+        encoded = target.encode()
+        prefix = encoded[:PREFIX_BYTES]
+        left = int(self.prefixes.searchsorted(prefix))
+        if left == len(self.store) or self.prefixes[left] != prefix:
+            return -1
+        if self.store.get_bytes(left) == encoded:
+            return left
+        right = int(self.prefixes.searchsorted(prefix, side='right'))
+        return self._resolve(encoded, left + 1, right)
+    
+    def search_many(self, targets: Iterable[str]) -> np.ndarray:
+        """
+        Search for many target strings at once.
+        
+        Every target's run of equal prefixes is found with two vectorized
+        np.searchsorted calls. Runs longer than one key (for example many users sharing
+        a 16-byte first + last name) are then narrowed by a vectorized lower-bound bisect
+        on the full keys, gathered from the string store's blob as padded byte matrices
+        and compared at their first differing byte. A final gather confirms each match.
+        
+        Args:
+            targets: Strings to search for
+            
+        Returns:
+            np.ndarray: int64 array holding search(target) for each target
+            
+        Time Complexity: O(t log n) where t is the number of targets, vectorized
+        """
+        encoded = [target.encode() for target in targets]
+        n = len(self.store)
+        if n == 0 or not encoded:
+            return np.full(len(encoded), -1, dtype=np.int64)
+        wanted = np.array(encoded, dtype=f'S{PREFIX_BYTES}').reshape(-1)
+        lefts = np.searchsorted(self.prefixes, wanted, side='left')
+        rights = np.searchsorted(self.prefixes, wanted, side='right')
+        
+        target_lengths = np.fromiter(map(len, encoded), dtype=np.intp, count=len(encoded))
+        width = max(1, int(target_lengths.max()))
+        target_bytes = np.array(encoded, dtype=f'S{width}').view(np.uint8).reshape(len(encoded), width)
+        
+        active = np.flatnonzero(rights - lefts > 1)
+        while len(active):
+            low, high = lefts[active], rights[active]
+            mid = (low + high) // 2
+            keys, key_lengths = self.store.gather(mid, width)
+            wanted_bytes = target_bytes[active]
+            differs = keys != wanted_bytes
+            first = differs.argmax(axis=1)
+            rows = np.arange(len(active))
+            less = np.where(differs.any(axis=1), keys[rows, first] < wanted_bytes[rows, first],
+                            key_lengths < target_lengths[active])
+            lefts[active] = np.where(less, mid + 1, low)
+            rights[active] = np.where(less, high, mid)
+            active = active[lefts[active] < rights[active]]
+        
+        candidates = np.minimum(lefts, n - 1)
+        keys, key_lengths = self.store.gather(candidates, width)
+        matched = (lefts < n) & (key_lengths == target_lengths) & (keys == target_bytes).all(axis=1)
+        return np.where(matched, lefts, -1).astype(np.int64)
+    
+    @property
+    def nbytes(self) -> int:
+        """Number of bytes used by the prefix array and the string store."""
+        return self.prefixes.nbytes + self.store.nbytes
@@ -0,0 +1,184 @@
+"""
+This module provides a scalable Bloom filter that grows as items are added.
+New filter slices are chained on demand with geometrically tightening error rates, so the
+overall false-positive rate stays bounded without ever rebuilding the existing slices.
+"""
+
+from typing import Iterable, List, Optional
+
+import numpy as np
+
+from .bloom_filter import BUILD_CHUNK_SIZE, BloomFilter
+
+DEFAULT_INITIAL_CAPACITY = 1024
+
+
+class ScalableBloomFilter:
+    """
+    A scalable Bloom filter built from a chain of BloomFilter slices.
+    
+    Slice i holds initial_capacity * growth^i items at a false-positive rate of
+    p * (1 - r) * r^i, where p is the overall target and r is the tightening ratio.
+    Since these rates sum to at most p, the compound false-positive rate stays below p
+    however many slices are added. Items are added to the newest slice only; once it
+    holds its capacity its bits are about half set, the fill ratio at which a filter with
+    the optimal number of probes meets its target, and a new, larger slice is started.
+    
+    A lookup checks every slice, so it costs O(k * s) for s slices, with s growing only
+    logarithmically in the number of items. Each slice uses its own hash seed, which
+    keeps false positives in different slices independent.
+    """
+    
+    def __init__(self, arr: List[str], initial_capacity: Optional[int] = None,
+                 false_positive_rate: float = 0.01, growth: int = 2,
+                 tightening_ratio: float = 0.85, storage: str = 'packed', seed: int = 0) -> None:
+        """
+        Initialize the scalable Bloom filter with a list of strings.
+        
+        Args:
+            arr: List of strings to add to the filter
+            initial_capacity: Number of items held by the first slice
+                (default: len(arr), at least DEFAULT_INITIAL_CAPACITY)
+            false_positive_rate: Upper bound on the overall false-positive rate
+            growth: Capacity multiplier between consecutive slices, at least 1
+            tightening_ratio: Error-rate multiplier between consecutive slices,
+                strictly between 0 and 1
+            storage: Bit array storage engine for the slices, 'packed' or 'list'
+            seed: Seed for the first slice's hash; slice i uses seed + i
+            
+        Raises:
+            ValueError: If any of the growth parameters is out of range
+            
+        Time Complexity: O(n * k) where n is len(arr) and k is the number of probes
+        Space Complexity: O(m) where m is the total number of bits over all slices
+        """
+        if not 0 < false_positive_rate < 1:
+            raise ValueError("false_positive_rate must be strictly between 0 and 1")
+        if growth < 1:
+            raise ValueError("growth must be at least 1")
+        if not 0 < tightening_ratio < 1:
+            raise ValueError("tightening_ratio must be strictly between 0 and 1")
+        
+        if initial_capacity is None:
+            initial_capacity = max(len(arr), DEFAULT_INITIAL_CAPACITY)
+        self.initial_capacity = max(1, initial_capacity)
+        self.false_positive_rate = false_positive_rate
+        self.growth = growth
+        self.tightening_ratio = tightening_ratio
+        self.storage = storage
+        self.seed = seed
+        self.slices: List[BloomFilter] = []
+        
+        self._add_slice()
+        self.add_many(arr)
+    
+    def _add_slice(self) -> BloomFilter:
+        """Start a new slice with the next capacity and error rate in the sequence."""
+        index = len(self.slices)
+        capacity = self.initial_capacity * self.growth ** index
+        error_rate = self.false_positive_rate * (1 - self.tightening_ratio) * self.tightening_ratio ** index
+        bloom_filter = BloomFilter([], storage=self.storage, capacity=capacity,
+                                   false_positive_rate=error_rate, seed=self.seed + index)
+        self.slices.append(bloom_filter)
+        return bloom_filter
+    
+    def _current_slice(self) -> BloomFilter:
+        """Return the slice new items go to, starting a new one if the last is full."""
+        current = self.slices[-1]
+        if current.count >= current.capacity:
+            current = self._add_slice()
+        return current
+    
+    def add(self, item: str) -> None:
+        """
+        Add an item to the newest slice, growing the filter if that slice is full.
+        
+        Args:
+            item: String to add to the filter
+            
+        Time Complexity: O(k) amortized, where k is the number of probes
+        """
+        self._current_slice()._add(item)
+    
+    def add_many(self, items: Iterable[str], chunk_size: int = BUILD_CHUNK_SIZE) -> None:
+        """
+        Add many items at once using each slice's bulk insertion path.
+        
+        Items are split at slice boundaries so every slice is filled exactly to its
+        capacity before the next one is started.
+        
+        Args:
+            items: Strings to add to the filter
+            chunk_size: Number of items hashed per batch
+            
+        Time Complexity: O(n * k), vectorized per chunk
+        """
+        items = list(items)
+        start = 0
+        while start < len(items):
+            current = self._current_slice()
+            end = start + min(current.capacity - current.count, chunk_size)
+            current._add_many(items[start:end], chunk_size)
+            start = end
+    
+    def search(self, target: str) -> int:
+        """
+        Check if a target string might be in the set.
+        
+        Args:
+            target: String to search for
+            
+        Returns:
+            int: 1 if the target might be in the set, -1 if definitely not in the set
+            
+        Time Complexity: O(k * s) where s is the number of slices
+        """
+        for bloom_filter in reversed(self.slices):
+            if bloom_filter.search(target) == 1:
+                return 1
+        return -1
+    
+    def search_many(self, targets: Iterable[str]) -> np.ndarray:
+        """
+        Check many target strings at once.
+        
+        Args:
+            targets: Strings to search for
+            
+        Returns:
+            np.ndarray: int64 array holding search(target) for each target
+            
+        Time Complexity: O(t * k * s) where t is the number of targets, vectorized
+        """
+        targets = list(targets)
+        found = np.zeros(len(targets), dtype=bool)
+        for bloom_filter in self.slices:
+            found |= bloom_filter.search_many(targets) == 1
+        return np.where(found, 1, -1).astype(np.int64)
+    
+    def __len__(self) -> int:
+        """Number of items added over all slices."""
+        return sum(bloom_filter.count for bloom_filter in self.slices)
+    
+    @property
+    def capacity(self) -> int:
+        """Number of items the current slices can hold before another slice is added."""
+        return sum(bloom_filter.capacity for bloom_filter in self.slices)
+    
+    @property
+    def nbytes(self) -> int:
+        """Total number of bytes used by the bit arrays of all slices."""
+        return sum(bloom_filter.bit_array.nbytes for bloom_filter in self.slices)
+    
+    @property
+    def expected_false_positive_rate(self) -> float:
+        """
+        Estimate the current overall false-positive rate.
+        
+        Returns:
+            float: 1 - prod(1 - p_i) over the estimated rates p_i of the slices
+        """
+        miss = 1.0
+        for bloom_filter in self.slices:
+            miss *= 1 - bloom_filter.expected_false_positive_rate
+        return 1 - miss
@@ -0,0 +1,263 @@
+"""
+This module provides a scalable Cuckoo filter that grows instead of reporting itself full.
+Larger Cuckoo sub-filters are chained on demand, so signups keep being absorbed without
+dropping keys, without long displacement loops, and without rebuilding the existing tables.
+"""
+
+from typing import Any, Iterable, List, Optional
+
+import numpy as np
+
+from .bucket_table import make_bucket_table
+from .cuckoo_filter import BUILD_CHUNK_SIZE, CuckooFilter, _bucket_count
+
+DEFAULT_INITIAL_CAPACITY = 1024
+MAX_FINGERPRINT_SIZE = 16
+
+
+class ScalableCuckooFilter:
+    """
+    A scalable Cuckoo filter built from a chain of CuckooFilter sub-filters.
+    
+    Items are inserted into the newest sub-filter only. Once its load factor reaches
+    fill_ratio, or a displacement loop fails and stashes a victim, a new sub-filter with
+    growth times the capacity is started, so inserts never run into the long kick loops
+    of a nearly full table. Each new sub-filter also uses one more fingerprint bit (up to
+    16), which keeps the compound false-positive rate roughly constant as sub-filters
+    are added, and its own hash seed, which keeps their false positives independent.
+    
+    A lookup or delete checks every sub-filter, so it costs O(s) for s sub-filters, with
+    s growing only logarithmically in the number of items. Growth stops at max_memory
+    bytes of bucket tables, after which insert reports the filter full like CuckooFilter.
+    """
+    
+    def __init__(self, initial_capacity: int = DEFAULT_INITIAL_CAPACITY, growth: int = 2,
+                 fill_ratio: float = 0.9, max_memory: Optional[int] = None, bucket_size: int = 4,
+                 max_kicks: int = 500, seed: int = 0, fingerprint_size: int = 8,
+                 storage: str = 'flat') -> None:
+        """
+        Initialize the scalable Cuckoo filter with one empty sub-filter.
+        
+        Args:
+            initial_capacity: Number of items the first sub-filter is sized for
+            growth: Capacity multiplier between consecutive sub-filters, at least 2
+            fill_ratio: Load factor at which a sub-filter stops taking new items,
+                strictly between 0 and 1 (default: 0.9)
+            max_memory: Maximum total bytes of bucket tables, or None for no limit
+            bucket_size: Number of entries per bucket (default: 4)
+            max_kicks: Maximum number of displacement attempts per insert (default: 500)
+            seed: Seed for the first sub-filter; sub-filter i uses seed + i
+            fingerprint_size: Fingerprint width of the first sub-filter in bits (default: 8)
+            storage: Bucket table storage engine, 'flat' or 'list' (default: 'flat')
+            
+        Raises:
+            ValueError: If any of the growth parameters is out of range, or the first
+                sub-filter alone would exceed max_memory
+                
+        Time Complexity: O(initial_capacity)
+        Space Complexity: O(initial_capacity)
+        """
+        if growth < 2:
+            raise ValueError("growth must be at least 2")
+        if not 0 < fill_ratio < 1:
+            raise ValueError("fill_ratio must be strictly between 0 and 1")
+        
+        self.initial_capacity = max(1, initial_capacity)
+        self.growth = growth
+        self.fill_ratio = fill_ratio
+        self.max_memory = max_memory
+        self.bucket_size = bucket_size
+        self.max_kicks = max_kicks
+        self.seed = seed
+        self.fingerprint_size = fingerprint_size
+        self.storage = storage
+        self.filters: List[CuckooFilter] = []
+        
+        if self._add_filter() is None:
+            raise ValueError(f"max_memory={max_memory} is too small for the first sub-filter")
+    
+    @classmethod
+    def from_iterable(cls, items: Iterable[Any], initial_capacity: Optional[int] = None,
+                      chunk_size: int = BUILD_CHUNK_SIZE, **kwargs: Any) -> 'ScalableCuckooFilter':
+        """
+        Build a filter from any iterable of items using the bulk insertion path.
+        
+        Args:
+            items: Items to insert
+            initial_capacity: Number of items the first sub-filter is sized for; if
+                omitted the items are collected into a list and counted
+            chunk_size: Number of items hashed and placed per batch
+            **kwargs: Further ScalableCuckooFilter constructor arguments
+            
+        Returns:
+            ScalableCuckooFilter: A filter holding the items (check len() if max_memory is set)
+            
+        Time Complexity: O(n) amortized, vectorized per chunk
+        """
+        items = list(items)
+        if initial_capacity is None:
+            initial_capacity = max(len(items), DEFAULT_INITIAL_CAPACITY)
+        cuckoo_filter = cls(initial_capacity, **kwargs)
+        cuckoo_filter.insert_many(items, chunk_size)
+        return cuckoo_filter
+    
+    def _add_filter(self) -> Optional[CuckooFilter]:
+        """
+        Start the next sub-filter, or return None if it would exceed max_memory.
+        
+        The size of the new bucket table is computed before it is allocated, so hitting
+        the memory limit never allocates the oversized table.
+        """
+        index = len(self.filters)
+        capacity = self.initial_capacity * self.growth ** index
+        fingerprint_size = min(MAX_FINGERPRINT_SIZE, self.fingerprint_size + index)
+        if self.max_memory is not None:
+            num_buckets = _bucket_count(capacity, self.bucket_size)
+            table_nbytes = make_bucket_table(self.storage, 1, self.bucket_size, fingerprint_size).nbytes * num_buckets
+            if self.nbytes + table_nbytes > self.max_memory:
+                return None
+        
+        cuckoo_filter = CuckooFilter(capacity, bucket_size=self.bucket_size, max_kicks=self.max_kicks,
+                                     seed=self.seed + index, fingerprint_size=fingerprint_size,
+                                     storage=self.storage)
+        self.filters.append(cuckoo_filter)
+        return cuckoo_filter
+    
+    def _room(self, cuckoo_filter: CuckooFilter) -> int:
+        """Return how many more items a sub-filter takes before it counts as full."""
+        if cuckoo_filter.victim is not None:
+            return 0
+        limit = int(cuckoo_filter.num_buckets * cuckoo_filter.bucket_size * self.fill_ratio)
+        return max(0, limit - cuckoo_filter.count)
+    
+    def _current_filter(self) -> Optional[CuckooFilter]:
+        """Return the sub-filter new items go to, growing if the last is full."""
+        current = self.filters[-1]
+        if self._room(current) == 0:
+            return self._add_filter()
+        return current
+    
+    def insert(self, item: Any) -> bool:
+        """
+        Insert an item, starting a new sub-filter if the newest one is full.
+        
+        Args:
+            item: Item to insert
+            
+        Returns:
+            bool: True if the item was stored, False if growing would exceed max_memory
+            
+        Time Complexity: O(1) amortized
+        """
+        current = self._current_filter()
+        return current is not None and current.insert(item)
+    
+    def insert_many(self, items: Iterable[Any], chunk_size: int = BUILD_CHUNK_SIZE) -> np.ndarray:
+        """
+        Insert many items at once using each sub-filter's bulk insertion path.
+        
+        Items are split at sub-filter boundaries so every sub-filter is filled to its
+        fill ratio before the next one is started. Items a sub-filter could not store,
+        which CuckooFilter.insert_many reports by index, are carried over to the next
+        sub-filter ahead of the remaining items.
+        
+        Args:
+            items: Items to insert
+            chunk_size: Number of items hashed and placed per batch
+            
+        Returns:
+            np.ndarray: Ascending int64 indices into items of the items that were not
+            stored; non-empty only once growing would exceed max_memory
+            
+        Time Complexity: O(n) amortized, vectorized per chunk
+        """
+        items = list(items)
+        pending = np.arange(len(items), dtype=np.int64)
+        while len(pending):
+            current = self._current_filter()
+            if current is None:
+                break
+            batch = pending[:min(self._room(current), chunk_size)]
+            unstored = current.insert_many([items[index] for index in batch], chunk_size)
+            pending = np.concatenate([batch[unstored], pending[len(batch):]])
+        return pending
+    
+    def search(self, target: Any) -> int:
+        """
+        Search for a target item in the filter.
+        
+        Args:
+            target: Item to search for
+            
+        Returns:
+            int: 1 if the item might be in the set, -1 if definitely not in the set
+            
+        Time Complexity: O(s) where s is the number of sub-filters
+        """
+        return 1 if target in self else -1
+    
+    def __contains__(self, item: Any) -> bool:
+        """
+        Check if an item might be in the filter.
+        
+        Args:
+            item: Item to check
+            
+        Returns:
+            bool: True if item might be in set, False if definitely not in set
+            
+        Time Complexity: O(s) where s is the number of sub-filters
+        """
+        return any(item in cuckoo_filter for cuckoo_filter in reversed(self.filters))
+    
+    def search_many(self, targets: Iterable[Any]) -> np.ndarray:
+        """
+        Search for many target items at once.
+        
+        Args:
+            targets: Items to search for
+            
+        Returns:
+            np.ndarray: int64 array holding search(target) for each target
+            
+        Time Complexity: O(t * s) where t is the number of targets, vectorized
+        """
+        targets = list(targets)
+        found = np.zeros(len(targets), dtype=bool)
+        for cuckoo_filter in self.filters:
+            found |= cuckoo_filter.search_many(targets) == 1
+        return np.where(found, 1, -1).astype(np.int64)
+    
+    def delete(self, item: Any) -> bool:
+        """
+        Delete an item from the newest sub-filter that might hold it.
+        
+        Which sub-filter actually stored the item is not recorded, so if another
+        sub-filter holds a colliding fingerprint in one of the item's buckets, that entry
+        is removed instead and its item is lost. As with false positives, the chance
+        halves with every fingerprint bit.
+        
+        Args:
+            item: Item to delete
+            
+        Returns:
+            bool: True if item was found and deleted, False otherwise
+            
+        Time Complexity: O(s) where s is the number of sub-filters
+        """
+        return any(cuckoo_filter.delete(item) for cuckoo_filter in reversed(self.filters))
+    
+    def __len__(self) -> int:
+        """Number of items stored over all sub-filters."""
+        return sum(cuckoo_filter.count for cuckoo_filter in self.filters)
+    
+    @property
+    def load_factor(self) -> float:
+        """Fraction of all sub-filter slots in use."""
+        slots = sum(cuckoo_filter.num_buckets * cuckoo_filter.bucket_size for cuckoo_filter in self.filters)
+        return len(self) / slots
+    
+    @property
+    def nbytes(self) -> int:
+        """Total number of bytes used by the bucket tables of all sub-filters."""
+        return sum(cuckoo_filter.tables.nbytes for cuckoo_filter in self.filters)
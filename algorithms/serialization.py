@@ -0,0 +1,92 @@
+"""
+This module provides the binary file format shared by the persistable search structures.
+A file holds a fixed preamble, a structure-specific header of parameters, and the raw table
+bytes. Loading memory-maps the file so lookups read the table straight from the page cache.
+"""
+
+import mmap
+import struct
+import zlib
+from typing import Iterable, Tuple, Union
+
+FORMAT_VERSION = 3  # 2: keyed polynomial hash64, 3: hash64 modulo a seed-derived prime
+
+# magic, format version, header length, payload length, payload CRC-32
+_PREAMBLE = struct.Struct('<4sHHQI')
+_ALIGNMENT = 8
+
+Buffer = Union[bytes, bytearray, memoryview]
+
+
+def _padding(offset: int) -> int:
+    """Return the number of zero bytes needed to align offset to _ALIGNMENT."""
+    return -offset % _ALIGNMENT
+
+
+def write_file(path: str, magic: bytes, header: struct.Struct, fields: Tuple, payload: Iterable[Buffer]) -> None:
+    """
+    Write a structure to disk in the shared binary format.
+    
+    Args:
+        path: Destination file path
+        magic: Four-byte tag identifying the structure type
+        header: Struct describing the structure-specific header fields
+        fields: Values for the header fields
+        payload: Buffers written back to back as the raw table bytes
+        
+    Time Complexity: O(p) where p is the payload size
+    """
+    chunks = [memoryview(chunk).cast('B') for chunk in payload]
+    checksum = 0
+    for chunk in chunks:
+        checksum = zlib.crc32(chunk, checksum)
+    payload_length = sum(chunk.nbytes for chunk in chunks)
+    
+    with open(path, 'wb') as file:
+        file.write(_PREAMBLE.pack(magic, FORMAT_VERSION, header.size, payload_length, checksum))
+        file.write(header.pack(*fields))
+        file.write(bytes(_padding(_PREAMBLE.size + header.size)))
+        for chunk in chunks:
+            file.write(chunk)
+
+
+def map_file(path: str, magic: bytes, header: struct.Struct, verify: bool = True) -> Tuple[Tuple, memoryview]:
+    """
+    Memory-map a structure written by write_file.
+    
+    Args:
+        path: Source file path
+        magic: Expected four-byte tag for the structure type
+        header: Struct describing the structure-specific header fields
+        verify: Whether to check the payload CRC-32 (default: True)
+        
+    Returns:
+        Tuple[Tuple, memoryview]: The header field values and a read-only view of the
+        payload bytes; the view keeps the underlying mapping alive
+        
+    Raises:
+        ValueError: If the file is not a valid file of the expected type
+        
+    Time Complexity: O(1) without verification, O(p) with it
+    """
+    with open(path, 'rb') as file:
+        mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    
+    view = memoryview(mapping)
+    if len(view) < _PREAMBLE.size:
+        raise ValueError(f"{path} is too short to be a {magic.decode()} file")
+    file_magic, version, header_length, payload_length, checksum = _PREAMBLE.unpack_from(view)
+    if file_magic != magic:
+        raise ValueError(f"{path} is not a {magic.decode()} file")
+    if version != FORMAT_VERSION or header_length != header.size:
+        raise ValueError(f"{path} uses an unsupported format version {version}")
+    
+    fields = header.unpack_from(view, _PREAMBLE.size)
+    start = _PREAMBLE.size + header.size
+    start += _padding(start)
+    payload = view[start:start + payload_length]
+    if len(payload) != payload_length:
+        raise ValueError(f"{path} is truncated")
+    if verify and zlib.crc32(payload) != checksum:
+        raise ValueError(f"{path} failed its checksum")
+    return fields, payload
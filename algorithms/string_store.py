@@ -0,0 +1,118 @@
+"""
+This module provides a compact, read-only store for many strings.
+All strings are concatenated as UTF-8 into one bytes blob with an offsets array marking
+where each one starts, which costs one byte per character plus eight bytes per string
+instead of a full Python object per string.
+"""
+
+from array import array
+from typing import Iterable, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+
+Buffer = Union[bytes, bytearray, memoryview]
+
+
+class StringStore:
+    """
+    An immutable sequence of strings stored as an offsets array and a UTF-8 blob.
+    
+    String i occupies blob[offsets[i]:offsets[i + 1]]. Single strings are decoded on
+    access, and the offsets can be viewed as a NumPy array without copying for
+    vectorized work over the whole store.
+    """
+    
+    def __init__(self, strings: Iterable[str] = (), offsets: Optional[Buffer] = None,
+                 blob: Optional[Buffer] = None) -> None:
+        """
+        Initialize the store from strings, or from existing offsets and blob buffers.
+        
+        Args:
+            strings: Strings to store, in order; ignored if offsets and blob are given
+            offsets: Existing native-endian uint64 offsets (n + 1 entries), e.g. from a
+                memory-mapped file
+            blob: Existing UTF-8 bytes the offsets point into
+            
+        Time Complexity: O(total length of strings), O(1) with existing buffers
+        Space Complexity: O(total length + 8n) bytes
+        """
+        if offsets is not None and blob is not None:
+            self.offsets: Union[array, memoryview] = memoryview(offsets).cast('B').cast('Q')
+            self.blob: Buffer = blob
+            return
+        
+        encoded = [string.encode() for string in strings]
+        self.offsets = array('Q', [0]) * (len(encoded) + 1)
+        np.cumsum(np.fromiter(map(len, encoded), dtype=np.uint64, count=len(encoded)),
+                  out=np.frombuffer(self.offsets, dtype=np.uint64)[1:])
+        self.blob = b''.join(encoded)
+    
+    def __len__(self) -> int:
+        """Number of strings in the store."""
+        return len(self.offsets) - 1
+    
+    def get_bytes(self, index: int) -> bytes:
+        """Return the UTF-8 encoding of string index."""
+        return bytes(self.blob[self.offsets[index]:self.offsets[index + 1]])
+    
+    def __getitem__(self, index: int) -> str:
+        """Return string index."""
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("StringStore index out of range")
+        return self.get_bytes(index).decode()
+    
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the stored strings in order."""
+        for index in range(len(self)):
+            yield self.get_bytes(index).decode()
+    
+    def offsets_array(self) -> np.ndarray:
+        """Return a zero-copy uint64 NumPy view of the offsets."""
+        return np.frombuffer(self.offsets, dtype=np.uint64)
+    
+    def gather(self, indexes: np.ndarray, width: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Gather the first width bytes of many strings as a zero-padded byte matrix.
+        
+        Args:
+            indexes: String indexes to gather, each less than len(self)
+            width: Number of bytes per row
+            
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: uint8 matrix of shape (len(indexes), width)
+            and the full byte lengths of the strings
+        """
+        offsets = self.offsets_array()
+        starts = offsets[indexes].astype(np.intp)
+        lengths = offsets[indexes + 1].astype(np.intp) - starts
+        blob = np.frombuffer(self.blob, dtype=np.uint8) if len(self.blob) else np.zeros(1, dtype=np.uint8)
+        columns = np.arange(width)
+        matrix = blob[np.minimum(starts[:, None] + columns, len(blob) - 1)]
+        matrix[columns >= lengths[:, None]] = 0
+        return matrix, lengths
+    
+    def equal_many(self, indexes: np.ndarray, encoded: List[bytes]) -> np.ndarray:
+        """
+        Compare many stored strings with byte strings, element by element.
+        
+        Args:
+            indexes: String indexes to compare, each less than len(self)
+            encoded: UTF-8 byte strings, one per index
+            
+        Returns:
+            np.ndarray: Boolean array, True where string indexes[i] equals encoded[i]
+        """
+        if not encoded:
+            return np.zeros(0, dtype=bool)
+        lengths = np.fromiter(map(len, encoded), dtype=np.intp, count=len(encoded))
+        width = max(1, int(lengths.max()))
+        wanted = np.array(encoded, dtype=f'S{width}').view(np.uint8).reshape(len(encoded), width)
+        stored, stored_lengths = self.gather(np.asarray(indexes, dtype=np.intp), width)
+        return (stored_lengths == lengths) & (stored == wanted).all(axis=1)
+    
+    @property
+    def nbytes(self) -> int:
+        """Number of bytes used by the offsets and the blob."""
+        return len(self.offsets) * 8 + len(self.blob)
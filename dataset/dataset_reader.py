@@ -0,0 +1,179 @@
+"""
+This module provides a memory-mapped reader for the login name dataset files.
+A line-offset index is built once per file and cached beside it, and slices of the
+dataset are views over the mapping that decode their lines only when asked.
+"""
+
+import mmap
+import os
+import struct
+from typing import Iterator, List, Optional, Union, overload
+
+import numpy as np
+
+from algorithms.serialization import map_file, write_file
+
+# size and modification time in nanoseconds of the indexed file
+_HEADER = struct.Struct('<QQ')
+_MAGIC = b'DSIX'
+_SCAN_BYTES = 1 << 24  # bytes searched for line breaks at a time
+
+
+def _line_offsets(data: Union[bytes, mmap.mmap]) -> np.ndarray:
+    """
+    Find where every line of a file starts.
+    
+    Args:
+        data: Contents of the file
+        
+    Returns:
+        np.ndarray: int64 array of n + 1 offsets for n lines; line k spans
+        offsets[k]..offsets[k + 1], including its line break
+    """
+    breaks = []
+    for start in range(0, len(data), _SCAN_BYTES):
+        chunk = np.frombuffer(data[start:start + _SCAN_BYTES], dtype=np.uint8)
+        breaks.append(np.flatnonzero(chunk == ord('\n')) + start + 1)
+    offsets = np.concatenate([np.zeros(1, dtype=np.int64)] + breaks).astype(np.int64)
+    if offsets[-1] != len(data):
+        offsets = np.append(offsets, len(data))  # last line without a line break
+    return offsets
+
+
+class DatasetReader:
+    """
+    A read-only sequence of the stripped lines of a dataset file.
+    
+    The file is memory-mapped, and the offsets of its lines are found with one
+    vectorized pass and written to path + '.idx', which later readers map instead of
+    scanning the file again as long as the file's size and modification time match.
+    Indexing decodes a single line. Slicing returns another DatasetReader over the same
+    mapping and offsets, so dataset[:i] costs O(1) and copies nothing; tolist() decodes
+    the lines of a view in one pass for the algorithms, which take lists of strings.
+    
+    Lines are split on '\\n' and stripped of surrounding whitespace, which matches
+    [line.strip() for line in file.readlines()] for the generated dataset files.
+    """
+    
+    def __init__(self, path: str, cache: bool = True) -> None:
+        """
+        Map a dataset file and load or build its line index.
+        
+        Args:
+            path: Path of the dataset file
+            cache: Whether to read and write the index file path + '.idx' (default: True)
+            
+        Raises:
+            OSError: If the dataset file cannot be opened
+            
+        Time Complexity: O(1) with a valid cached index, O(s) to build it for a file of s bytes
+        Space Complexity: O(n) for the offsets of n lines, shared with the index file when cached
+        """
+        self.path = path
+        with open(path, 'rb') as file:
+            stat = os.fstat(file.fileno())
+            self._data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) if stat.st_size else b''
+        
+        fields = (stat.st_size, stat.st_mtime_ns)
+        self.offsets: Optional[np.ndarray] = None
+        if cache:
+            try:
+                cached_fields, payload = map_file(path + '.idx', _MAGIC, _HEADER)
+                if cached_fields == fields:
+                    self.offsets = np.frombuffer(payload, dtype=np.int64)
+            except (OSError, ValueError):
+                pass
+        if self.offsets is None:
+            self.offsets = _line_offsets(self._data)
+            if cache:
+                try:
+                    write_file(path + '.idx', _MAGIC, _HEADER, fields, [self.offsets])
+                except OSError:
+                    pass  # a read-only directory only costs the rebuild next time
+    
+    def __len__(self) -> int:
+        """Number of lines in the view."""
+        return len(self.offsets) - 1
+    
+    @overload
+    def __getitem__(self, index: int) -> str: ...
+    
+    @overload
+    def __getitem__(self, index: slice) -> 'DatasetReader': ...
+    
+    def __getitem__(self, index: Union[int, slice]) -> Union[str, 'DatasetReader']:
+        """
+        Return one stripped line, or a view of a contiguous range of lines.
+        
+        Args:
+            index: Line number, or a slice with a step of 1
+            
+        Returns:
+            Union[str, DatasetReader]: The line, or a view sharing this reader's mapping
+            
+        Raises:
+            IndexError: If the line number is out of range
+            ValueError: If the slice has a step other than 1
+        """
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step != 1:
+                raise ValueError("DatasetReader views only support a step of 1")
+            view = DatasetReader.__new__(DatasetReader)
+            view.path = self.path
+            view._data = self._data
+            view.offsets = self.offsets[start:max(start, stop) + 1]
+            return view
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("DatasetReader index out of range")
+        return str(self.line_bytes(index), 'utf-8').strip()
+    
+    def line_bytes(self, index: int) -> memoryview:
+        """
+        Return the raw bytes of a line, including its line break, without copying.
+        
+        Args:
+            index: Line number within the view
+            
+        Returns:
+            memoryview: Read-only view of the line in the mapping
+        """
+        return memoryview(self._data)[self.offsets[index]:self.offsets[index + 1]]
+    
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the stripped lines, decoding one at a time."""
+        for index in range(len(self)):
+            yield str(self.line_bytes(index), 'utf-8').strip()
+    
+    def tolist(self) -> List[str]:
+        """
+        Decode every line of the view into a list.
+        
+        Returns:
+            List[str]: The stripped lines, in file order
+            
+        Time Complexity: O(s) for s bytes in the view
+        """
+        if not len(self):
+            return []
+        text = self._data[self.offsets[0]:self.offsets[-1]].decode()
+        lines = text.split('\n')
+        if text.endswith('\n'):
+            lines.pop()
+        return [line.strip() for line in lines]
+
+
+def load_dataset(path: str, limit: Optional[int] = None) -> List[str]:
+    """
+    Read the first lines of a dataset file as a list of stripped strings.
+    
+    Args:
+        path: Path of the dataset file
+        limit: Number of lines to read (default: all of them)
+        
+    Returns:
+        List[str]: The stripped lines
+    """
+    return DatasetReader(path)[:limit].tolist()
@@ -0,0 +1,92 @@
+import sys
+import os
+import random
+import time
+import matplotlib.pyplot as plt
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from algorithms.bloom_filter import BloomFilter, BlockedBloomFilter
+from dataset.dataset_constants import DATASET_LIMIT, DATASET_STEP
+from dataset.dataset_reader import DatasetReader
+
+# Compares the standard Bloom filter, whose k probes land anywhere in the bit array,
+# with the blocked variant, whose probes share one 64-byte block, on lookup time and
+# measured false-positive rate.
+
+REPEAT_FOR = 1000
+FALSE_POSITIVE_PROBES = 100000
+
+n_values = []
+standard_runtime_values = []
+blocked_runtime_values = []
+standard_fpr_values = []
+blocked_fpr_values = []
+
+reader = DatasetReader('dataset.txt')
+
+negatives = [f"not_a_login_name_{i}" for i in range(FALSE_POSITIVE_PROBES)]
+
+for i in range(DATASET_STEP, DATASET_LIMIT, DATASET_STEP):
+    dataset = reader[:i].tolist()
+    if(len(dataset) == 0):
+        raise Exception("Dataset is empty.")
+
+    targets = [dataset[random.randint(0, len(dataset) - 1)] for _ in range(REPEAT_FOR)]
+    results = []
+    for filter_class in (BloomFilter, BlockedBloomFilter):
+        bloom_filter = filter_class(dataset)
+        search = bloom_filter.search
+
+        start_time = time.time()
+        for target in targets:
+            if search(target) == -1:
+                raise Exception(f"Element {target} not found in dataset.")
+        end_time = time.time()
+        run_time = (end_time - start_time) / REPEAT_FOR
+
+        false_positive_rate = float((bloom_filter.search_many(negatives) == 1).mean())
+        results.append((run_time, false_positive_rate))
+
+    (standard_time, standard_fpr), (blocked_time, blocked_fpr) = results
+    n_values.append(len(dataset))
+    standard_runtime_values.append(standard_time)
+    blocked_runtime_values.append(blocked_time)
+    standard_fpr_values.append(standard_fpr)
+    blocked_fpr_values.append(blocked_fpr)
+
+    print(f"Bloom Filter: n={len(dataset)}, standard={standard_time:.9f}s fpr={standard_fpr:.4f}, "
+          f"blocked={blocked_time:.9f}s fpr={blocked_fpr:.4f}")
+
+if not os.path.exists('runtime_analysis'):
+    os.makedirs('runtime_analysis')
+
+# Store all results in a CSV file
+
+with open('runtime_analysis/blocked_bloom_filter.csv', 'w') as file:
+    file.write('n,standard_runtime,blocked_runtime,standard_fpr,blocked_fpr\n')
+    for i in range(len(n_values)):
+        file.write(f"{n_values[i]},{standard_runtime_values[i]},{blocked_runtime_values[i]},"
+                   f"{standard_fpr_values[i]},{blocked_fpr_values[i]}\n")
+
+figure, (runtime_axis, fpr_axis) = plt.subplots(1, 2, figsize=(16, 6))
+
+runtime_axis.plot(n_values, standard_runtime_values, marker='o', color='purple', label='Bloom Filter')
+runtime_axis.plot(n_values, blocked_runtime_values, marker='o', color='teal', label='Blocked Bloom Filter')
+runtime_axis.set_xlabel('N / Number of Login Names')
+runtime_axis.set_ylabel('Runtime (s)')
+runtime_axis.set_title('Lookup Runtime')
+runtime_axis.grid(True)
+runtime_axis.legend()
+
+fpr_axis.plot(n_values, standard_fpr_values, marker='o', color='purple', label='Bloom Filter')
+fpr_axis.plot(n_values, blocked_fpr_values, marker='o', color='teal', label='Blocked Bloom Filter')
+fpr_axis.set_xlabel('N / Number of Login Names')
+fpr_axis.set_ylabel('Measured false-positive rate')
+fpr_axis.set_title('False-Positive Rate')
+fpr_axis.grid(True)
+fpr_axis.legend()
+
+plt.tight_layout()
+plt.savefig('runtime_analysis/blocked_bloom_filter.png')
+plt.close()
@@ -8,14 +8,23 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from algorithms.binary_search import BinarySearch
 from algorithms.hash_search import HashSearch
+from algorithms.interpolation_search import InterpolationSearch
+from algorithms.learned_index import LearnedIndex
 from algorithms.linear_search import LinearSearch
 from algorithms.bloom_filter import BloomFilter
-from algorithms.cuckoo_filter import CuckooFilter
+from algorithms.scalable_cuckoo_filter import ScalableCuckooFilter
 from dataset.dataset_constants import DATASET_LIMIT, DATASET_STEP
+from dataset.dataset_reader import load_dataset
 
 # Data structures to store results for each algorithm
 binary_n_values = []
 binary_runtime_values = []
+binary_probe_values = []
+interpolation_n_values = []
+interpolation_runtime_values = []
+interpolation_probe_values = []
+learned_n_values = []
+learned_runtime_values = []
 hash_n_values = []
 hash_runtime_values = []
 linear_n_values = []
@@ -27,141 +36,196 @@ cuckoo_runtime_values = []
 
 REPEAT_FOR = 10
 
+# Read the file once; every loop below takes its prefixes from this list
+lines = load_dataset('dataset.txt', DATASET_LIMIT)
+
+
+def extend_sorted(dataset: list, items: list) -> None:
+    """Merge items into the sorted list dataset in place."""
+    dataset += sorted(items)
+    dataset.sort()  # two sorted runs, which timsort merges in linear time
+
+
 # Collect Linear Search data
 print("\nCollecting Linear Search data...")
+dataset = []
+linear_search = LinearSearch(dataset)
 for i in range(DATASET_STEP, DATASET_LIMIT, DATASET_STEP):
-    with open('dataset.txt', 'r') as file:
-        lines = [line.strip() for line in file.readlines()]
-        dataset = lines[:i]
-        linear_search = LinearSearch(dataset).search
-        
-        times = []
-        for _ in range(REPEAT_FOR):
-            target = dataset[random.randint(0, len(dataset) - 1)]
-            start_time = time.time()
-            result = linear_search(target)
-            end_time = time.time()
-            run_time = end_time - start_time
-            if result == -1:
-                raise Exception(f"Element {target} not found in dataset.")
-            times.append(run_time)
-        
-        run_time = sum(times) / len(times)
-        linear_n_values.append(len(dataset))
-        linear_runtime_values.append(run_time)
-        print(f"Linear Search: n={len(dataset)}, runtime={run_time:.6f}s")
+    # Append the new keys to the packed matrix instead of repacking the prefix; append()
+    # re-chooses the filter column as the matrix grows, so every step measures the same
+    # layout and filter column that LinearSearch(lines[:i]) would build
+    for item in lines[len(dataset):i]:
+        linear_search.append(item)
+    
+    times = []
+    for _ in range(REPEAT_FOR):
+        target = dataset[random.randint(0, len(dataset) - 1)]
+        start_time = time.time()
+        result = linear_search.search(target)
+        end_time = time.time()
+        run_time = end_time - start_time
+        if result == -1:
+            raise Exception(f"Element {target} not found in dataset.")
+        times.append(run_time)
+    
+    run_time = sum(times) / len(times)
+    linear_n_values.append(len(dataset))
+    linear_runtime_values.append(run_time)
+    print(f"Linear Search: n={len(dataset)}, runtime={run_time:.6f}s")
 
 # Collect Binary Search data
 print("\nCollecting Binary Search data...")
+dataset = []
 for i in range(DATASET_STEP, DATASET_LIMIT, DATASET_STEP):
-    with open('dataset.txt', 'r') as file:
-        lines = [line.strip() for line in file.readlines()]
-        dataset = sorted(lines[:i])  # Sort for binary search
-        binary_search = BinarySearch(dataset).search
-        
-        times = []
-        for _ in range(REPEAT_FOR):
-            target = dataset[random.randint(0, len(dataset) - 1)]
-            start_time = time.time()
-            result = binary_search(target)
-            end_time = time.time()
-            run_time = end_time - start_time
-            if result == -1:
-                raise Exception(f"Element {target} not found in dataset.")
-            times.append(run_time)
-        
-        run_time = sum(times) / len(times)
-        binary_n_values.append(len(dataset))
-        binary_runtime_values.append(run_time)
-        print(f"Binary Search: n={len(dataset)}, runtime={run_time:.6f}s")
+    extend_sorted(dataset, lines[len(dataset):i])  # Sort for binary search
+    binary_search = BinarySearch(dataset)
+    
+    times = []
+    probes = []
+    for _ in range(REPEAT_FOR):
+        target = dataset[random.randint(0, len(dataset) - 1)]
+        start_time = time.time()
+        result = binary_search.search(target)
+        end_time = time.time()
+        run_time = end_time - start_time
+        if result == -1:
+            raise Exception(f"Element {target} not found in dataset.")
+        times.append(run_time)
+        probes.append(binary_search.probe_count(target))
+    
+    run_time = sum(times) / len(times)
+    probe_count = sum(probes) / len(probes)
+    binary_n_values.append(len(dataset))
+    binary_runtime_values.append(run_time)
+    binary_probe_values.append(probe_count)
+    print(f"Binary Search: n={len(dataset)}, runtime={run_time:.6f}s, probes={probe_count:.1f}")
+
+# Collect Interpolation Search data
+print("\nCollecting Interpolation Search data...")
+dataset = []
+for i in range(DATASET_STEP, DATASET_LIMIT, DATASET_STEP):
+    extend_sorted(dataset, lines[len(dataset):i])  # Sort for interpolation search
+    interpolation_search = InterpolationSearch(dataset)
+    
+    times = []
+    probes = []
+    for _ in range(REPEAT_FOR):
+        target = dataset[random.randint(0, len(dataset) - 1)]
+        start_time = time.time()
+        result = interpolation_search.search(target)
+        end_time = time.time()
+        run_time = end_time - start_time
+        if result == -1:
+            raise Exception(f"Element {target} not found in dataset.")
+        times.append(run_time)
+        probes.append(interpolation_search.probe_count(target))
+    
+    run_time = sum(times) / len(times)
+    probe_count = sum(probes) / len(probes)
+    interpolation_n_values.append(len(dataset))
+    interpolation_runtime_values.append(run_time)
+    interpolation_probe_values.append(probe_count)
+    print(f"Interpolation Search: n={len(dataset)}, runtime={run_time:.6f}s, probes={probe_count:.1f}")
+
+# Collect Learned Index data
+print("\nCollecting Learned Index data...")
+dataset = []
+for i in range(DATASET_STEP, DATASET_LIMIT, DATASET_STEP):
+    extend_sorted(dataset, lines[len(dataset):i])  # Sort for the learned index
+    learned_search = LearnedIndex(dataset).search
+    
+    times = []
+    for _ in range(REPEAT_FOR):
+        target = dataset[random.randint(0, len(dataset) - 1)]
+        start_time = time.time()
+        result = learned_search(target)
+        end_time = time.time()
+        run_time = end_time - start_time
+        if result == -1:
+            raise Exception(f"Element {target} not found in dataset.")
+        times.append(run_time)
+    
+    run_time = sum(times) / len(times)
+    learned_n_values.append(len(dataset))
+    learned_runtime_values.append(run_time)
+    print(f"Learned Index: n={len(dataset)}, runtime={run_time:.6f}s")
 
 # Collect Hash Search data
 print("\nCollecting Hash Search data...")
 for i in range(DATASET_STEP, DATASET_LIMIT, DATASET_STEP):
-    with open('dataset.txt', 'r') as file:
-        lines = [line.strip() for line in file.readlines()]
-        dataset = lines[:i]
-        hash_search = HashSearch(dataset).search
-        
-        times = []
-        for _ in range(REPEAT_FOR):
-            target = dataset[random.randint(0, len(dataset) - 1)]
-            start_time = time.time()
-            result = hash_search(target)
-            end_time = time.time()
-            run_time = end_time - start_time
-            if result == -1:
-                raise Exception(f"Element {target} not found in dataset.")
-            times.append(run_time)
-        
-        run_time = sum(times) / len(times)
-        hash_n_values.append(len(dataset))
-        hash_runtime_values.append(run_time)
-        print(f"Hash Search: n={len(dataset)}, runtime={run_time:.6f}s")
+    dataset = lines[:i]
+    hash_search = HashSearch(dataset).search
+    
+    times = []
+    for _ in range(REPEAT_FOR):
+        target = dataset[random.randint(0, len(dataset) - 1)]
+        start_time = time.time()
+        result = hash_search(target)
+        end_time = time.time()
+        run_time = end_time - start_time
+        if result == -1:
+            raise Exception(f"Element {target} not found in dataset.")
+        times.append(run_time)
+    
+    run_time = sum(times) / len(times)
+    hash_n_values.append(len(dataset))
+    hash_runtime_values.append(run_time)
+    print(f"Hash Search: n={len(dataset)}, runtime={run_time:.6f}s")
 
 # Collect Bloom Filter data
 print("\nCollecting Bloom Filter data...")
 for i in range(DATASET_STEP, DATASET_LIMIT, DATASET_STEP):
-    with open('dataset.txt', 'r') as file:
-        lines = [line.strip() for line in file.readlines()]
-        dataset = lines[:i]
-        bloom_filter = BloomFilter(dataset)
-        
-        times = []
-        for _ in range(REPEAT_FOR):
-            target = dataset[random.randint(0, len(dataset) - 1)]
-
-            # Create and populate filter
-            for item in dataset:
-                bloom_filter._add(item)
-            
-            start_time = time.time()
-            result = bloom_filter.search(target)
-            end_time = time.time()
-            run_time = end_time - start_time
-            times.append(run_time)
-        
-        run_time = sum(times) / len(times)
-        bloom_n_values.append(len(dataset))
-        bloom_runtime_values.append(run_time)
-        print(f"Bloom Filter: n={len(dataset)}, runtime={run_time:.6f}s")
+    dataset = lines[:i]
+    bloom_filter = BloomFilter(dataset)
+    
+    times = []
+    for _ in range(REPEAT_FOR):
+        target = dataset[random.randint(0, len(dataset) - 1)]
+        start_time = time.time()
+        result = bloom_filter.search(target)
+        end_time = time.time()
+        run_time = end_time - start_time
+        times.append(run_time)
+    
+    run_time = sum(times) / len(times)
+    bloom_n_values.append(len(dataset))
+    bloom_runtime_values.append(run_time)
+    print(f"Bloom Filter: n={len(dataset)}, runtime={run_time:.6f}s")
 
 # Collect Cuckoo Filter data
 print("\nCollecting Cuckoo Filter data...")
 for i in range(DATASET_STEP, DATASET_LIMIT, DATASET_STEP):
-    with open('dataset.txt', 'r') as file:
-        lines = [line.strip() for line in file.readlines()]
-        dataset = lines[:i]
-        cuckoo_filter = CuckooFilter(capacity=len(dataset))
-        # Create and populate filter
-        insert_failed = False
-        for item in dataset:
-            if not cuckoo_filter.insert(item):
-                print(f"Warning: Cuckoo filter failed to insert item at size {len(dataset)}")
-                insert_failed = True
-                break
-            
-        times = []
-        for _ in range(REPEAT_FOR):
-            target = dataset[random.randint(0, len(dataset) - 1)]
-            start_time = time.time()
-            result = cuckoo_filter.search(target)
-            end_time = time.time()
-            run_time = end_time - start_time
-            times.append(run_time)
+    dataset = lines[:i]
+    # Create and populate filter
+    cuckoo_filter = ScalableCuckooFilter.from_iterable(dataset)
         
-        if times:
-            run_time = sum(times) / len(times)
-            cuckoo_n_values.append(len(dataset))
-            cuckoo_runtime_values.append(run_time)
-            print(f"Cuckoo Filter: n={len(dataset)}, runtime={run_time:.6f}s")
+    times = []
+    for _ in range(REPEAT_FOR):
+        target = dataset[random.randint(0, len(dataset) - 1)]
+        start_time = time.time()
+        result = cuckoo_filter.search(target)
+        end_time = time.time()
+        run_time = end_time - start_time
+        times.append(run_time)
+    
+    if times:
+        run_time = sum(times) / len(times)
+        cuckoo_n_values.append(len(dataset))
+        cuckoo_runtime_values.append(run_time)
+        print(f"Cuckoo Filter: n={len(dataset)}, runtime={run_time:.6f}s")
 
 
 # Store all results in a CSV file (for easier visualization and comparison)
 with open('runtime_analysis/algorithm_comparison.csv', 'w') as file:
-    file.write('n,linear,binary,hash,bloom,cuckoo\n')
+    file.write('n,linear,binary,hash,bloom,cuckoo,learned,interpolation\n')
     for i in range(len(linear_n_values)):
-        file.write(f"{linear_n_values[i]},{linear_runtime_values[i]},{binary_runtime_values[i]},{hash_runtime_values[i]},{bloom_runtime_values[i]},{cuckoo_runtime_values[i]}\n")
+        file.write(f"{linear_n_values[i]},{linear_runtime_values[i]},{binary_runtime_values[i]},{hash_runtime_values[i]},{bloom_runtime_values[i]},{cuckoo_runtime_values[i]},{learned_runtime_values[i]},{interpolation_runtime_values[i]}\n")
+
+# Store the average number of probes per lookup of the sorted-array searches
+with open('runtime_analysis/probe_comparison.csv', 'w') as file:
+    file.write('n,binary,interpolation\n')
+    for i in range(len(binary_n_values)):
+        file.write(f"{binary_n_values[i]},{binary_probe_values[i]},{interpolation_probe_values[i]}\n")
 
 
 # Plot all results
@@ -169,6 +233,8 @@ plt.figure(figsize=(12, 8))
 
 plt.plot(linear_n_values, linear_runtime_values, marker='o', color='g', label='Linear Search')
 plt.plot(binary_n_values, binary_runtime_values, marker='o', color='b', label='Binary Search')
+plt.plot(interpolation_n_values, interpolation_runtime_values, marker='o', color='navy', label='Interpolation Search')
+plt.plot(learned_n_values, learned_runtime_values, marker='o', color='teal', label='Learned Index')
 plt.plot(hash_n_values, hash_runtime_values, marker='o', color='r', label='Hash Search')
 plt.plot(bloom_n_values, bloom_runtime_values, marker='o', color='purple', label='Bloom Filter')
 plt.plot(cuckoo_n_values, cuckoo_runtime_values, marker='o', color='orange', label='Cuckoo Filter')
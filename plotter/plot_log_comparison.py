@@ -12,6 +12,8 @@ plt.figure(figsize=(12, 8))
 # Plot each algorithm with natural log of runtime values
 plt.plot(df['n'], np.log10(df['linear']), marker='o', color='g', label='Linear Search', linewidth=2)
 plt.plot(df['n'], np.log10(df['binary']), marker='o', color='b', label='Binary Search', linewidth=2)
+plt.plot(df['n'], np.log10(df['interpolation']), marker='o', color='navy', label='Interpolation Search', linewidth=2)
+plt.plot(df['n'], np.log10(df['learned']), marker='o', color='teal', label='Learned Index', linewidth=2)
 plt.plot(df['n'], np.log10(df['hash']), marker='o', color='r', label='Hash Search', linewidth=2)
 plt.plot(df['n'], np.log10(df['bloom']), marker='o', color='purple', label='Bloom Filter', linewidth=2)
 plt.plot(df['n'], np.log10(df['cuckoo']), marker='o', color='orange', label='Cuckoo Filter', linewidth=2)
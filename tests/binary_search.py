@@ -13,7 +13,8 @@ from typing import Callable, Any
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from algorithms.binary_search import binary_search
+from algorithms.binary_search import BinarySearch
+from dataset.dataset_reader import load_dataset
 
 
 def log_runtime(func: Callable) -> Callable:
@@ -44,8 +45,7 @@ class TestBinarySearch(unittest.TestCase):
         Test fixture setup.
         Loads sorted dataset for binary search testing.
         """
-        with open('sorted_dataset.txt', 'r') as file:
-            self.dataset = [line.strip() for line in file.readlines()]
+        self.dataset = load_dataset('sorted_dataset.txt')
     
     @log_runtime
     def test_binary_search_found(self) -> None:
@@ -54,7 +54,7 @@ class TestBinarySearch(unittest.TestCase):
         Verifies that the search correctly finds and returns the proper index.
         """
         target = self.dataset[random.randint(0, len(self.dataset) - 1)]
-        result = binary_search(self.dataset, target)
+        result = BinarySearch(self.dataset).search(target)
         print(f"Test Binary Search Found: target={target}, result={result}")
         self.assertNotEqual(result, -1, "Search should find existing element")
         self.assertEqual(self.dataset[result], target, "Found index should contain target")
@@ -66,7 +66,7 @@ class TestBinarySearch(unittest.TestCase):
         Verifies that the search correctly returns -1 for missing elements.
         """
         target = "nonexistent_element"
-        result = binary_search(self.dataset, target)
+        result = BinarySearch(self.dataset).search(target)
         print(f"Test Binary Search Not Found: target={target}, result={result}")
         self.assertEqual(result, -1, "Search should return -1 for non-existent element")
     
@@ -76,7 +76,7 @@ class TestBinarySearch(unittest.TestCase):
         Test searching for an empty string.
         Verifies correct handling of edge cases.
         """
-        result = binary_search(self.dataset, "")
+        result = BinarySearch(self.dataset).search("")
         self.assertEqual(result, -1, "Search should handle empty string")
     
     @log_runtime
@@ -88,11 +88,42 @@ class TestBinarySearch(unittest.TestCase):
         first = self.dataset[0]
         last = self.dataset[-1]
         
-        first_result = binary_search(self.dataset, first)
+        first_result = BinarySearch(self.dataset).search(first)
         self.assertEqual(first_result, 0, "Should find first element")
         
-        last_result = binary_search(self.dataset, last)
+        last_result = BinarySearch(self.dataset).search(last)
         self.assertEqual(last_result, len(self.dataset) - 1, "Should find last element")
+    
+    @log_runtime
+    def test_binary_search_many(self) -> None:
+        """
+        Test batch lookups with np.searchsorted.
+        Verifies that search_many agrees with search for present and missing targets.
+        """
+        binary_search = BinarySearch(self.dataset)
+        targets = random.sample(self.dataset, 1000) + ["nonexistent_element", "", "~", self.dataset[0], self.dataset[-1]]
+        results = binary_search.search_many(targets)
+        self.assertEqual(results.tolist(), [binary_search.search(target) for target in targets])
+        self.assertEqual(BinarySearch([]).search_many(["a"]).tolist(), [-1])
+    
+    @log_runtime
+    def test_binary_search_many_after_growth(self) -> None:
+        """
+        Test batch lookups after the array grows in place or is replaced.
+        Verifies that search_many sees the same array as search instead of a stale copy.
+        """
+        arr = self.dataset[:1000]
+        binary_search = BinarySearch(arr)
+        targets = self.dataset[:2000:7]
+        self.assertEqual(binary_search.search_many(targets).tolist(), [binary_search.search(t) for t in targets])
+        
+        arr.extend(self.dataset[1000:2000])
+        arr.sort()
+        self.assertEqual(binary_search.search_many(targets).tolist(), [binary_search.search(t) for t in targets])
+        self.assertNotIn(-1, binary_search.search_many(targets).tolist())
+        
+        binary_search.arr = self.dataset[:10]
+        self.assertEqual(binary_search.search_many(targets).tolist(), [binary_search.search(t) for t in targets])
 
 if __name__ == '__main__':
     unittest.main()
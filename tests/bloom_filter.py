@@ -8,11 +8,14 @@ import random
 import time
 import sys
 import os
+import subprocess
+import tempfile
 from typing import Callable, Any
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from algorithms.bloom_filter import BloomFilter
+from algorithms.bloom_filter import BLOCK_BITS, BlockedBloomFilter, BloomFilter
+from dataset.dataset_reader import load_dataset
 
 
 def log_runtime(func: Callable) -> Callable:
@@ -43,9 +46,8 @@ class TestBloomFilter(unittest.TestCase):
         Test fixture setup.
         Loads dataset and initializes BloomFilter instance.
         """
-        with open('dataset.txt', 'r') as file:
-            self.dataset = [line.strip() for line in file.readlines()]
-            self.bloom_filter = BloomFilter(self.dataset)
+        self.dataset = load_dataset('dataset.txt')
+        self.bloom_filter = BloomFilter(self.dataset)
     
     @log_runtime
     def test_bloom_filter_found(self) -> None:
@@ -92,6 +94,178 @@ class TestBloomFilter(unittest.TestCase):
         
         last_result = self.bloom_filter.search(last)
         self.assertEqual(last_result, 1, "Should find last element")
+    
+    @log_runtime
+    def test_bloom_filter_storage_engines(self) -> None:
+        """
+        Test the packed and list-backed bit array engines.
+        Verifies that both engines give identical answers and that packing saves memory.
+        """
+        sample = self.dataset[:1000]
+        packed = BloomFilter(sample, storage='packed')
+        reference = BloomFilter(sample, storage='list')
+        
+        for target in sample + [f"missing_{i}" for i in range(1000)]:
+            self.assertEqual(packed.search(target), reference.search(target),
+                             f"Engines should agree for {target}")
+        self.assertLess(packed.bit_array.nbytes * 32, reference.bit_array.nbytes,
+                        "Packed engine should be far smaller than the list engine")
+        
+        with self.assertRaises(ValueError):
+            BloomFilter(sample, storage='unknown')
+    
+    @log_runtime
+    def test_bloom_filter_target_false_positive_rate(self) -> None:
+        """
+        Test sizing the filter from an expected capacity and target false-positive rate.
+        Verifies the computed parameters and that the measured rate stays near the target.
+        """
+        sample = self.dataset[:5000]
+        target_rate = 0.01
+        bloom_filter = BloomFilter(sample, false_positive_rate=target_rate)
+        print(f"size={bloom_filter.size}, hash_count={bloom_filter.hash_count}")
+        self.assertEqual(bloom_filter.hash_count, 7, "Optimal k for p=0.01 should be 7")
+        self.assertAlmostEqual(bloom_filter.size / len(sample), 9.585, places=2)
+        
+        for item in sample:
+            self.assertEqual(bloom_filter.search(item), 1, "Filter should never give false negatives")
+        
+        test_size = 20000
+        false_positives = sum(bloom_filter.search(f"definitely_not_inserted_{i}") == 1
+                              for i in range(test_size))
+        false_positive_rate = false_positives / test_size
+        print(f"False positive rate: {false_positive_rate:.4f}")
+        self.assertLess(false_positive_rate, target_rate * 2, "False positive rate should be near target")
+        
+        with self.assertRaises(ValueError):
+            BloomFilter(sample, false_positive_rate=1.5)
+    
+    @log_runtime
+    def test_bloom_filter_deterministic_hashing(self) -> None:
+        """
+        Test that hashing does not depend on the per-process PYTHONHASHSEED.
+        Verifies that filters built in separate processes have identical bit arrays.
+        """
+        repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        script = (
+            "import sys; sys.path.insert(0, sys.argv[1]);"
+            "from algorithms.bloom_filter import BloomFilter;"
+            "print(bytes(BloomFilter(sys.argv[2:], seed=7).bit_array.bits).hex())"
+        )
+        sample = self.dataset[:50]
+        outputs = set()
+        for hash_seed in ('1', '2'):
+            env = dict(os.environ, PYTHONHASHSEED=hash_seed)
+            outputs.add(subprocess.check_output([sys.executable, '-c', script, repo_root] + sample,
+                                                env=env, text=True))
+        self.assertEqual(len(outputs), 1, "Bit arrays should not depend on PYTHONHASHSEED")
+        self.assertEqual(outputs.pop().strip(), bytes(BloomFilter(sample, seed=7).bit_array.bits).hex())
+        self.assertNotEqual(bytes(BloomFilter(sample, seed=8).bit_array.bits),
+                            bytes(BloomFilter(sample, seed=7).bit_array.bits),
+                            "Different seeds should give different filters")
+    
+    @log_runtime
+    def test_bloom_filter_save_load(self) -> None:
+        """
+        Test writing the filter to disk and memory-mapping it back.
+        Verifies that the loaded filter answers exactly like the original.
+        """
+        sample = self.dataset[:2000]
+        for storage in ('packed', 'list'):
+            bloom_filter = BloomFilter(sample, storage=storage, false_positive_rate=0.01, seed=3)
+            with tempfile.TemporaryDirectory() as directory:
+                path = os.path.join(directory, 'bloom.bin')
+                bloom_filter.save(path)
+                loaded = BloomFilter.load(path)
+                
+                self.assertEqual(loaded.size, bloom_filter.size)
+                self.assertEqual(loaded.hash_count, bloom_filter.hash_count)
+                self.assertEqual(loaded.seed, 3)
+                self.assertEqual(loaded.count, len(sample))
+                self.assertEqual(loaded.false_positive_rate, 0.01)
+                for target in sample + [f"missing_{i}" for i in range(2000)]:
+                    self.assertEqual(loaded.search(target), bloom_filter.search(target))
+                del loaded
+                
+                with open(path, 'r+b') as file:
+                    file.seek(-1, os.SEEK_END)
+                    last = file.read(1)
+                    file.seek(-1, os.SEEK_END)
+                    file.write(bytes([last[0] ^ 0xFF]))
+                with self.assertRaises(ValueError):
+                    BloomFilter.load(path)
+    
+    @log_runtime
+    def test_bloom_filter_search_many(self) -> None:
+        """
+        Test vectorized batch lookups.
+        Verifies that search_many agrees with search for both storage engines.
+        """
+        sample = self.dataset[:5000]
+        targets = sample[:2000] + [f"missing_{i}" for i in range(5000)] + ["", "é" * 30]
+        for storage in ('packed', 'list'):
+            bloom_filter = BloomFilter(sample, storage=storage, false_positive_rate=0.05)
+            results = bloom_filter.search_many(targets)
+            self.assertEqual(results.tolist(), [bloom_filter.search(target) for target in targets])
+    
+    @log_runtime
+    def test_bloom_filter_bulk_build(self) -> None:
+        """
+        Test the vectorized bulk construction path.
+        Verifies that bulk-built filters match filters built one item at a time.
+        """
+        sample = self.dataset[:5000]
+        incremental = BloomFilter([], capacity=len(sample), false_positive_rate=0.01)
+        for item in sample:
+            incremental._add(item)
+        
+        bulk = BloomFilter(sample, false_positive_rate=0.01)
+        streamed = BloomFilter.from_iterable(iter(sample), capacity=len(sample),
+                                             false_positive_rate=0.01, chunk_size=999)
+        counted = BloomFilter.from_iterable(iter(sample), false_positive_rate=0.01)
+        for bloom_filter in (bulk, streamed, counted):
+            self.assertEqual(bytes(bloom_filter.bit_array.bits), bytes(incremental.bit_array.bits))
+            self.assertEqual(bloom_filter.count, len(sample))
+    
+    @log_runtime
+    def test_blocked_bloom_filter(self) -> None:
+        """
+        Test the blocked (cache-line) Bloom filter.
+        Verifies that every probe of an item stays inside one 512-bit block, that there are
+        no false negatives, and that batch lookups and bulk building agree with the scalar paths.
+        """
+        sample = self.dataset[:5000]
+        blocked = BlockedBloomFilter(sample, false_positive_rate=0.01)
+        self.assertEqual(blocked.size % BLOCK_BITS, 0, "Size should be a whole number of blocks")
+        self.assertGreaterEqual(blocked.size, BloomFilter(sample, false_positive_rate=0.01).size)
+        
+        for item in sample:
+            positions = blocked._positions(item)
+            self.assertEqual(len({position // BLOCK_BITS for position in positions}), 1,
+                             "All probes should fall in one block")
+            self.assertEqual(blocked.search(item), 1, "Filter should never give false negatives")
+        
+        targets = sample[:2000] + [f"missing_{i}" for i in range(20000)] + ["", "é" * 30]
+        results = blocked.search_many(targets)
+        self.assertEqual(results.tolist(), [blocked.search(target) for target in targets])
+        false_positive_rate = (results[2000:] == 1).mean()
+        print(f"Blocked false positive rate: {false_positive_rate:.4f}")
+        self.assertLess(false_positive_rate, 0.01 * 2, "False positive rate should stay near target")
+        
+        incremental = BlockedBloomFilter([], capacity=len(sample), false_positive_rate=0.01)
+        for item in sample:
+            incremental._add(item)
+        self.assertEqual(bytes(incremental.bit_array.bits), bytes(blocked.bit_array.bits))
+        
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'blocked.bin')
+            blocked.save(path)
+            loaded = BlockedBloomFilter.load(path)
+            self.assertIsInstance(loaded, BlockedBloomFilter)
+            self.assertEqual(loaded.search_many(targets).tolist(), results.tolist())
+            del loaded
+            with self.assertRaises(ValueError):
+                BloomFilter.load(path)
 
 if __name__ == '__main__':
     unittest.main()
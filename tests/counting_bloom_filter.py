@@ -0,0 +1,137 @@
+"""
+Unit tests for the counting Bloom filter implementation.
+Tests include performance measurements and correctness verification of additions and removals.
+"""
+
+import unittest
+import random
+import time
+import sys
+import os
+from typing import Callable, Any
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from algorithms.bloom_filter import BloomFilter
+from algorithms.counting_bloom_filter import CountingBloomFilter, COUNTER_MAX
+from dataset.dataset_reader import load_dataset
+
+
+def log_runtime(func: Callable) -> Callable:
+    """
+    Decorator to measure and log the runtime of test methods.
+    
+    Args:
+        func: The test method to measure
+        
+    Returns:
+        Wrapped function that logs runtime information
+    """
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        start_time = time.time()
+        result = func(*args, **kwargs)
+        end_time = time.time()
+        runtime = end_time - start_time
+        print(f"{func.__name__} runtime: {runtime:.6f} seconds \n\n")
+        return result
+    return wrapper
+
+
+class TestCountingBloomFilter(unittest.TestCase):
+    """Test suite for counting Bloom filter implementation."""
+    
+    def setUp(self) -> None:
+        """
+        Test fixture setup.
+        Loads dataset and initializes CountingBloomFilter instance.
+        """
+        self.dataset = load_dataset('dataset.txt')
+        self.sample = self.dataset[:5000]
+        self.counting_filter = CountingBloomFilter(self.sample, false_positive_rate=0.01)
+    
+    @log_runtime
+    def test_counting_bloom_filter_found(self) -> None:
+        """
+        Test searching for an existing element.
+        Verifies that the filter correctly identifies potential matches.
+        """
+        target = self.sample[random.randint(0, len(self.sample) - 1)]
+        result = self.counting_filter.search(target)
+        print(f"Test Counting Bloom Filter Found: target={target}, result={result}")
+        self.assertEqual(result, 1, "Filter should indicate potential match for existing element")
+    
+    @log_runtime
+    def test_counting_bloom_filter_not_found(self) -> None:
+        """
+        Test searching for a non-existent element.
+        Verifies that the filter correctly identifies definite non-matches.
+        """
+        result = self.counting_filter.search("nonexistent_element")
+        self.assertEqual(result, -1, "Filter should indicate definite non-match")
+        self.assertFalse(self.counting_filter.remove("nonexistent_element"),
+                         "Removing a definite non-member should fail")
+    
+    @log_runtime
+    def test_counting_bloom_filter_remove(self) -> None:
+        """
+        Test removing elements.
+        Verifies that removed elements disappear while the remaining ones are still found.
+        """
+        removed = self.sample[:2500]
+        kept = self.sample[2500:]
+        for item in removed:
+            self.assertTrue(self.counting_filter.remove(item), f"Failed to remove item: {item}")
+        self.assertEqual(self.counting_filter.count, len(kept))
+        
+        for item in kept:
+            self.assertEqual(self.counting_filter.search(item), 1, f"Item lost after removals: {item}")
+        still_found = sum(self.counting_filter.search(item) == 1 for item in removed)
+        print(f"Removed items still reported: {still_found}")
+        self.assertLess(still_found, len(removed) * 0.05, "Removed items should mostly be gone")
+        
+        for item in kept:
+            self.counting_filter.remove(item)
+        self.assertEqual(self.counting_filter.counters, bytearray(len(self.counting_filter.counters)),
+                         "Removing every item should clear every counter")
+    
+    @log_runtime
+    def test_counting_bloom_filter_saturation(self) -> None:
+        """
+        Test counter overflow.
+        Verifies that counters saturate at the 4-bit maximum and never underflow.
+        """
+        counting_filter = CountingBloomFilter([], capacity=10)
+        for _ in range(COUNTER_MAX + 5):
+            counting_filter.add("repeated_item")
+        for _ in range(COUNTER_MAX + 5):
+            self.assertTrue(counting_filter.remove("repeated_item"))
+        self.assertEqual(counting_filter.search("repeated_item"), 1,
+                         "Saturated counters should stay set")
+        self.assertTrue(all(byte & 0xF <= COUNTER_MAX and byte >> 4 <= COUNTER_MAX
+                            for byte in counting_filter.counters))
+    
+    @log_runtime
+    def test_counting_bloom_filter_matches_bloom_filter(self) -> None:
+        """
+        Test that sizing and hashing are shared with BloomFilter.
+        Verifies that the non-zero counters are exactly the bits a BloomFilter sets.
+        """
+        bloom_filter = BloomFilter(self.sample, false_positive_rate=0.01)
+        self.assertEqual(self.counting_filter.size, bloom_filter.size)
+        self.assertEqual(self.counting_filter.hash_count, bloom_filter.hash_count)
+        for index in range(bloom_filter.size):
+            self.assertEqual(bool(self.counting_filter._get(index)), bool(bloom_filter.bit_array.get(index)))
+        self.assertLess(self.counting_filter.nbytes, bloom_filter.bit_array.nbytes * 5)
+    
+    @log_runtime
+    def test_counting_bloom_filter_search_many(self) -> None:
+        """
+        Test vectorized batch lookups.
+        Verifies that search_many agrees with search.
+        """
+        targets = self.sample[:1000] + [f"missing_{i}" for i in range(5000)]
+        results = self.counting_filter.search_many(targets)
+        self.assertEqual(results.tolist(), [self.counting_filter.search(target) for target in targets])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -8,11 +8,14 @@ import random
 import time
 import sys
 import os
+import tempfile
 from typing import Callable, Any
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from algorithms.bloom_filter import BloomFilter
 from algorithms.cuckoo_filter import CuckooFilter
+from dataset.dataset_reader import load_dataset
 
 
 def log_runtime(func: Callable) -> Callable:
@@ -45,8 +48,7 @@ class TestCuckooFilter(unittest.TestCase):
         """
         self.capacity = 1000
         self.filter = CuckooFilter(capacity=self.capacity)
-        with open('dataset.txt', 'r') as file:
-            self.dataset = [line.strip() for line in file.readlines()]
+        self.dataset = load_dataset('dataset.txt')
     
     @log_runtime
     def test_insert_and_lookup(self) -> None:
@@ -100,7 +102,8 @@ class TestCuckooFilter(unittest.TestCase):
         Verifies that the filter handles capacity constraints appropriately.
         """
         inserted_count = 0
-        max_test_items = self.capacity * 2
+        # one more item than the filter has slots, which can never all be stored
+        max_test_items = self.filter.num_buckets * self.filter.bucket_size + 1
         
         for i in range(max_test_items):
             if self.filter.insert(f"test_item_{i}"):
@@ -132,6 +135,214 @@ class TestCuckooFilter(unittest.TestCase):
         false_positive_rate = false_positives / test_size
         print(f"False positive rate: {false_positive_rate:.4f}")
         self.assertLess(false_positive_rate, 0.1, "False positive rate should be reasonable")
+    
+    @log_runtime
+    def test_seeded_hashing(self) -> None:
+        """
+        Test that hashing is deterministic for a given seed.
+        Verifies that filters built with the same seed have identical tables.
+        """
+        test_items = self.dataset[:100]
+        first = CuckooFilter(capacity=self.capacity, seed=42)
+        second = CuckooFilter(capacity=self.capacity, seed=42)
+        other = CuckooFilter(capacity=self.capacity, seed=43)
+        for item in test_items:
+            first.insert(item)
+            second.insert(item)
+            other.insert(item)
+        
+        self.assertEqual(first.tables.to_bytes(), second.tables.to_bytes(),
+                         "Same seed should give identical tables")
+        self.assertNotEqual(first.tables.to_bytes(), other.tables.to_bytes(),
+                            "Different seeds should give different tables")
+    
+    @log_runtime
+    def test_save_load(self) -> None:
+        """
+        Test writing the filter to disk and memory-mapping it back.
+        Verifies that the loaded filter answers exactly like the original.
+        """
+        test_items = self.dataset[:500]
+        for item in test_items:
+            self.filter.insert(item)
+        
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'cuckoo.bin')
+            self.filter.save(path)
+            loaded = CuckooFilter.load(path)
+            
+            self.assertEqual(loaded.count, self.filter.count)
+            for item in test_items + [f"definitely_not_inserted_{i}" for i in range(1000)]:
+                self.assertEqual(loaded.search(item), self.filter.search(item))
+            del loaded
+            
+            with self.assertRaises(ValueError):
+                BloomFilter.load(path)
+    
+    @log_runtime
+    def test_no_false_negatives_at_high_load(self) -> None:
+        """
+        Test lookups after the filter has been filled to about 95% load.
+        Verifies that entries displaced by the kick loop remain findable and deletable.
+        """
+        cuckoo_filter = CuckooFilter(capacity=5000)
+        slots = cuckoo_filter.num_buckets * cuckoo_filter.bucket_size
+        test_items = self.dataset[:int(slots * 0.95)]
+        for item in test_items:
+            self.assertTrue(cuckoo_filter.insert(item), f"Failed to insert item: {item}")
+        
+        print(f"Load factor: {cuckoo_filter.load_factor:.4f}")
+        self.assertGreaterEqual(cuckoo_filter.load_factor, 0.94)
+        for item in test_items:
+            self.assertTrue(item in cuckoo_filter, f"Item not found after insertion: {item}")
+        
+        for item in test_items[:1000]:
+            self.assertTrue(cuckoo_filter.delete(item), f"Failed to delete item: {item}")
+        for item in test_items[1000:]:
+            self.assertTrue(item in cuckoo_filter, f"Item lost after deletions: {item}")
+    
+    @log_runtime
+    def test_storage_engines(self) -> None:
+        """
+        Test the flat and list-backed bucket tables across fingerprint widths.
+        Verifies that both engines hold identical tables and that the flat one is far smaller.
+        """
+        test_items = self.dataset[:3000]
+        for fingerprint_size in (8, 12, 16):
+            flat = CuckooFilter(capacity=3000, fingerprint_size=fingerprint_size, storage='flat')
+            reference = CuckooFilter(capacity=3000, fingerprint_size=fingerprint_size, storage='list')
+            for item in test_items:
+                flat.insert(item)
+                reference.insert(item)
+            
+            self.assertEqual(flat.tables.to_bytes(), reference.tables.to_bytes(),
+                             f"Engines should agree for {fingerprint_size}-bit fingerprints")
+            self.assertLess(flat.tables.nbytes * 10, reference.tables.nbytes,
+                            "Flat engine should be over an order of magnitude smaller")
+            for item in test_items:
+                self.assertTrue(item in flat, f"Item not found after insertion: {item}")
+            
+            with tempfile.TemporaryDirectory() as directory:
+                path = os.path.join(directory, 'cuckoo.bin')
+                flat.save(path)
+                loaded = CuckooFilter.load(path)
+                self.assertEqual(loaded.fingerprint_size, fingerprint_size)
+                for item in test_items[:500] + [f"definitely_not_inserted_{i}" for i in range(500)]:
+                    self.assertEqual(loaded.search(item), flat.search(item))
+                del loaded
+        
+        with self.assertRaises(ValueError):
+            CuckooFilter(capacity=10, fingerprint_size=32)
+        with self.assertRaises(ValueError):
+            CuckooFilter(capacity=10, storage='unknown')
+    
+    @log_runtime
+    def test_search_many(self) -> None:
+        """
+        Test vectorized batch lookups.
+        Verifies that search_many agrees with search across storage engines and widths.
+        """
+        test_items = self.dataset[:3000]
+        targets = test_items + [f"definitely_not_inserted_{i}" for i in range(3000)]
+        for storage, fingerprint_size in (('flat', 8), ('flat', 16), ('list', 8)):
+            cuckoo_filter = CuckooFilter(capacity=3000, fingerprint_size=fingerprint_size, storage=storage)
+            for item in test_items:
+                cuckoo_filter.insert(item)
+            results = cuckoo_filter.search_many(targets)
+            self.assertEqual(results.tolist(), [cuckoo_filter.search(target) for target in targets])
+        
+        cuckoo_filter = CuckooFilter(capacity=64, max_kicks=5)
+        inserted = []
+        for i in range(200):
+            if not cuckoo_filter.insert(f"test_item_{i}"):
+                break
+            inserted.append(f"test_item_{i}")
+        self.assertIsNotNone(cuckoo_filter.victim, "Filter should have stashed a victim")
+        self.assertEqual(cuckoo_filter.search_many(inserted).tolist(), [1] * len(inserted))
+    
+    @log_runtime
+    def test_bulk_build(self) -> None:
+        """
+        Test the vectorized bulk insertion path.
+        Verifies that every item is found and the filter can still be filled to high load.
+        """
+        test_items = self.dataset[:5000]
+        for storage in ('flat', 'list'):
+            cuckoo_filter = CuckooFilter.from_iterable(iter(test_items), storage=storage, chunk_size=1500)
+            self.assertEqual(cuckoo_filter.count, len(test_items))
+            for item in test_items:
+                self.assertTrue(item in cuckoo_filter, f"Item not found after bulk insertion: {item}")
+        
+        cuckoo_filter = CuckooFilter(capacity=5000)
+        slots = cuckoo_filter.num_buckets * cuckoo_filter.bucket_size
+        high_load = self.dataset[:int(slots * 0.95)]
+        self.assertEqual(cuckoo_filter.insert_many(high_load).tolist(), [])
+        self.assertEqual(cuckoo_filter.search_many(high_load).tolist(), [1] * len(high_load))
+        
+        overfull = CuckooFilter(capacity=1000)
+        slots = overfull.num_buckets * overfull.bucket_size
+        unstored = overfull.insert_many(f"test_item_{i}" for i in range(slots + 100))
+        stored = slots + 100 - len(unstored)
+        print(f"Successfully bulk inserted {stored} items before filter was full")
+        self.assertLessEqual(stored, slots + 1, "Should not be able to insert more than the table holds")
+        self.assertEqual(overfull.count, stored)
+    
+    @log_runtime
+    def test_insert_many_reports_unstored(self) -> None:
+        """
+        Test that bulk insertion into a filter that fills up names the items left out.
+        Verifies that every item not reported as unstored is found.
+        """
+        items = [f"test_item_{i}" for i in range(4096)]
+        for max_kicks in (5, 500):
+            cuckoo_filter = CuckooFilter(1000, max_kicks=max_kicks)
+            unstored = cuckoo_filter.insert_many(items, chunk_size=1500)
+            self.assertGreater(len(unstored), 0)
+            self.assertEqual(unstored.tolist(), sorted(set(unstored.tolist())))
+            self.assertEqual(cuckoo_filter.count, len(items) - len(unstored))
+            missing = set(unstored.tolist())
+            stored = [item for index, item in enumerate(items) if index not in missing]
+            self.assertEqual(cuckoo_filter.search_many(stored).tolist(), [1] * len(stored))
+    
+    @log_runtime
+    def test_semi_sorted_buckets(self) -> None:
+        """
+        Test semi-sorted bucket compression on the flat engine.
+        Verifies the memory saving, lookups, deletions, batch lookups and save/load.
+        """
+        test_items = self.dataset[:3000]
+        targets = test_items + [f"definitely_not_inserted_{i}" for i in range(3000)]
+        for fingerprint_size in (8, 12):
+            flat = CuckooFilter(capacity=3000, fingerprint_size=fingerprint_size)
+            compressed = CuckooFilter(capacity=3000, fingerprint_size=fingerprint_size, semi_sorted=True)
+            for item in test_items:
+                self.assertTrue(compressed.insert(item), f"Failed to insert item: {item}")
+            
+            slots = compressed.num_buckets * compressed.bucket_size
+            print(f"{fingerprint_size}-bit: flat={flat.tables.nbytes} bytes, semi-sorted={compressed.tables.nbytes} bytes")
+            self.assertLessEqual(compressed.tables.nbytes * 8, slots * (fingerprint_size - 1) + 64,
+                                 "Semi-sorting should save one bit per slot")
+            results = compressed.search_many(targets)
+            self.assertEqual(results.tolist(), [compressed.search(target) for target in targets])
+            self.assertEqual(results[:len(test_items)].tolist(), [1] * len(test_items))
+            
+            with tempfile.TemporaryDirectory() as directory:
+                path = os.path.join(directory, 'cuckoo.bin')
+                compressed.save(path)
+                loaded = CuckooFilter.load(path)
+                self.assertTrue(loaded.semi_sorted)
+                self.assertEqual(loaded.search_many(targets).tolist(), results.tolist())
+                del loaded
+            
+            for item in test_items[:1500]:
+                self.assertTrue(compressed.delete(item), f"Failed to delete item: {item}")
+            for item in test_items[1500:]:
+                self.assertTrue(item in compressed, f"Item lost after deletions: {item}")
+        
+        with self.assertRaises(ValueError):
+            CuckooFilter(capacity=10, storage='list', semi_sorted=True)
+        with self.assertRaises(ValueError):
+            CuckooFilter(capacity=10, bucket_size=2, semi_sorted=True)
 
 if __name__ == '__main__':
     unittest.main()
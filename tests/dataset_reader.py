@@ -0,0 +1,122 @@
+"""
+Unit tests for the memory-mapped dataset reader.
+Tests include performance measurements and correctness verification.
+"""
+
+import unittest
+import tempfile
+import time
+import sys
+import os
+from typing import Callable, Any
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dataset.dataset_reader import DatasetReader, load_dataset
+
+
+def log_runtime(func: Callable) -> Callable:
+    """
+    Decorator to measure and log the runtime of test methods.
+    
+    Args:
+        func: The test method to measure
+        
+    Returns:
+        Wrapped function that logs runtime information
+    """
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        start_time = time.time()
+        result = func(*args, **kwargs)
+        end_time = time.time()
+        runtime = end_time - start_time
+        print(f"{func.__name__} runtime: {runtime:.6f} seconds \n\n")
+        return result
+    return wrapper
+
+
+class TestDatasetReader(unittest.TestCase):
+    """Test suite for dataset reader implementation."""
+    
+    def setUp(self) -> None:
+        """
+        Test fixture setup.
+        Reads dataset the way the tests used to, for comparison.
+        """
+        with open('dataset.txt', 'r') as file:
+            self.dataset = [line.strip() for line in file.readlines()]
+    
+    @log_runtime
+    def test_dataset_reader_lines(self) -> None:
+        """
+        Test the reader against readlines on the dataset file.
+        Verifies lines, negative indexes, iteration and load_dataset.
+        """
+        reader = DatasetReader('dataset.txt')
+        self.assertEqual(len(reader), len(self.dataset))
+        self.assertEqual(reader.tolist(), self.dataset)
+        self.assertEqual(reader[0], self.dataset[0])
+        self.assertEqual(reader[-1], self.dataset[-1])
+        self.assertEqual(list(reader[100:110]), self.dataset[100:110])
+        self.assertEqual(bytes(reader.line_bytes(3)), (self.dataset[3] + '\n').encode())
+        self.assertEqual(load_dataset('dataset.txt', 500), self.dataset[:500])
+        with self.assertRaises(IndexError):
+            reader[len(self.dataset)]
+    
+    @log_runtime
+    def test_dataset_reader_views(self) -> None:
+        """
+        Test slicing into views.
+        Verifies that views share the mapping and nest like list slices.
+        """
+        reader = DatasetReader('dataset.txt')
+        view = reader[:1000]
+        self.assertIs(view._data, reader._data)
+        self.assertEqual(len(view), 1000)
+        for start, stop in [(0, 0), (10, 5), (-20, None), (995, 2000), (None, -995)]:
+            self.assertEqual(view[start:stop].tolist(), self.dataset[:1000][start:stop])
+        self.assertEqual(view[10:][5:20].tolist(), self.dataset[15:30])
+        with self.assertRaises(ValueError):
+            view[::2]
+    
+    @log_runtime
+    def test_dataset_reader_index_cache(self) -> None:
+        """
+        Test the cached line index on small files.
+        Verifies reuse, rebuilding after a change, empty files and a missing final line break.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'names.txt')
+            for text in ["", "a\n", "a\nb", " a \n\nb\r\nc\n", "é\nü\n"]:
+                with open(path, 'w', newline='') as file:
+                    file.write(text)
+                expected = [line.strip() for line in text.split('\n')]
+                if text.endswith('\n') or not text:
+                    expected.pop()
+                self.assertEqual(DatasetReader(path).tolist(), expected, repr(text))
+                self.assertTrue(os.path.exists(path + '.idx'))
+                self.assertEqual(DatasetReader(path).tolist(), expected, repr(text))
+                self.assertEqual(DatasetReader(path, cache=False).tolist(), expected, repr(text))
+    
+    @log_runtime
+    def test_dataset_reader_speed(self) -> None:
+        """
+        Test loading a prefix of the dataset against reading the whole file.
+        Verifies that a view of a small prefix loads faster than readlines.
+        """
+        DatasetReader('dataset.txt')  # build the cached index
+        start_time = time.time()
+        for _ in range(20):
+            with open('dataset.txt', 'r') as file:
+                lines = [line.strip() for line in file.readlines()][:1000]
+        readlines_time = time.time() - start_time
+        start_time = time.time()
+        for _ in range(20):
+            prefix = DatasetReader('dataset.txt')[:1000].tolist()
+        reader_time = time.time() - start_time
+        print(f"readlines: {readlines_time:.6f}s, reader: {reader_time:.6f}s")
+        self.assertEqual(prefix, lines)
+        self.assertLess(reader_time, readlines_time)
+
+if __name__ == '__main__':
+    unittest.main()
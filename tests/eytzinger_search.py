@@ -0,0 +1,111 @@
+"""
+Unit tests for the Eytzinger-layout search implementation.
+Tests include performance measurements and correctness verification against binary search.
+"""
+
+import unittest
+import random
+import time
+import sys
+import os
+from typing import Callable, Any
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from algorithms.binary_search import BinarySearch
+from algorithms.eytzinger_search import EytzingerSearch, eytzinger_ranks
+from dataset.dataset_reader import load_dataset
+
+
+def log_runtime(func: Callable) -> Callable:
+    """
+    Decorator to measure and log the runtime of test methods.
+    
+    Args:
+        func: The test method to measure
+        
+    Returns:
+        Wrapped function that logs runtime information
+    """
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        start_time = time.time()
+        result = func(*args, **kwargs)
+        end_time = time.time()
+        runtime = end_time - start_time
+        print(f"{func.__name__} runtime: {runtime:.6f} seconds \n\n")
+        return result
+    return wrapper
+
+
+class TestEytzingerSearch(unittest.TestCase):
+    """Test suite for Eytzinger-layout search implementation."""
+    
+    def setUp(self) -> None:
+        """
+        Test fixture setup.
+        Loads sorted dataset and builds the Eytzinger index.
+        """
+        self.dataset = load_dataset('sorted_dataset.txt')
+        self.eytzinger_search = EytzingerSearch(self.dataset)
+    
+    @log_runtime
+    def test_eytzinger_search_found(self) -> None:
+        """
+        Test searching for an existing element.
+        Verifies that the returned index refers to the original sorted array.
+        """
+        target = self.dataset[random.randint(0, len(self.dataset) - 1)]
+        result = self.eytzinger_search.search(target)
+        print(f"Test Eytzinger Search Found: target={target}, result={result}")
+        self.assertNotEqual(result, -1, "Search should find existing element")
+        self.assertEqual(self.dataset[result], target, "Found index should contain target")
+    
+    @log_runtime
+    def test_eytzinger_search_not_found(self) -> None:
+        """
+        Test searching for non-existent elements, including ones before and after every key.
+        Verifies that the search correctly returns -1 for missing elements.
+        """
+        for target in ("nonexistent_element", "", "~", self.dataset[0][:-1], self.dataset[-1] + "x"):
+            self.assertEqual(self.eytzinger_search.search(target), -1, f"Should not find {target!r}")
+        self.assertEqual(EytzingerSearch([]).search("a"), -1)
+    
+    @log_runtime
+    def test_eytzinger_search_first_last(self) -> None:
+        """
+        Test searching for first and last elements.
+        Verifies correct handling of boundary elements.
+        """
+        self.assertEqual(self.eytzinger_search.search(self.dataset[0]), 0, "Should find first element")
+        self.assertEqual(self.eytzinger_search.search(self.dataset[-1]), len(self.dataset) - 1,
+                         "Should find last element")
+    
+    @log_runtime
+    def test_eytzinger_layout(self) -> None:
+        """
+        Test the breadth-first layout and shared-prefix keys for every tree size up to 64.
+        Verifies in-order ranks and agreement with binary search, including duplicates.
+        """
+        self.assertEqual(eytzinger_ranks(7).tolist(), [-1, 3, 1, 5, 0, 2, 4, 6])
+        for n in range(65):
+            arr = sorted(random.choice(["user", "username", "usernameA", "é"]) + str(random.randint(0, 9))
+                         for _ in range(n))
+            eytzinger_search = EytzingerSearch(arr)
+            targets = arr + ["", "user", "username0x", "zzz"]
+            expected = [arr.index(target) if target in arr else -1 for target in targets]
+            self.assertEqual([eytzinger_search.search(target) for target in targets], expected)
+            self.assertEqual(eytzinger_search.search_many(targets).tolist(), expected)
+    
+    @log_runtime
+    def test_eytzinger_search_many(self) -> None:
+        """
+        Test vectorized batch lookups.
+        Verifies that search_many agrees with search and with BinarySearch.search_many.
+        """
+        targets = random.sample(self.dataset, 1000) + ["nonexistent_element", "", "~"]
+        results = self.eytzinger_search.search_many(targets)
+        self.assertEqual(results.tolist(), [self.eytzinger_search.search(target) for target in targets])
+        self.assertEqual(results.tolist(), BinarySearch(self.dataset).search_many(targets).tolist())
+
+if __name__ == '__main__':
+    unittest.main()
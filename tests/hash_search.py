@@ -8,11 +8,13 @@ import random
 import time
 import sys
 import os
+import tempfile
 from typing import Callable, Any
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from algorithms.hash_search import HashSearch
+from dataset.dataset_reader import load_dataset
 
 
 def log_runtime(func: Callable) -> Callable:
@@ -43,10 +45,9 @@ class TestHashSearch(unittest.TestCase):
         Test fixture setup.
         Loads dataset and initializes HashSearch instance.
         """
-        with open('dataset.txt', 'r') as file:
-            self.dataset = [line.strip() for line in file.readlines()]
-            self.hash_table = HashSearch(self.dataset)
-            self.hash_search = self.hash_table.search
+        self.dataset = load_dataset('dataset.txt')
+        self.hash_table = HashSearch(self.dataset)
+        self.hash_search = self.hash_table.search
     
     @log_runtime
     def test_hash_search_found(self) -> None:
@@ -94,6 +95,51 @@ class TestHashSearch(unittest.TestCase):
         
         last_result = self.hash_search(last)
         self.assertEqual(last_result, len(self.dataset) - 1, "Should find last element")
+    
+    @log_runtime
+    def test_hash_search_many(self) -> None:
+        """
+        Test batch lookups.
+        Verifies that search_many agrees with search for present and missing targets.
+        """
+        targets = random.sample(self.dataset, 1000) + ["nonexistent_element", ""]
+        results = self.hash_table.search_many(targets)
+        self.assertEqual(results.tolist(), [self.hash_table.search(target) for target in targets])
+    
+    @log_runtime
+    def test_hash_search_compact_storage(self) -> None:
+        """
+        Test the compact hash table storage, including duplicate keys and save/load.
+        Verifies identical results to dict storage and a smaller memory footprint.
+        """
+        compact = HashSearch(self.dataset, storage='compact')
+        targets = random.sample(self.dataset, 1000) + ["nonexistent_element", "", self.dataset[0] + "x"]
+        expected = [self.hash_search(target) for target in targets]
+        self.assertEqual([compact.search(target) for target in targets], expected)
+        self.assertEqual(compact.search_many(targets).tolist(), expected)
+        
+        for n in range(40):
+            arr = [random.choice(["", "a", "ab", "é", "a\0"]) + str(random.randint(0, 9)) for _ in range(n)]
+            targets = arr + ["", "a", "zz"]
+            expected = HashSearch(arr).search_many(targets).tolist()
+            self.assertEqual([HashSearch(arr, storage='compact').search(target) for target in targets], expected)
+            self.assertEqual(HashSearch(arr, storage='compact').search_many(targets).tolist(), expected)
+        
+        dict_bytes = sys.getsizeof(self.hash_table.hash_table) + sum(
+            sys.getsizeof(key) + sys.getsizeof(index) for key, index in self.hash_table.hash_table.items())
+        print(f"compact table: {compact.hash_table.nbytes} bytes, dict: {dict_bytes} bytes")
+        self.assertLess(compact.hash_table.nbytes, dict_bytes * 0.75)
+        
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'hash_search.bin')
+            compact.save(path)
+            loaded = HashSearch.load(path)
+            self.assertEqual(loaded.search_many(targets).tolist(), compact.search_many(targets).tolist())
+            self.assertEqual(loaded.search(self.dataset[-1]), len(self.dataset) - 1)
+            with self.assertRaises(ValueError):
+                self.hash_table.save(path)
+        with self.assertRaises(ValueError):
+            HashSearch(self.dataset, storage='unknown')
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,74 @@
+"""
+Unit tests for the shared seeded hash functions.
+Tests include performance measurements and correctness verification.
+"""
+
+import unittest
+import time
+import sys
+import os
+from typing import Callable, Any
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from algorithms.bloom_filter import BloomFilter
+from algorithms.hashing import hash64_many, hash_str
+
+
+def log_runtime(func: Callable) -> Callable:
+    """
+    Decorator to measure and log the runtime of test methods.
+    
+    Args:
+        func: The test method to measure
+        
+    Returns:
+        Wrapped function that logs runtime information
+    """
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        start_time = time.time()
+        result = func(*args, **kwargs)
+        end_time = time.time()
+        runtime = end_time - start_time
+        print(f"{func.__name__} runtime: {runtime:.6f} seconds \n\n")
+        return result
+    return wrapper
+
+
+class TestHashing(unittest.TestCase):
+    """Test suite for the hash64 family of hash functions."""
+    
+    @log_runtime
+    def test_seeded_hash_collisions(self) -> None:
+        """
+        Test that inputs colliding under one seed are separated by the seed.
+        Verifies pairs with equal residues of an unkeyed hash differ under every seed.
+        """
+        pairs = [('JamesSmith0123456789abcdef', 'RamesSmish0123456789abcdef'),
+                 ('aaaaaaaabbbbbbbb', 'iaaaaaaaabbbbbbb')]
+        for first, second in pairs:
+            for seed in range(20):
+                self.assertNotEqual(hash_str(first, seed), hash_str(second, seed))
+            self.assertEqual(hash64_many([first, second], 5).tolist(), [hash_str(first, 5), hash_str(second, 5)])
+        self.assertEqual(BloomFilter(['aaaaaaaabbbbbbbb']).search('iaaaaaaaabbbbbbb'), -1)
+    
+    @log_runtime
+    def test_hash64_many_matches_hash_str(self) -> None:
+        """
+        Test the vectorized hash against the scalar one on edge-case strings.
+        Verifies empty strings, embedded and trailing NUL bytes, non-ASCII text and
+        strings longer than 64 bytes hash identically under several seeds.
+        """
+        items = ['', '', 'a', '\0', '\0\0', 'a\0', '\0a', 'ab\0cd\0', 'é', 'naïve', '日本語', '🙂' * 3,
+                 'x' * 64, 'y' * 65, 'JamesSmith' * 13, 'ü' * 40 + '\0' + 'z' * 30]
+        for seed in (0, 1, 7, 2 ** 64 - 1):
+            expected = [hash_str(item, seed) for item in items]
+            self.assertEqual(hash64_many(items, seed).tolist(), expected)
+            for item in items:
+                self.assertEqual(hash64_many([item], seed).tolist(), [hash_str(item, seed)])
+        self.assertEqual(len(hash64_many([])), 0)
+        self.assertNotEqual(hash_str(''), hash_str('\0'), "Inputs of different lengths should differ")
+        self.assertNotEqual(hash_str('a'), hash_str('a', 1), "Seeds should give different hashes")
+
+if __name__ == '__main__':
+    unittest.main()
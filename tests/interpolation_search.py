@@ -0,0 +1,112 @@
+"""
+Unit tests for the interpolation search implementation.
+Tests include performance measurements, probe counts and correctness verification against binary search.
+"""
+
+import unittest
+import random
+import time
+import uuid
+import sys
+import os
+from typing import Callable, Any
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from algorithms.binary_search import BinarySearch
+from algorithms.interpolation_search import InterpolationSearch
+from dataset.dataset_reader import load_dataset
+
+
+def log_runtime(func: Callable) -> Callable:
+    """
+    Decorator to measure and log the runtime of test methods.
+    
+    Args:
+        func: The test method to measure
+        
+    Returns:
+        Wrapped function that logs runtime information
+    """
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        start_time = time.time()
+        result = func(*args, **kwargs)
+        end_time = time.time()
+        runtime = end_time - start_time
+        print(f"{func.__name__} runtime: {runtime:.6f} seconds \n\n")
+        return result
+    return wrapper
+
+
+class TestInterpolationSearch(unittest.TestCase):
+    """Test suite for interpolation search implementation."""
+    
+    def setUp(self) -> None:
+        """
+        Test fixture setup.
+        Loads sorted dataset for interpolation search testing.
+        """
+        self.dataset = load_dataset('sorted_dataset.txt')
+        self.interpolation_search = InterpolationSearch(self.dataset)
+    
+    @log_runtime
+    def test_interpolation_search_found(self) -> None:
+        """
+        Test searching for existing elements, including the first and last.
+        Verifies that the search correctly finds and returns the proper index.
+        """
+        for target in random.sample(self.dataset, 500):
+            self.assertEqual(self.dataset[self.interpolation_search.search(target)], target)
+        self.assertEqual(self.interpolation_search.search(self.dataset[0]), 0, "Should find first element")
+        self.assertEqual(self.interpolation_search.search(self.dataset[-1]), len(self.dataset) - 1,
+                         "Should find last element")
+    
+    @log_runtime
+    def test_interpolation_search_not_found(self) -> None:
+        """
+        Test searching for non-existent elements, including ones before and after every key.
+        Verifies that the search correctly returns -1 for missing elements.
+        """
+        for target in ("nonexistent_element", "", "~", "é", self.dataset[0][:-1], self.dataset[-1] + "x"):
+            self.assertEqual(self.interpolation_search.search(target), -1, f"Should not find {target!r}")
+        for target in random.sample(self.dataset, 100):
+            self.assertEqual(self.interpolation_search.search(target + "!"), -1)
+        self.assertEqual(InterpolationSearch([]).search("a"), -1)
+    
+    @log_runtime
+    def test_interpolation_search_shared_prefixes(self) -> None:
+        """
+        Test small arrays of keys that are prefixes of each other or hold rare bytes.
+        Verifies agreement with binary search for every tested target.
+        """
+        stems = ["", "a", "ab", "abc\0", "é", "b"]
+        for n in range(40):
+            arr = sorted({random.choice(stems) + str(random.randint(0, 99)) for _ in range(n)})
+            interpolation_search = InterpolationSearch(arr, max_bad_guesses=random.randint(0, 3))
+            binary_search = BinarySearch(arr)
+            for target in arr + stems + ["zz", "abc", "abc\0x"]:
+                self.assertEqual(interpolation_search.search(target), binary_search.search(target))
+    
+    @log_runtime
+    def test_interpolation_search_probes(self) -> None:
+        """
+        Test probe counts on uniformly distributed uuid keys and on the dataset.
+        Verifies fewer probes than binary search on uniform keys and a bounded count otherwise.
+        """
+        keys = sorted(str(uuid.uuid4()) for _ in range(100000))
+        interpolation_search = InterpolationSearch(keys)
+        binary_search = BinarySearch(keys)
+        targets = random.sample(keys, 500)
+        interpolation_probes = sum(map(interpolation_search.probe_count, targets)) / len(targets)
+        binary_probes = sum(map(binary_search.probe_count, targets)) / len(targets)
+        print(f"uniform keys: interpolation {interpolation_probes:.1f} probes, binary {binary_probes:.1f} probes")
+        self.assertLess(interpolation_probes, binary_probes * 0.75)
+        
+        binary_search = BinarySearch(self.dataset)
+        limit = 2 * len(self.dataset).bit_length() + 2
+        for target in random.sample(self.dataset, 500):
+            self.assertLessEqual(binary_search.probe_count(target), len(self.dataset).bit_length())
+            self.assertLessEqual(self.interpolation_search.probe_count(target), limit)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,120 @@
+"""
+Unit tests for the learned index implementation.
+Tests include performance measurements and correctness verification against binary search.
+"""
+
+import unittest
+import random
+import time
+import sys
+import os
+from typing import Callable, Any
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from algorithms.binary_search import BinarySearch
+from algorithms.learned_index import LearnedIndex, fit_segments
+from dataset.dataset_reader import load_dataset
+
+
+def log_runtime(func: Callable) -> Callable:
+    """
+    Decorator to measure and log the runtime of test methods.
+    
+    Args:
+        func: The test method to measure
+        
+    Returns:
+        Wrapped function that logs runtime information
+    """
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        start_time = time.time()
+        result = func(*args, **kwargs)
+        end_time = time.time()
+        runtime = end_time - start_time
+        print(f"{func.__name__} runtime: {runtime:.6f} seconds \n\n")
+        return result
+    return wrapper
+
+
+class TestLearnedIndex(unittest.TestCase):
+    """Test suite for learned index implementation."""
+    
+    def setUp(self) -> None:
+        """
+        Test fixture setup.
+        Loads sorted dataset and fits the learned index.
+        """
+        self.dataset = load_dataset('sorted_dataset.txt')
+        self.learned_index = LearnedIndex(self.dataset)
+    
+    @log_runtime
+    def test_learned_index_found(self) -> None:
+        """
+        Test searching for existing elements, including the first and last.
+        Verifies that the search correctly finds and returns the proper index.
+        """
+        target = self.dataset[random.randint(0, len(self.dataset) - 1)]
+        result = self.learned_index.search(target)
+        print(f"Test Learned Index Found: target={target}, result={result}")
+        self.assertEqual(self.dataset[result], target, "Found index should contain target")
+        self.assertEqual(self.learned_index.search(self.dataset[0]), 0, "Should find first element")
+        self.assertEqual(self.learned_index.search(self.dataset[-1]), len(self.dataset) - 1,
+                         "Should find last element")
+    
+    @log_runtime
+    def test_learned_index_not_found(self) -> None:
+        """
+        Test searching for non-existent elements, including ones before and after every key.
+        Verifies that the search correctly returns -1 for missing elements.
+        """
+        for target in ("nonexistent_element", "", "~", self.dataset[0][:-1], self.dataset[-1] + "x"):
+            self.assertEqual(self.learned_index.search(target), -1, f"Should not find {target!r}")
+        self.assertEqual(LearnedIndex([]).search("a"), -1)
+        with self.assertRaises(ValueError):
+            LearnedIndex(self.dataset, epsilon=-1)
+    
+    @log_runtime
+    def test_learned_index_error_bound(self) -> None:
+        """
+        Test the fitted model on the dataset for several error bounds.
+        Verifies every prediction is within epsilon + 1 and the model is smaller than the data.
+        """
+        for epsilon in (0, 4, 32):
+            learned_index = LearnedIndex(self.dataset, epsilon)
+            errors = [abs(learned_index.predict(key) - index) for index, key in enumerate(self.dataset)
+                      if index == 0 or self.dataset[index - 1] != key]
+            print(f"epsilon={epsilon}: {learned_index.num_segments} segments, max error {max(errors)}")
+            self.assertLessEqual(max(errors), epsilon + 1)
+        self.assertLess(self.learned_index.num_segments, len(self.dataset) // 10)
+        self.assertEqual(fit_segments([0, 10, 20, 30], [0, 1, 2, 3], 0), [(0, 30, 0, 1, 10)])
+    
+    @log_runtime
+    def test_learned_index_shared_prefixes(self) -> None:
+        """
+        Test keys that are prefixes of each other, duplicated, multi-byte or empty.
+        Verifies agreement with the leftmost index for scalar and batch lookups.
+        """
+        stems = ["", "a", "abcdefghijklmnop", "abcdefghijklmnopq", "é" * 9]
+        for n in range(60):
+            arr = sorted(random.choice(stems) + random.choice(["", "0", "1", "10"]) for _ in range(n))
+            for epsilon in (0, 2):
+                learned_index = LearnedIndex(arr, epsilon)
+                targets = arr + stems + ["abcdefghijklmnop2", "abcdefghijklmnopq\0", "é" * 40, "zzz"]
+                expected = [arr.index(target) if target in arr else -1 for target in targets]
+                self.assertEqual([learned_index.search(target) for target in targets], expected)
+                self.assertEqual(learned_index.search_many(targets).tolist(), expected)
+    
+    @log_runtime
+    def test_learned_index_search_many(self) -> None:
+        """
+        Test batch lookups.
+        Verifies that search_many agrees with BinarySearch.search_many.
+        """
+        targets = random.sample(self.dataset, 2000) + [key + "x" for key in self.dataset[:200]]
+        targets += [key[:-1] for key in self.dataset[:200]] + ["nonexistent_element", ""]
+        results = self.learned_index.search_many(targets)
+        self.assertEqual(results.tolist(), BinarySearch(self.dataset).search_many(targets).tolist())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -12,7 +12,9 @@ from typing import Callable, Any
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from algorithms.linear_search import linear_search
+from algorithms.aho_corasick import AhoCorasick
+from algorithms.linear_search import LinearSearch
+from dataset.dataset_reader import load_dataset
 
 
 def log_runtime(func: Callable) -> Callable:
@@ -43,8 +45,7 @@ class TestLinearSearch(unittest.TestCase):
         Test fixture setup.
         Loads dataset for linear search testing.
         """
-        with open('dataset.txt', 'r') as file:
-            self.dataset = [line.strip() for line in file.readlines()]
+        self.dataset = load_dataset('dataset.txt')
     
     @log_runtime
     def test_linear_search_found(self) -> None:
@@ -53,7 +54,7 @@ class TestLinearSearch(unittest.TestCase):
         Verifies that the search correctly finds and returns the proper index.
         """
         target = self.dataset[random.randint(0, len(self.dataset) - 1)]
-        result = linear_search(self.dataset, target)
+        result = LinearSearch(self.dataset).search(target)
         print(f"Test Linear Search Found: target={target}, result={result}")
         self.assertNotEqual(result, -1, "Search should find existing element")
         self.assertEqual(self.dataset[result], target, "Found index should contain target")
@@ -65,7 +66,7 @@ class TestLinearSearch(unittest.TestCase):
         Verifies that the search correctly returns -1 for missing elements.
         """
         target = "nonexistent_element"
-        result = linear_search(self.dataset, target)
+        result = LinearSearch(self.dataset).search(target)
         print(f"Test Linear Search Not Found: target={target}, result={result}")
         self.assertEqual(result, -1, "Search should return -1 for non-existent element")
     
@@ -75,7 +76,7 @@ class TestLinearSearch(unittest.TestCase):
         Test searching for an empty string.
         Verifies correct handling of edge cases.
         """
-        result = linear_search(self.dataset, "")
+        result = LinearSearch(self.dataset).search("")
         self.assertEqual(result, -1, "Search should handle empty string")
     
     @log_runtime
@@ -87,11 +88,108 @@ class TestLinearSearch(unittest.TestCase):
         first = self.dataset[0]
         last = self.dataset[-1]
         
-        first_result = linear_search(self.dataset, first)
+        first_result = LinearSearch(self.dataset).search(first)
         self.assertEqual(first_result, 0, "Should find first element")
         
-        last_result = linear_search(self.dataset, last)
+        last_result = LinearSearch(self.dataset).search(last)
         self.assertEqual(last_result, len(self.dataset) - 1, "Should find last element")
+    
+    @log_runtime
+    def test_linear_search_many(self) -> None:
+        """
+        Test batch lookups.
+        Verifies that search_many agrees with search for present and missing targets.
+        """
+        sample = self.dataset[:2000]
+        linear_search = LinearSearch(sample)
+        targets = random.sample(sample, 50) + ["nonexistent_element", ""]
+        results = linear_search.search_many(targets)
+        self.assertEqual(results.tolist(), [linear_search.search(target) for target in targets])
+    
+    @log_runtime
+    def test_linear_search_many_modes(self) -> None:
+        """
+        Test single-pass exact, prefix and substring batch lookups on both engines.
+        Verifies the first matching index against a brute-force scan of each target.
+        """
+        arr = self.dataset[:3000] * 2
+        targets = (random.sample(arr, 200) + [item[:random.randint(0, len(item))] for item in random.sample(arr, 200)]
+                   + [item[random.randint(0, 30):random.randint(31, 45)] for item in random.sample(arr, 200)]
+                   + ["nonexistent_element", "", "a", "e-4", arr[-1] + "x"] * 2)
+        checks = {
+            'exact': lambda item, target: item == target,
+            'prefix': lambda item, target: item.startswith(target),
+            'substring': lambda item, target: target in item,
+        }
+        for mode, check in checks.items():
+            expected = [next((index for index, item in enumerate(arr) if check(item, target)), -1) for target in targets]
+            for engine in ('packed', 'loop'):
+                results = LinearSearch(arr, engine=engine).search_many(targets, mode=mode)
+                self.assertEqual(results.tolist(), expected, f"{mode} lookups with the {engine} engine")
+                self.assertEqual(LinearSearch(arr, engine=engine).search_many([], mode=mode).tolist(), [])
+        
+        patterns = ["he", "she", "his", "hers", "", "he"]
+        matches = sorted(AhoCorasick(patterns).occurrences("ushers"))
+        self.assertEqual(matches, [0, 1, 3, 4, 5])
+        self.assertEqual(list(AhoCorasick(patterns).prefixes("hers")), [4, 0, 5, 3])
+        with self.assertRaises(ValueError):
+            LinearSearch(arr).search_many(targets, mode='unknown')
+    
+    @log_runtime
+    def test_linear_search_engines(self) -> None:
+        """
+        Test the packed and loop engines on duplicates, zero bytes, empty and appended keys.
+        Verifies that both engines return the first index holding each target.
+        """
+        for n in range(40):
+            arr = [random.choice(["", "a", "ab", "é", "b\0", "a\n"]) + random.choice(["", "0", "1"]) for _ in range(n)]
+            packed = LinearSearch(list(arr))
+            loop = LinearSearch(list(arr), engine='loop')
+            targets = arr + ["", "a", "b", "zz", "a\nb"]
+            for item in ["new", "", "a", "a key longer than any key before it", "b\0"] * 3:
+                packed.append(item)
+                loop.append(item)
+                targets.append(item)
+                self.assertEqual(packed.search(item), loop.search(item))
+            self.assertEqual([packed.search(target) for target in targets],
+                             [loop.search(target) for target in targets])
+        with self.assertRaises(ValueError):
+            LinearSearch(self.dataset, engine='unknown')
+    
+    @log_runtime
+    def test_linear_search_append_filter_column(self) -> None:
+        """
+        Test the filter column of an array grown from empty with append().
+        Verifies that it matches the column chosen when packing the same keys at once.
+        """
+        for n in (4096, 10000):
+            grown = LinearSearch([])
+            for item in self.dataset[:n]:
+                grown.append(item)
+            packed = LinearSearch(self.dataset[:n])
+            self.assertEqual(grown.filter_column, packed.filter_column, f"n={n}")
+            targets = random.sample(self.dataset[:n], 20) + ["nonexistent_element"]
+            self.assertEqual([grown.search(target) for target in targets],
+                             [packed.search(target) for target in targets])
+    
+    @log_runtime
+    def test_linear_search_packed_speed(self) -> None:
+        """
+        Test the packed engine against the loop engine on the full dataset.
+        Verifies identical results and a faster scan.
+        """
+        packed = LinearSearch(self.dataset)
+        loop = LinearSearch(self.dataset, engine='loop')
+        targets = random.sample(self.dataset, 100) + ["nonexistent_element"]
+        start_time = time.time()
+        loop_results = [loop.search(target) for target in targets]
+        loop_time = time.time() - start_time
+        start_time = time.time()
+        packed_results = [packed.search(target) for target in targets]
+        packed_time = time.time() - start_time
+        print(f"loop engine: {loop_time:.6f}s, packed engine: {packed_time:.6f}s")
+        self.assertEqual(packed_results, loop_results)
+        self.assertLess(packed_time, loop_time)
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,107 @@
+"""
+Unit tests for the parallel linear search implementation.
+Tests include performance measurements and correctness verification.
+"""
+
+import unittest
+import random
+import time
+import sys
+import os
+from typing import Callable, Any
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from algorithms.linear_search import LinearSearch
+from algorithms.parallel_linear_search import ParallelLinearSearch
+from dataset.dataset_reader import load_dataset
+
+
+def log_runtime(func: Callable) -> Callable:
+    """
+    Decorator to measure and log the runtime of test methods.
+    
+    Args:
+        func: The test method to measure
+        
+    Returns:
+        Wrapped function that logs runtime information
+    """
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        start_time = time.time()
+        result = func(*args, **kwargs)
+        end_time = time.time()
+        runtime = end_time - start_time
+        print(f"{func.__name__} runtime: {runtime:.6f} seconds \n\n")
+        return result
+    return wrapper
+
+
+class TestParallelLinearSearch(unittest.TestCase):
+    """Test suite for parallel linear search implementation."""
+    
+    def setUp(self) -> None:
+        """
+        Test fixture setup.
+        Loads dataset for parallel linear search testing.
+        """
+        self.dataset = load_dataset('dataset.txt')
+    
+    @log_runtime
+    def test_parallel_linear_search_found(self) -> None:
+        """
+        Test searching for existing elements.
+        Verifies that the search finds each target at its first index.
+        """
+        with ParallelLinearSearch(self.dataset, workers=4) as search:
+            for target in random.sample(self.dataset, 20):
+                result = search.search(target)
+                print(f"Test Parallel Linear Search Found: target={target}, result={result}")
+                self.assertEqual(result, self.dataset.index(target), "Search should return the first index")
+    
+    @log_runtime
+    def test_parallel_linear_search_not_found(self) -> None:
+        """
+        Test searching for non-existent elements.
+        Verifies that missing and over-long targets return -1.
+        """
+        with ParallelLinearSearch(self.dataset, workers=4) as search:
+            for target in ["nonexistent_element", "", self.dataset[0] + "x" * 100]:
+                self.assertEqual(search.search(target), -1, "Search should return -1 for non-existent element")
+    
+    @log_runtime
+    def test_parallel_linear_search_many(self) -> None:
+        """
+        Test one batch pass against per-target sequential scans.
+        Verifies duplicates spanning partitions resolve to their first index.
+        """
+        # every key occurs in two partitions, and batches repeat targets
+        arr = self.dataset[:3000] * 2
+        targets = random.sample(arr, 500) + ["nonexistent_element", arr[-1], arr[0]] * 2
+        sequential = LinearSearch(arr)
+        expected = [sequential.search(target) for target in targets]
+        for workers in (1, 3, 8):
+            with ParallelLinearSearch(arr, workers=workers, chunk_rows=256) as search:
+                self.assertEqual(search.search_many(targets).tolist(), expected)
+                self.assertEqual(search.search_many([]).tolist(), [])
+                self.assertEqual(search.search_many(arr[:1]).tolist(), [0])
+    
+    @log_runtime
+    def test_parallel_linear_search_close(self) -> None:
+        """
+        Test releasing the workers and the shared memory.
+        Verifies close() can be repeated and closed instances reject searches.
+        """
+        search = ParallelLinearSearch(self.dataset[:100], workers=2)
+        self.assertEqual(search.search(self.dataset[5]), 5)
+        search.close()
+        search.close()
+        with self.assertRaises(ValueError):
+            search.search(self.dataset[5])
+        with self.assertRaises(ValueError):
+            ParallelLinearSearch(self.dataset, chunk_rows=0)
+        with ParallelLinearSearch([], workers=2) as empty:
+            self.assertEqual(empty.search("nonexistent_element"), -1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,147 @@
+"""
+Unit tests for the minimal perfect hash search implementation.
+Tests include performance measurements and correctness verification against hash search.
+"""
+
+import unittest
+import random
+import time
+import sys
+import os
+import tempfile
+from typing import Callable, Any
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from algorithms import perfect_hash_search
+from algorithms.hash_search import HashSearch
+from algorithms.perfect_hash_search import PerfectHashSearch
+from dataset.dataset_reader import load_dataset
+
+
+def log_runtime(func: Callable) -> Callable:
+    """
+    Decorator to measure and log the runtime of test methods.
+    
+    Args:
+        func: The test method to measure
+        
+    Returns:
+        Wrapped function that logs runtime information
+    """
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        start_time = time.time()
+        result = func(*args, **kwargs)
+        end_time = time.time()
+        runtime = end_time - start_time
+        print(f"{func.__name__} runtime: {runtime:.6f} seconds \n\n")
+        return result
+    return wrapper
+
+
+class TestPerfectHashSearch(unittest.TestCase):
+    """Test suite for PerfectHashSearch implementation."""
+    
+    def setUp(self) -> None:
+        """
+        Test fixture setup.
+        Loads dataset and builds the perfect hash index.
+        """
+        self.dataset = load_dataset('dataset.txt')
+        self.perfect_hash = PerfectHashSearch(self.dataset)
+    
+    @log_runtime
+    def test_perfect_hash_search_found(self) -> None:
+        """
+        Test searching for existing elements, including the first and last.
+        Verifies that the search correctly finds and returns the proper index.
+        """
+        target = self.dataset[random.randint(0, len(self.dataset) - 1)]
+        result = self.perfect_hash.search(target)
+        print(f"Test Perfect Hash Search Found: target={target}, result={result}")
+        self.assertEqual(self.dataset[result], target, "Found index should contain target")
+        self.assertEqual(self.perfect_hash.search(self.dataset[0]), 0, "Should find first element")
+        self.assertEqual(self.perfect_hash.search(self.dataset[-1]), len(self.dataset) - 1,
+                         "Should find last element")
+    
+    @log_runtime
+    def test_perfect_hash_search_not_found(self) -> None:
+        """
+        Test searching for non-existent elements.
+        Verifies that keys mapped to another key's slot are rejected.
+        """
+        for target in ["nonexistent_element", ""] + [key + "x" for key in random.sample(self.dataset, 500)]:
+            self.assertEqual(self.perfect_hash.search(target), -1, f"Should not find {target!r}")
+        self.assertEqual(PerfectHashSearch([]).search("a"), -1)
+        with self.assertRaises(ValueError):
+            PerfectHashSearch(self.dataset, gamma=0.5)
+    
+    @log_runtime
+    def test_perfect_hash_function(self) -> None:
+        """
+        Test the minimal perfect hash function and its size.
+        Verifies that the distinct keys map to distinct slots 0..n-1 in about 3.5 bits per key.
+        """
+        slots = sorted(self.perfect_hash._slot(key.encode()) for key in self.dataset)
+        self.assertEqual(slots, list(range(len(self.dataset))))
+        print(f"{self.perfect_hash.bits_per_key:.2f} bits per key in {self.perfect_hash.num_levels} levels")
+        self.assertLess(self.perfect_hash.bits_per_key, 4.0)
+        self.assertLess(PerfectHashSearch(self.dataset, gamma=1.0).bits_per_key, self.perfect_hash.bits_per_key)
+    
+    @log_runtime
+    def test_perfect_hash_search_matches_hash_search(self) -> None:
+        """
+        Test scalar and batch lookups, with duplicate keys and the fallback dict.
+        Verifies identical results to HashSearch, which maps duplicates to their last index.
+        """
+        targets = random.sample(self.dataset, 1000) + ["nonexistent_element", "", self.dataset[0] + "x"]
+        expected = HashSearch(self.dataset).search_many(targets).tolist()
+        self.assertEqual([self.perfect_hash.search(target) for target in targets], expected)
+        self.assertEqual(self.perfect_hash.search_many(targets).tolist(), expected)
+        
+        for n in range(40):
+            arr = [random.choice(["", "a", "ab", "é", "a\0"]) + str(random.randint(0, 9)) for _ in range(n)]
+            targets = arr + ["", "a", "zz"]
+            expected = HashSearch(arr).search_many(targets).tolist()
+            for gamma in (1.0, 2.0):
+                perfect_hash = PerfectHashSearch(arr, gamma)
+                self.assertEqual(len(perfect_hash), len(set(arr)))
+                self.assertEqual([perfect_hash.search(target) for target in targets], expected)
+                self.assertEqual(perfect_hash.search_many(targets).tolist(), expected)
+        
+        max_levels = perfect_hash_search.MAX_LEVELS
+        perfect_hash_search.MAX_LEVELS = 1
+        try:
+            perfect_hash = PerfectHashSearch(self.dataset[:1000])
+        finally:
+            perfect_hash_search.MAX_LEVELS = max_levels
+        self.assertLess(perfect_hash.placed, 1000)
+        targets = self.dataset[:1000] + ["nonexistent_element"]
+        self.assertEqual(perfect_hash.search_many(targets).tolist(), list(range(1000)) + [-1])
+        self.assertEqual([perfect_hash.search(target) for target in targets], list(range(1000)) + [-1])
+    
+    @log_runtime
+    def test_perfect_hash_save_load(self) -> None:
+        """
+        Test writing the index to disk and memory-mapping it back.
+        Verifies identical lookups and that corrupted files are rejected.
+        """
+        targets = random.sample(self.dataset, 1000) + ["nonexistent_element"]
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'perfect_hash.bin')
+            self.perfect_hash.save(path)
+            loaded = PerfectHashSearch.load(path)
+            self.assertEqual(loaded.search_many(targets).tolist(), self.perfect_hash.search_many(targets).tolist())
+            self.assertEqual([loaded.search(target) for target in targets[:100]],
+                             [self.perfect_hash.search(target) for target in targets[:100]])
+            
+            with open(path, 'r+b') as file:
+                file.seek(-1, os.SEEK_END)
+                last = file.read(1)
+                file.seek(-1, os.SEEK_END)
+                file.write(bytes([last[0] ^ 1]))
+            with self.assertRaises(ValueError):
+                PerfectHashSearch.load(path)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,127 @@
+"""
+Unit tests for the prefix-array search implementation.
+Tests include performance measurements and correctness verification against binary search.
+"""
+
+import unittest
+import random
+import time
+import sys
+import os
+from typing import Callable, Any
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from algorithms.binary_search import BinarySearch
+from algorithms.prefix_search import PrefixSearch
+from algorithms.string_store import StringStore
+from dataset.dataset_reader import load_dataset
+
+
+def log_runtime(func: Callable) -> Callable:
+    """
+    Decorator to measure and log the runtime of test methods.
+    
+    Args:
+        func: The test method to measure
+        
+    Returns:
+        Wrapped function that logs runtime information
+    """
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        start_time = time.time()
+        result = func(*args, **kwargs)
+        end_time = time.time()
+        runtime = end_time - start_time
+        print(f"{func.__name__} runtime: {runtime:.6f} seconds \n\n")
+        return result
+    return wrapper
+
+
+class TestPrefixSearch(unittest.TestCase):
+    """Test suite for prefix-array search implementation."""
+    
+    def setUp(self) -> None:
+        """
+        Test fixture setup.
+        Loads sorted dataset and builds the prefix index.
+        """
+        self.dataset = load_dataset('sorted_dataset.txt')
+        self.prefix_search = PrefixSearch(self.dataset)
+    
+    @log_runtime
+    def test_prefix_search_found(self) -> None:
+        """
+        Test searching for an existing element.
+        Verifies that the search correctly finds and returns the proper index.
+        """
+        target = self.dataset[random.randint(0, len(self.dataset) - 1)]
+        result = self.prefix_search.search(target)
+        print(f"Test Prefix Search Found: target={target}, result={result}")
+        self.assertEqual(self.dataset[result], target, "Found index should contain target")
+        self.assertEqual(self.prefix_search.search(self.dataset[0]), 0, "Should find first element")
+        self.assertEqual(self.prefix_search.search(self.dataset[-1]), len(self.dataset) - 1,
+                         "Should find last element")
+    
+    @log_runtime
+    def test_prefix_search_not_found(self) -> None:
+        """
+        Test searching for non-existent elements, including ones sharing a full prefix with keys.
+        Verifies that the search correctly returns -1 for missing elements.
+        """
+        for target in ("nonexistent_element", "", "~", self.dataset[0][:-1], self.dataset[-1] + "x",
+                       self.dataset[100][:16]):
+            self.assertEqual(self.prefix_search.search(target), -1, f"Should not find {target!r}")
+        self.assertEqual(PrefixSearch([]).search("a"), -1)
+        self.assertEqual(PrefixSearch([]).search_many(["a"]).tolist(), [-1])
+    
+    @log_runtime
+    def test_prefix_search_shared_prefixes(self) -> None:
+        """
+        Test keys that tie on their 16-byte prefix, are prefixes of each other, or are empty.
+        Verifies agreement with the leftmost index for scalar and batch lookups.
+        """
+        stems = ["", "abcdefghijklmnop", "abcdefghijklmnopq", "é" * 8, "short"]
+        for n in range(60):
+            arr = sorted(random.choice(stems) + random.choice(["", "0", "1", "10"]) for _ in range(n))
+            prefix_search = PrefixSearch(arr)
+            targets = arr + stems + ["abcdefghijklmnop2", "abcdefghijklmnopq\0", "zzz"]
+            expected = [arr.index(target) if target in arr else -1 for target in targets]
+            self.assertEqual([prefix_search.search(target) for target in targets], expected)
+            self.assertEqual(prefix_search.search_many(targets).tolist(), expected)
+    
+    @log_runtime
+    def test_prefix_search_many(self) -> None:
+        """
+        Test vectorized batch lookups.
+        Verifies that search_many agrees with search and with BinarySearch.search_many.
+        """
+        targets = random.sample(self.dataset, 2000) + [key + "x" for key in self.dataset[:200]]
+        targets += [key[:-1] for key in self.dataset[:200]] + ["nonexistent_element", ""]
+        results = self.prefix_search.search_many(targets)
+        self.assertEqual(results.tolist(), [self.prefix_search.search(target) for target in targets])
+        self.assertEqual(results.tolist(), BinarySearch(self.dataset).search_many(targets).tolist())
+    
+    @log_runtime
+    def test_string_store(self) -> None:
+        """
+        Test the offsets + blob string store.
+        Verifies round-tripping, rebuilding from raw buffers and the memory saving.
+        """
+        store = self.prefix_search.store
+        self.assertEqual(len(store), len(self.dataset))
+        self.assertEqual(list(store), self.dataset)
+        self.assertEqual(store[-1], self.dataset[-1])
+        with self.assertRaises(IndexError):
+            store[len(self.dataset)]
+        
+        rebuilt = StringStore(offsets=bytes(store.offsets), blob=bytes(store.blob))
+        self.assertEqual(rebuilt[123], self.dataset[123])
+        self.assertEqual(list(StringStore(["", "é", "ab"])), ["", "é", "ab"])
+        
+        object_bytes = sum(sys.getsizeof(key) + 8 for key in self.dataset)
+        print(f"prefix index: {self.prefix_search.nbytes} bytes, list of str: {object_bytes} bytes")
+        self.assertLess(self.prefix_search.nbytes, object_bytes)
+
+if __name__ == '__main__':
+    unittest.main()
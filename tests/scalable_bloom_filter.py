@@ -0,0 +1,118 @@
+"""
+Unit tests for the scalable Bloom filter implementation.
+Tests include performance measurements and correctness verification as the filter grows.
+"""
+
+import unittest
+import random
+import time
+import sys
+import os
+from typing import Callable, Any
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from algorithms.scalable_bloom_filter import ScalableBloomFilter
+from dataset.dataset_reader import load_dataset
+
+
+def log_runtime(func: Callable) -> Callable:
+    """
+    Decorator to measure and log the runtime of test methods.
+    
+    Args:
+        func: The test method to measure
+        
+    Returns:
+        Wrapped function that logs runtime information
+    """
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        start_time = time.time()
+        result = func(*args, **kwargs)
+        end_time = time.time()
+        runtime = end_time - start_time
+        print(f"{func.__name__} runtime: {runtime:.6f} seconds \n\n")
+        return result
+    return wrapper
+
+
+class TestScalableBloomFilter(unittest.TestCase):
+    """Test suite for scalable Bloom filter implementation."""
+    
+    def setUp(self) -> None:
+        """
+        Test fixture setup.
+        Loads dataset and initializes a ScalableBloomFilter sized for a fraction of it.
+        """
+        self.dataset = load_dataset('dataset.txt')
+        self.scalable_filter = ScalableBloomFilter(self.dataset, initial_capacity=1000,
+                                                   false_positive_rate=0.01)
+    
+    @log_runtime
+    def test_scalable_bloom_filter_found(self) -> None:
+        """
+        Test searching for existing elements.
+        Verifies that there are no false negatives in any slice.
+        """
+        target = self.dataset[random.randint(0, len(self.dataset) - 1)]
+        result = self.scalable_filter.search(target)
+        print(f"Test Scalable Bloom Filter Found: target={target}, result={result}")
+        self.assertEqual(result, 1, "Filter should indicate potential match for existing element")
+        for item in self.dataset:
+            self.assertEqual(self.scalable_filter.search(item), 1, f"False negative for {item}")
+    
+    @log_runtime
+    def test_scalable_bloom_filter_not_found(self) -> None:
+        """
+        Test searching for a non-existent element.
+        Verifies that the filter correctly identifies definite non-matches.
+        """
+        result = self.scalable_filter.search("nonexistent_element")
+        self.assertEqual(result, -1, "Filter should indicate definite non-match")
+    
+    @log_runtime
+    def test_scalable_bloom_filter_growth(self) -> None:
+        """
+        Test that slices are added as items arrive.
+        Verifies slice capacities, error rates, and that the one-at-a-time and bulk paths agree.
+        """
+        slices = self.scalable_filter.slices
+        print(f"slices={len(slices)}, nbytes={self.scalable_filter.nbytes}")
+        self.assertEqual(len(self.scalable_filter), len(self.dataset))
+        self.assertGreaterEqual(self.scalable_filter.capacity, len(self.dataset))
+        self.assertGreater(len(slices), 1, "Filter should have grown past its first slice")
+        for previous, current in zip(slices, slices[1:]):
+            self.assertEqual(previous.count, previous.capacity, "Full slices should be exactly full")
+            self.assertEqual(current.capacity, previous.capacity * 2)
+            self.assertLess(current.false_positive_rate, previous.false_positive_rate)
+        self.assertEqual(self.scalable_filter.nbytes,
+                         sum(bloom_filter.bit_array.nbytes for bloom_filter in slices))
+        
+        incremental = ScalableBloomFilter([], initial_capacity=1000, false_positive_rate=0.01)
+        for item in self.dataset:
+            incremental.add(item)
+        self.assertEqual(len(incremental.slices), len(slices))
+        for expected, actual in zip(slices, incremental.slices):
+            self.assertEqual(bytes(actual.bit_array.bits), bytes(expected.bit_array.bits))
+        
+        with self.assertRaises(ValueError):
+            ScalableBloomFilter([], tightening_ratio=1.0)
+    
+    @log_runtime
+    def test_scalable_bloom_filter_false_positive_rate(self) -> None:
+        """
+        Test the compound false-positive rate after growing well past the first slice.
+        Verifies that the measured and expected rates stay below the overall target.
+        """
+        targets = [f"definitely_not_inserted_{i}" for i in range(20000)]
+        results = self.scalable_filter.search_many(targets)
+        self.assertEqual(results.tolist()[:2000], [self.scalable_filter.search(target) for target in targets[:2000]])
+        
+        false_positive_rate = (results == 1).mean()
+        expected_rate = self.scalable_filter.expected_false_positive_rate
+        print(f"False positive rate: {false_positive_rate:.4f}, expected: {expected_rate:.4f}")
+        self.assertLess(expected_rate, 0.01, "Expected rate should stay below the target")
+        self.assertLess(false_positive_rate, 0.01 * 1.5, "Measured rate should stay near the target")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,143 @@
+"""
+Unit tests for the scalable Cuckoo filter implementation.
+Tests include performance measurements and correctness verification as the filter grows.
+"""
+
+import unittest
+import time
+import sys
+import os
+from typing import Callable, Any
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from algorithms.scalable_cuckoo_filter import ScalableCuckooFilter
+from dataset.dataset_reader import load_dataset
+
+
+def log_runtime(func: Callable) -> Callable:
+    """
+    Decorator to measure and log the runtime of test methods.
+    
+    Args:
+        func: The test method to measure
+        
+    Returns:
+        Wrapped function that logs runtime information
+    """
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        start_time = time.time()
+        result = func(*args, **kwargs)
+        end_time = time.time()
+        runtime = end_time - start_time
+        print(f"{func.__name__} runtime: {runtime:.6f} seconds \n\n")
+        return result
+    return wrapper
+
+
+class TestScalableCuckooFilter(unittest.TestCase):
+    """Test suite for scalable Cuckoo filter implementation."""
+    
+    def setUp(self) -> None:
+        """
+        Test fixture setup.
+        Initializes a small scalable Cuckoo filter and loads dataset.
+        """
+        self.filter = ScalableCuckooFilter(initial_capacity=1000)
+        self.dataset = load_dataset('dataset.txt')
+    
+    @log_runtime
+    def test_grows_instead_of_failing(self) -> None:
+        """
+        Test inserting far more items than the initial capacity.
+        Verifies that every insert succeeds, nothing is lost, and sub-filters are added.
+        """
+        items = self.dataset[:10000]
+        for item in items:
+            self.assertTrue(self.filter.insert(item), f"Failed to insert item: {item}")
+        
+        filters = self.filter.filters
+        print(f"sub-filters={len(filters)}, load_factor={self.filter.load_factor:.3f}, nbytes={self.filter.nbytes}")
+        self.assertEqual(len(self.filter), len(items))
+        self.assertGreater(len(filters), 1, "Filter should have grown past its first sub-filter")
+        for previous, current in zip(filters, filters[1:]):
+            self.assertEqual(current.capacity, previous.capacity * 2)
+            self.assertEqual(current.fingerprint_size, previous.fingerprint_size + 1)
+            self.assertLessEqual(previous.load_factor, self.filter.fill_ratio + 1e-9)
+        for item in items:
+            self.assertEqual(self.filter.search(item), 1, f"False negative for {item}")
+        self.assertEqual(self.filter.search("nonexistent_element"), -1)
+    
+    @log_runtime
+    def test_bulk_build(self) -> None:
+        """
+        Test the bulk insertion path.
+        Verifies that bulk building fills the same sub-filters and agrees with search.
+        """
+        items = self.dataset[:10000]
+        bulk = ScalableCuckooFilter.from_iterable(items, initial_capacity=1000)
+        self.assertEqual(len(bulk), len(items))
+        self.assertEqual([f.capacity for f in bulk.filters][:2], [1000, 2000])
+        
+        targets = items[:2000] + [f"missing_{i}" for i in range(5000)]
+        results = bulk.search_many(targets)
+        self.assertEqual(results.tolist(), [bulk.search(target) for target in targets])
+        self.assertTrue((results[:2000] == 1).all(), "Bulk-built filter should have no false negatives")
+        false_positive_rate = (results[2000:] == 1).mean()
+        print(f"False positive rate: {false_positive_rate:.4f}")
+        self.assertLess(false_positive_rate, 0.05)
+    
+    @log_runtime
+    def test_bulk_build_carries_unstored_items(self) -> None:
+        """
+        Test bulk insertion when sub-filters fill up through failed kicks.
+        Verifies that items a sub-filter could not store reach the next one, so none is lost.
+        """
+        cuckoo_filter = ScalableCuckooFilter(initial_capacity=1000, fill_ratio=0.99, max_kicks=5)
+        items = self.dataset[:20000]
+        self.assertEqual(cuckoo_filter.insert_many(items).tolist(), [])
+        self.assertEqual(len(cuckoo_filter), len(items))
+        self.assertEqual(cuckoo_filter.search_many(items).tolist(), [1] * len(items))
+    
+    @log_runtime
+    def test_delete(self) -> None:
+        """
+        Test deleting items spread over several sub-filters.
+        Verifies that deleted items disappear while the others are still found, apart from
+        the rare items whose fingerprint collided with a deleted one in another sub-filter:
+        the colliding entry is removed in the item's place, so the other item is lost, or
+        its own delete later fails.
+        """
+        cuckoo_filter = ScalableCuckooFilter(initial_capacity=1000, fingerprint_size=16)
+        items = self.dataset[:5000]
+        cuckoo_filter.insert_many(items)
+        failed = sum(not cuckoo_filter.delete(item) for item in items[::2])
+        self.assertEqual(len(cuckoo_filter), len(items) - len(items[::2]) + failed)
+        
+        lost = sum(cuckoo_filter.search(item) == -1 for item in items[1::2])
+        print(f"Failed deletes and items lost to cross-filter fingerprint collisions: {failed}, {lost}")
+        self.assertLess(failed + lost, len(items) * 0.002)
+        self.assertFalse(cuckoo_filter.delete("nonexistent_element"))
+    
+    @log_runtime
+    def test_max_memory(self) -> None:
+        """
+        Test the memory limit.
+        Verifies that growth stops at max_memory and inserts then report the filter full.
+        """
+        limited = ScalableCuckooFilter(initial_capacity=1000, max_memory=4096)
+        unstored = set(limited.insert_many(self.dataset[:10000]).tolist())
+        stored = [item for index, item in enumerate(self.dataset[:10000]) if index not in unstored]
+        print(f"stored={len(stored)}, nbytes={limited.nbytes}")
+        self.assertLess(len(stored), 10000)
+        self.assertEqual(len(stored), len(limited))
+        self.assertLessEqual(limited.nbytes, 4096)
+        self.assertFalse(limited.insert(self.dataset[10000]))
+        for item in stored:
+            self.assertEqual(limited.search(item), 1, f"False negative for {item}")
+        
+        with self.assertRaises(ValueError):
+            ScalableCuckooFilter(initial_capacity=1000, max_memory=100)
+
+if __name__ == '__main__':
+    unittest.main()